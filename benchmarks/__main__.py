@@ -0,0 +1,99 @@
+# Library Imports
+import os
+import sys
+import json
+import shutil
+import argparse
+from typing import Optional
+
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+def needsDisplay() -> bool:
+    return sys.platform.startswith("linux") and not os.environ.get("DISPLAY") and not os.environ.get("WAYLAND_DISPLAY")
+
+def reexecUnderXvfb(argv: list[str]):
+    # wx needs a display; without one, the run is repeated inside a virtual X framebuffer.
+    xvfb = shutil.which("xvfb-run")
+    if xvfb is None:
+        sys.exit("No display is available and xvfb-run was not found; install Xvfb or set DISPLAY.")
+    os.execv(xvfb, [xvfb, "-a", "-s", "-screen 0 1280x1024x24", sys.executable, "-m", "benchmarks", *argv])
+
+def loadBaseline(path: str) -> Optional[dict[str, float]]:
+    try:
+        with open(path) as file:
+            return json.load(file)["results"]
+    except FileNotFoundError:
+        return None
+
+def saveBaseline(path: str, results: dict[str, tuple[float, str]]):
+    import wx
+    import platform
+    data = {
+        "python": platform.python_version(),
+        "wx": wx.__version__,
+        "machine": platform.platform(),
+        "results": {name: value for name, (value, _) in results.items()},
+    }
+    with open(path, "w") as file:
+        json.dump(data, file, indent=2, sort_keys=True)
+        file.write("\n")
+
+def report(results: dict[str, tuple[float, str]], baseline: Optional[dict[str, float]], threshold: float) -> list[str]:
+    regressions = []
+    print(f"{'benchmark':40}{'current':>16}{'baseline':>16}{'change':>10}")
+    for name, (value, unit) in results.items():
+        previous = None if baseline is None else baseline.get(name)
+        if previous is None or previous == 0:
+            print(f"{name:40}{value:>13.2f} {unit:2}{'-':>16}{'-':>10}")
+            continue
+        change = (value - previous) / previous * 100
+        mark = ""
+        if change > threshold:
+            regressions.append(name)
+            mark = " !"
+        print(f"{name:40}{value:>13.2f} {unit:2}{previous:>13.2f} {unit:2}{change:>+9.1f}%{mark}")
+    return regressions
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Runs the benchmark suite and compares it against a stored baseline.")
+    parser.add_argument("names", nargs="*", help="benchmarks to run (build, assign, sync, artprovider, memory, import); all by default")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline file (default: %(default)s)")
+    parser.add_argument("--save", action="store_true", help="store the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=10.0, help="percentage above the baseline reported as a regression (default: %(default)s)")
+    parser.add_argument("--no-xvfb", action="store_true", help="do not start a virtual X framebuffer when no display is set")
+    args = parser.parse_args(argv)
+
+    if needsDisplay() and not args.no_xvfb:
+        reexecUnderXvfb(argv)
+
+    import wx
+    from .suite import BENCHMARKS
+
+    unknown = set(args.names) - {name for name, _ in BENCHMARKS}
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    app = wx.App()
+    results: dict[str, tuple[float, str]] = {}
+    for name, func in BENCHMARKS:
+        if not args.names or name in args.names:
+            results.update(func())
+    app.Destroy()
+
+    baseline = loadBaseline(args.baseline)
+    regressions = report(results, baseline, args.threshold)
+    if args.save:
+        if baseline is not None:
+            # Results of benchmarks that were not run are kept.
+            results = {**{name: (value, "") for name, value in baseline.items()}, **results}
+        saveBaseline(args.baseline, results)
+        print(f"baseline saved to {args.baseline}")
+        return 0
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) regressed by more than {args.threshold:g}%: {', '.join(regressions)}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
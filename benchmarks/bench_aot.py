@@ -0,0 +1,79 @@
+# Library Imports
+import wx
+import os
+import sys
+import time
+import shutil
+
+# Internal Imports
+from pyappframework import ui
+from pyappframework.ui import controls as ctl
+from pyappframework.ui import compiler
+from pyappframework.ui.aot import _loader, generatedPath
+
+
+class Form(ui.Window):
+    def rows(self) -> int:
+        return 100
+
+    def row(self, n: int) -> ctl.Panel:
+        return (
+            ctl.Panel(wx.BoxSizer(wx.HORIZONTAL))
+                .sizer(flag=wx.EXPAND)
+                .body [[
+                    ctl.StaticText(label=f"Field {n}")
+                        .sizer(flag=wx.ALIGN_CENTER_VERTICAL | wx.ALL, border=2),
+                    ctl.Gauge(range=100, value=n % 100)
+                        .sizer(proportion=1, flag=wx.EXPAND | wx.ALL, border=2),
+                    ctl.Button(label="Reset")
+                        .sizer(flag=wx.ALL, border=2),
+                ]]
+        )
+
+    def body(self) -> ctl.Panel:
+        return (
+            ctl.Panel(wx.BoxSizer(wx.VERTICAL))
+            .body [[
+                [self.row(n) for n in range(self.rows())],
+            ]]
+        )
+
+class Form500(Form):
+    def rows(self) -> int:
+        return 500
+
+class Form1000(Form):
+    def rows(self) -> int:
+        return 1000
+
+def buildCost(cls: type, compiled: bool, number: int = 3) -> float:
+    _loader.enabled = compiled
+    try:
+        best = float("inf")
+        for _ in range(number):
+            start = time.perf_counter()
+            window = cls()
+            best = min(best, time.perf_counter() - start)
+            window.Destroy()
+            wx.Yield()
+    finally:
+        _loader.enabled = True
+    return best
+
+def main():
+    app = wx.App()
+    path, skipped = compiler.compileModule(sys.modules[__name__])
+    assert path is not None and not skipped, skipped
+    try:
+        print(f"{'rows':>8}{'declarative':>16}{'compiled':>14}{'speedup':>10}")
+        for cls in (Form, Form500, Form1000):
+            declarative = buildCost(cls, False)
+            compiled = buildCost(cls, True)
+            print(f"{cls.rows(None):>8}{declarative * 1e3:>13.2f} ms{compiled * 1e3:>11.2f} ms{declarative / compiled:>9.2f}x")
+    finally:
+        shutil.rmtree(os.path.dirname(generatedPath(__file__)))
+    print("(each row holds a panel and 3 controls; the time is that of constructing the window)")
+    app.Destroy()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# Library Imports
+import wx
+import time
+
+# Internal Imports
+from pyappframework import ui
+from pyappframework.ui import controls as ctl
+from pyappframework.ui.build import _build
+
+
+class FormWindow(ui.Window):
+    def __init__(self, rows: int):
+        self.rows = rows
+        super().__init__()
+
+    def row(self, n: int) -> ctl.Panel:
+        return (
+            ctl.Panel(wx.BoxSizer(wx.HORIZONTAL))
+                .sizer(flag=wx.EXPAND)
+                .body [[
+                    ctl.StaticText(label=f"Field {n}")
+                        .sizer(flag=wx.ALIGN_CENTER_VERTICAL | wx.ALL, border=2),
+                    ctl.Gauge(range=100, value=n % 100)
+                        .sizer(proportion=1, flag=wx.EXPAND | wx.ALL, border=2),
+                    ctl.Button(label="Reset")
+                        .sizer(flag=wx.ALL, border=2),
+                ]]
+        )
+
+    def body(self) -> ctl.Panel:
+        return (
+            ctl.Panel(wx.BoxSizer(wx.VERTICAL))
+            .body [[
+                [self.row(n) for n in range(self.rows)],
+            ]]
+        )
+
+def buildCost(rows: int, deferred: bool, number: int = 3) -> float:
+    _build.enabled = deferred
+    try:
+        elapsed = 0.0
+        for _ in range(number):
+            start = time.perf_counter()
+            window = FormWindow(rows)
+            window.Show()
+            wx.Yield()
+            elapsed += time.perf_counter() - start
+            window.Destroy()
+    finally:
+        _build.enabled = True
+    return elapsed / number
+
+def main():
+    app = wx.App()
+    print(f"{'rows':>8}{'immediate':>14}{'deferred':>14}{'speedup':>10}")
+    for rows in (100, 500, 1000):
+        immediate = buildCost(rows, False)
+        deferred = buildCost(rows, True)
+        print(f"{rows:>8}{immediate * 1e3:>11.2f} ms{deferred * 1e3:>11.2f} ms{immediate / deferred:>9.2f}x")
+    print("(each row holds 3 controls; the time includes showing the window and handling the resulting events)")
+    app.Destroy()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# Library Imports
+import wx
+import time
+import numpy as np
+
+# Internal Imports
+from pyappframework import ui
+
+
+def timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+def scroll(model: ui.ColumnarModel, rows: int, pages: int = 200, visible: int = 40) -> float:
+    # Jumps to random pages, asking for every cell of the visible rows as the control would.
+    starts = np.random.default_rng(1).integers(0, max(model.GetCount() - visible, 1), pages)
+    def run():
+        for start in starts:
+            for row in range(start, start + visible):
+                for col in range(model.GetColumnCount()):
+                    model.GetValueByRow(int(row), col)
+    return timed(run) / pages
+
+def main():
+    app = wx.App()
+    print(f"{'rows':>10}{'create':>12}{'page':>12}{'sort':>12}{'resort':>12}{'filter':>12}{'sorted page':>14}")
+    for rows in (100000, 1000000, 5000000):
+        rng = np.random.default_rng(0)
+        columns = {
+            "id": np.arange(rows),
+            "price": rng.random(rows) * 1000,
+            "quantity": rng.integers(0, 10000, rows),
+        }
+        model = None
+        def create():
+            nonlocal model
+            model = ui.ColumnarModel(columns, formats={"price": "%.2f"})
+        create_ = timed(create)
+        assert model is not None
+        page = scroll(model, rows)
+        sort = timed(lambda: model.sort("price"))
+        resort = timed(lambda: model.sort("price", ascending=False))
+        filter_ = timed(lambda: model.filter(columns["quantity"] < 5000))
+        sortedPage = scroll(model, rows)
+        print(f"{rows:>10}{create_ * 1e3:>9.2f} ms{page * 1e3:>9.2f} ms{sort * 1e3:>9.2f} ms{resort * 1e3:>9.2f} ms"
+              f"{filter_ * 1e3:>9.2f} ms{sortedPage * 1e3:>11.2f} ms")
+    print("(page: formatting 40 rows at a random position; resort reuses the argsort of the column)")
+    app.Destroy()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+# Library Imports
+import os
+import sys
+import subprocess
+
+
+# Cold start of a small tool window: the framework, the window class and three controls.
+STATEMENT = "import pyappframework; from pyappframework import ui; from pyappframework.ui import controls as ctl; ctl.Panel, ctl.StaticText, ctl.Button, ui.Window"
+# Time spent in the framework's own modules, in milliseconds; wx itself is not counted.
+BUDGET = 25.0
+# Modules a window that does not use them must not load.
+HEAVY = ("wx.html2", "wx.dataview", "wx.svg", "wx.lib.scrolledpanel", "matplotlib", "OpenGL")
+
+def importTimes(statement: str) -> dict[str, tuple[int, int]]:
+    # Self and cumulative microseconds of every module imported by the statement, from -X importtime.
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="")
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True, env=env, check=True)
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = (int(own), int(cumulative))
+    return times
+
+def measure(statement: str = STATEMENT, repeat: int = 5) -> tuple[float, float, list[str]]:
+    # The fastest of several runs, so the file system cache is warm and only the imports are measured.
+    best = None
+    for _ in range(repeat):
+        times = importTimes(statement)
+        framework = sum(own for name, (own, _) in times.items() if name.split(".")[0] == "pyappframework") / 1e3
+        total = sum(own for own, _ in times.values()) / 1e3
+        if best is None or framework < best[0]:
+            best = (framework, total, [name for name in times if name.startswith(HEAVY)])
+    assert best is not None
+    return best
+
+def main() -> int:
+    framework, total, heavy = measure()
+    print(f"{'framework modules':24}{framework:>10.2f} ms (budget {BUDGET:g} ms)")
+    print(f"{'all modules':24}{total:>10.2f} ms")
+    print(f"{'heavy modules loaded':24}{', '.join(heavy) if heavy else 'none':>10}")
+    print("(import time of a window with a panel, a label and a button, from python -X importtime)")
+    return 1 if framework > BUDGET or heavy else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
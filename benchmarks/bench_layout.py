@@ -0,0 +1,70 @@
+# Library Imports
+import wx
+import time
+
+# Internal Imports
+import pyappframework as pyaf
+from pyappframework import ui
+from pyappframework.ui import controls as ctl
+
+
+class RowsWindow(ui.Window):
+    def __init__(self, rows: int):
+        self.visible = [pyaf.Mutable[bool](True) for _ in range(rows)]
+        super().__init__()
+
+    def row(self, n: int, visible: pyaf.Mutable[bool]) -> ctl.Panel:
+        return (
+            ctl.Panel(wx.BoxSizer(wx.HORIZONTAL))
+                .sizer(flag=wx.EXPAND)
+                .visible(visible)
+                .body [[
+                    ctl.StaticText(label=f"Row {n}")
+                        .sizer(flag=wx.ALL, border=2),
+                    ctl.Gauge(range=100, value=n % 100)
+                        .sizer(proportion=1, flag=wx.EXPAND | wx.ALL, border=2),
+                ]]
+        )
+
+    def body(self) -> ctl.Panel:
+        return (
+            ctl.Panel(wx.BoxSizer(wx.VERTICAL))
+            .body [[
+                [self.row(n, visible) for n, visible in enumerate(self.visible)],
+            ]]
+        )
+
+def toggleCost(window: RowsWindow, scheduled: bool, number: int = 5) -> tuple[float, int, int]:
+    scheduler = ui.layoutScheduler
+    scheduler.enabled = scheduled
+    scheduler.reset()
+    try:
+        elapsed = 0.0
+        for n in range(number):
+            start = time.perf_counter()
+            for visible in window.visible:
+                visible.value = n % 2 == 1
+            scheduler.flush()
+            wx.Yield()
+            elapsed += time.perf_counter() - start
+    finally:
+        scheduler.enabled = True
+    return elapsed / number, scheduler.layouts, scheduler.coalesced
+
+def main():
+    app = wx.App()
+    print(f"{'rows':>8}{'synchronous':>16}{'layouts':>10}{'scheduled':>14}{'layouts':>10}{'coalesced':>11}{'speedup':>10}")
+    for rows in (100, 500, 1000):
+        window = RowsWindow(rows)
+        window.Show()
+        wx.Yield()
+        synchronous, immediateLayouts, _ = toggleCost(window, False)
+        scheduled, scheduledLayouts, coalesced = toggleCost(window, True)
+        print(f"{rows:>8}{synchronous * 1e3:>13.2f} ms{immediateLayouts:>10}{scheduled * 1e3:>11.2f} ms"
+              f"{scheduledLayouts:>10}{coalesced:>11}{synchronous / scheduled:>9.2f}x")
+        window.Destroy()
+    print("(time to hide or show every row of the window once, including the layout pass)")
+    app.Destroy()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# Library Imports
+import wx
+import time
+
+# Internal Imports
+import pyappframework as pyaf
+from pyappframework import ui
+from pyappframework.ui import controls as ctl
+
+
+class Lists(ui.Window):
+    def __init__(self, count: int, *args, **kw):
+        self.rebuilt = pyaf.Mutable[list[int]](list(range(count)))
+        self.incremental = pyaf.MutableList[int](range(count))
+        self.virtual = pyaf.MutableList[int](range(count))
+        super().__init__(*args, **kw)
+
+    def body(self) -> ctl.Panel:
+        return (
+            ctl.Panel(wx.BoxSizer(wx.VERTICAL))
+            .body [[
+                ctl.ListBox(items=self.rebuilt)
+                    .sizer(proportion=1, flag=wx.EXPAND),
+                ctl.ListBox(items=self.incremental)
+                    .sizer(proportion=1, flag=wx.EXPAND),
+                ctl.VirtualListBox(self.virtual)
+                    .sizer(proportion=1, flag=wx.EXPAND),
+            ]]
+        )
+
+def timed(func, number: int) -> float:
+    start = time.perf_counter()
+    for n in range(number):
+        func(n)
+    return (time.perf_counter() - start) / number
+
+def main():
+    app = wx.App()
+    print(f"{'items':>8}{'rebuild':>14}{'delta':>14}{'virtual':>14}")
+    for count in (1000, 10000, 100000):
+        window = Lists(count)
+        def rebuild(n: int):
+            values = list(window.rebuilt.value)
+            values.insert(n, -n)
+            values[n + 1] = n
+            window.rebuilt.value = values
+        def delta(n: int):
+            with pyaf.batch():
+                window.incremental.insert(n, -n)
+                window.incremental[n + 1] = n
+        def virtual(n: int):
+            with pyaf.batch():
+                window.virtual.insert(n, -n)
+                window.virtual[n + 1] = n
+        number = max(10, 100000 // count)
+        rebuilt = timed(rebuild, number)
+        incremental = timed(delta, number)
+        virtualized = timed(virtual, number)
+        window.Destroy()
+        wx.Yield()
+        print(f"{count:>8}{rebuilt * 1e3:>11.3f} ms{incremental * 1e3:>11.3f} ms{virtualized * 1e3:>11.3f} ms")
+    print("(each update inserts one item and changes the next; rebuild assigns a new list to a Mutable)")
+    app.Destroy()
+
+if __name__ == "__main__":
+    main()
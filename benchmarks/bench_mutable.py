@@ -0,0 +1,70 @@
+# Library Imports
+import wx
+import gc
+import timeit
+import tracemalloc
+from typing import Callable
+
+# Internal Imports
+from pyappframework.mutable import Mutable, MutationEvent, EVT_MUTATION, IDGenerator
+
+
+class LegacyMutable:
+    # The EvtHandler-based implementation Mutable used to have, kept for comparison.
+    def __init__(self, val):
+        self.rawValue = val
+        self.evtId = next(IDGenerator)
+        self.evtBinder = wx.PyEventBinder(EVT_MUTATION, 1)
+        self.evtHandler = wx.EvtHandler()
+
+    def addListener(self, func):
+        self.evtBinder.Bind(self.evtHandler, self.evtId, wx.ID_ANY, func)
+        evt = MutationEvent(self.evtId, self.rawValue, self.rawValue)
+        self.evtHandler.ProcessEvent(evt)
+
+    @property
+    def value(self):
+        return self.rawValue
+
+    @value.setter
+    def value(self, val):
+        evt = MutationEvent(self.evtId, self.rawValue, val)
+        self.rawValue = val
+        self.evtHandler.ProcessEvent(evt)
+
+def _listener(evt: wx.Event):
+    evt.Skip()
+
+def assignmentCost(factory: Callable, listeners: int, number: int = 100000) -> float:
+    m = factory(0)
+    for _ in range(listeners):
+        m.addListener(_listener)
+    def assign():
+        m.value = 1
+    return min(timeit.repeat(assign, number=number, repeat=5)) / number
+
+def bytesPerInstance(factory: Callable, count: int = 20000) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [factory(n) for n in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del instances
+    return (after - before) / count
+
+def main():
+    app = wx.App()
+    print(f"{'':24}{'legacy':>14}{'current':>14}")
+    for listeners in (0, 1, 10):
+        legacy = assignmentCost(LegacyMutable, listeners)
+        current = assignmentCost(Mutable, listeners)
+        print(f"{f'assign, {listeners} listeners':24}{legacy * 1e9:>11.0f} ns{current * 1e9:>11.0f} ns")
+    legacy = bytesPerInstance(LegacyMutable)
+    current = bytesPerInstance(Mutable)
+    print(f"{'bytes per Mutable':24}{legacy:>14.0f}{current:>14.0f}")
+    print("(legacy bytes exclude the native wxEvtHandler allocated outside the Python allocator)")
+    app.Destroy()
+
+if __name__ == "__main__":
+    main()
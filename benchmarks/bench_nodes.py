@@ -0,0 +1,48 @@
+# Library Imports
+import wx
+import gc
+import time
+import tracemalloc
+
+# Internal Imports
+from pyappframework.ui import controls as ctl
+
+
+def describe(count: int) -> ctl.Panel:
+    # A typical large description: most nodes only use their sizer attribute.
+    return (
+        ctl.Panel(wx.BoxSizer(wx.VERTICAL))
+        .body [[
+            [
+                ctl.StaticText(label=f"Label {n}")
+                    .sizer(flag=wx.EXPAND)
+                for n in range(count)
+            ],
+        ]]
+    )
+
+def nodeCost(count: int) -> tuple[float, float, float]:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tree = describe(count)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    size = sum(stat.size_diff for stat in stats)
+    blocks = sum(stat.count_diff for stat in stats)
+    del tree
+    start = time.perf_counter()
+    describe(count)
+    elapsed = time.perf_counter() - start
+    return size / count, blocks / count, elapsed / count
+
+def main():
+    print(f"{'nodes':>8}{'bytes/node':>14}{'allocs/node':>14}{'time/node':>14}")
+    for count in (1000, 10000, 50000):
+        size, blocks, elapsed = nodeCost(count)
+        print(f"{count:>8}{size:>14.0f}{blocks:>14.1f}{elapsed * 1e6:>11.2f} us")
+    print("(memory held by the view descriptions alone, before any wx window is created)")
+
+if __name__ == "__main__":
+    main()
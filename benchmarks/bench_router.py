@@ -0,0 +1,59 @@
+# Library Imports
+import wx
+import time
+
+# Internal Imports
+from pyappframework import ui
+from pyappframework.ui import controls as ctl
+
+
+class ButtonsWindow(ui.Window):
+    def __init__(self, buttons: int, routed: bool):
+        self.buttons = buttons
+        self.eventRouting = routed
+        self.clicks = 0
+        super().__init__()
+
+    def onClick(self, evt: wx.CommandEvent):
+        self.clicks += 1
+
+    def body(self) -> ctl.Panel:
+        return (
+            ctl.Panel(wx.BoxSizer(wx.VERTICAL))
+            .body [[
+                [
+                    ctl.Button(label=f"Button {n}")
+                        .sizer()
+                        .export(f"button{n}")
+                        .eventHandler(wx.EVT_BUTTON, self.onClick)
+                    for n in range(self.buttons)
+                ],
+            ]]
+        )
+
+def dispatchCost(buttons: int, routed: bool, number: int = 2000) -> float:
+    window = ButtonsWindow(buttons, routed)
+    # The first button was bound first, so without routing its entry is the last one the root finds.
+    button = window.button0
+    evt = wx.CommandEvent(wx.wxEVT_BUTTON, button.GetId())
+    evt.SetEventObject(button)
+    start = time.perf_counter()
+    for _ in range(number):
+        button.ProcessWindowEvent(evt)
+    elapsed = time.perf_counter() - start
+    assert window.clicks == number
+    window.Destroy()
+    return elapsed / number
+
+def main():
+    app = wx.App()
+    print(f"{'buttons':>8}{'root.Bind':>14}{'routed':>14}{'speedup':>10}")
+    for buttons in (10, 1000, 5000):
+        bound = dispatchCost(buttons, False)
+        routed = dispatchCost(buttons, True)
+        print(f"{buttons:>8}{bound * 1e6:>11.2f} us{routed * 1e6:>11.2f} us{bound / routed:>9.2f}x")
+    print("(time for one button event to reach its handler through the root window)")
+    app.Destroy()
+
+if __name__ == "__main__":
+    main()
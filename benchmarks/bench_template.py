@@ -0,0 +1,55 @@
+# Library Imports
+import wx
+import gc
+import time
+
+# Internal Imports
+import pyappframework as pyaf
+from pyappframework import ui
+from pyappframework.ui import controls as ctl
+
+
+@ui.template
+def card(title: pyaf.Mutable[str], progress: pyaf.Mutable[int], onClick) -> ctl.Panel:
+    return (
+        ctl.Panel(wx.BoxSizer(wx.HORIZONTAL))
+            .sizer(flag=wx.EXPAND)
+            .body [[
+                ctl.StaticText(label=title)
+                    .sizer(flag=wx.ALL, border=2),
+                ctl.Gauge(range=100, value=progress)
+                    .sizer(proportion=1, flag=wx.EXPAND),
+                ctl.Button(label="Open")
+                    .sizer()
+                    .eventHandler(wx.EVT_BUTTON, lambda evt: onClick(title.value)),
+            ]]
+    )
+
+def instantiationCost(factory, count: int, repeat: int = 3) -> float:
+    titles = [pyaf.Mutable[str](f"Card {n}") for n in range(count)]
+    progress = [pyaf.Mutable[int](n % 100) for n in range(count)]
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            cards = [factory(title, value, print) for title, value in zip(titles, progress)]
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+        del cards
+    return best / count
+
+def main():
+    app = wx.App()
+    print(f"{'cards':>8}{'from scratch':>16}{'template':>14}{'speedup':>10}")
+    for count in (1000, 10000):
+        scratch = instantiationCost(card.__wrapped__, count)
+        replay = instantiationCost(card, count)
+        print(f"{count:>8}{scratch * 1e6:>13.2f} us{replay * 1e6:>11.2f} us{scratch / replay:>9.2f}x")
+    print("(time to create the description of one card with 4 views; building the widgets is not included)")
+    app.Destroy()
+
+if __name__ == "__main__":
+    main()
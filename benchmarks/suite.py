@@ -0,0 +1,162 @@
+# Library Imports
+import wx
+import gc
+import os
+import time
+import timeit
+import tracemalloc
+from typing import Callable, Optional
+
+# Internal Imports
+import pyappframework as pyaf
+from pyappframework import ui
+from pyappframework.ui import controls as ctl
+
+
+# Every measurement is a cost: lower is better.
+Measurement = tuple[float, str]
+BENCHMARKS: list[tuple[str, Callable[[], dict[str, Measurement]]]] = []
+
+def benchmark(name: str):
+    def decorator(func: Callable[[], dict[str, Measurement]]):
+        BENCHMARKS.append((name, func))
+        return func
+    return decorator
+
+class GeneratedWindow(ui.Window):
+    def __init__(self, controls: int):
+        self.controls = controls
+        super().__init__()
+
+    def body(self) -> ctl.Panel:
+        # Rows of a label and a gauge, as a form would have them.
+        return (
+            ctl.Panel(wx.BoxSizer(wx.VERTICAL))
+            .body [[
+                [
+                    ctl.Panel(wx.BoxSizer(wx.HORIZONTAL))
+                        .sizer(flag=wx.EXPAND)
+                        .body [[
+                            ctl.StaticText(label=f"Field {n}")
+                                .sizer(flag=wx.ALL, border=2),
+                            ctl.Gauge(range=100, value=n % 100)
+                                .sizer(proportion=1, flag=wx.EXPAND),
+                        ]]
+                    for n in range(self.controls // 3)
+                ],
+            ]]
+        )
+
+def bestOf(func: Callable[[], None], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def _build(controls: int):
+    GeneratedWindow(controls).Destroy()
+    wx.Yield()
+
+@benchmark("build")
+def buildTime() -> dict[str, Measurement]:
+    return {
+        f"build/{controls}": (bestOf(lambda: _build(controls), repeat) * 1e3, "ms")
+        for controls, repeat in ((100, 10), (1000, 5), (10000, 2))
+    }
+
+def _listener(evt: wx.Event):
+    evt.Skip()
+
+@benchmark("assign")
+def assignmentThroughput() -> dict[str, Measurement]:
+    results = {}
+    for listeners in (0, 1, 10):
+        m = pyaf.Mutable[int](0)
+        for _ in range(listeners):
+            m.addListener(_listener)
+        def assign():
+            m.value = 1
+            m.value = 0
+        number = 50000
+        results[f"assign/{listeners}-listeners"] = (min(timeit.repeat(assign, number=number, repeat=5)) / (number * 2) * 1e9, "ns")
+    return results
+
+@benchmark("sync")
+def syncRoundTrip() -> dict[str, Measurement]:
+    # A value assigned to the Mutable reaches the control through syncTo(), whose change event brings it
+    # back through syncFrom().
+    frame = wx.Frame(None)
+    tc = wx.TextCtrl(frame)
+    m = pyaf.Mutable[str]("")
+    tc.Bind(wx.EVT_TEXT, m.syncFrom(tc.GetValue))
+    m.syncTo(tc.SetValue)
+    values = [f"value {n}" for n in range(2000)]
+    def roundTrip():
+        for value in values:
+            m.value = value
+    elapsed = bestOf(roundTrip, 5)
+    assert tc.GetValue() == values[-1]
+    frame.Destroy()
+    return {"sync/round-trip": (elapsed / len(values) * 1e6, "us")}
+
+class _ArtProvider(ui.SVGArtProvider):
+    def getIconPath(self, name: str) -> str:
+        icontype, iconname = name.split("_", 1)
+        return os.path.join(os.path.dirname(__file__), "..", "test", "resources", "icons_fontawesome", icontype, f"{iconname}.svg")
+
+@benchmark("artprovider")
+def createBitmapCost() -> dict[str, Measurement]:
+    # The provider is called directly, so wx.ArtProvider's bitmap cache is not involved.
+    provider = _ArtProvider()
+    artid = ui.ArtID("solid_image", (0, 0, 0))
+    results = {}
+    for size in (16, 64):
+        number = 50
+        elapsed = bestOf(lambda: [provider.CreateBitmap(artid, wx.ART_TOOLBAR, wx.Size(size, size)) for _ in range(number)], 3)
+        results[f"artprovider/CreateBitmap-{size}px"] = (elapsed / number * 1e6, "us")
+    return results
+
+def _rss() -> Optional[int]:
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+@benchmark("memory")
+def memoryPerControl() -> dict[str, Measurement]:
+    controls = 3000
+    results = {}
+    # RSS also counts native widget memory, which tracemalloc does not see; it is measured first, without
+    # tracemalloc's own bookkeeping.
+    gc.collect()
+    rss = _rss()
+    window = GeneratedWindow(controls)
+    gc.collect()
+    grown = _rss()
+    if rss is not None and grown is not None:
+        results["memory/rss-per-control"] = ((grown - rss) / controls, "B")
+    window.Destroy()
+    wx.Yield()
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    window = GeneratedWindow(controls)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    results["memory/python-bytes-per-control"] = (sum(stat.size_diff for stat in stats) / controls, "B")
+    results["memory/allocations-per-control"] = (sum(stat.count_diff for stat in stats) / controls, "")
+    window.Destroy()
+    wx.Yield()
+    return results
+
+@benchmark("import")
+def importTime() -> dict[str, Measurement]:
+    from .bench_import import measure
+    framework, total, _ = measure()
+    return {"import/framework": (framework, "ms"), "import/all-modules": (total, "ms")}
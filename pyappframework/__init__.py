@@ -1,5 +1,13 @@
 __version__ = "0.0.dev0"
 
-from .mutable import Mutable, MutationEvent, EVT_MUTATION, MutableValue, valueof
+import importlib
+
+from .mutable import Mutable, Computed, MutationEvent, EVT_MUTATION, MutableValue, valueof, batch, identical, equal, SyncPolicy, Debounce, Throttle
+from .mutablecollections import MutableList, MutableDict, ListChange, DictChange, ListMutationEvent, DictMutationEvent
 from .decorators import chainable, event_handler
-from . import ui
+
+# The ui and tasks packages are only imported once they are used.
+def __getattr__(name: str):
+    if name in ("tasks", "ui", "aio"):
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
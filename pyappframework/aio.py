@@ -0,0 +1,246 @@
+# Library Imports
+import wx
+import sys
+import asyncio
+import selectors
+import threading
+import math
+from typing import TypeVar, Generic, Callable, Coroutine, Any, Optional
+
+# Internal Imports
+from .mutable import Mutable, _NOTHING
+
+
+class _WxSelector(selectors.BaseSelector):
+    # Everything is delegated to the real selector, except that the loop's own select never blocks:
+    # waiting for I/O is done by the watcher thread of WxEventLoop instead.
+    def __init__(self, selector: selectors.BaseSelector):
+        self.selector = selector
+
+    def register(self, fileobj, events, data=None):
+        return self.selector.register(fileobj, events, data)
+
+    def unregister(self, fileobj):
+        return self.selector.unregister(fileobj)
+
+    def modify(self, fileobj, events, data=None):
+        return self.selector.modify(fileobj, events, data)
+
+    def select(self, timeout=None):
+        return self.selector.select(0)
+
+    def close(self):
+        self.selector.close()
+
+    def get_key(self, fileobj):
+        return self.selector.get_key(fileobj)
+
+    def get_map(self):
+        return self.selector.get_map()
+
+# WxEventLoop drives the loop through these private parts of asyncio, so it refuses to start on a Python
+# whose asyncio no longer has them rather than fail in the middle of an iteration.
+_PRIVATE_LOOP_API = ("_run_once", "_ready", "_scheduled", "_write_to_self", "_add_reader", "_add_writer", "_remove_reader", "_remove_writer")
+
+def _missingPrivateApi(loop: asyncio.AbstractEventLoop) -> list[str]:
+    missing = [name for name in _PRIVATE_LOOP_API if not hasattr(loop, name)]
+    if not hasattr(asyncio.events, "_set_running_loop"):
+        missing.append("events._set_running_loop")
+    return missing
+
+class WxEventLoop(asyncio.SelectorEventLoop):
+    # An asyncio loop that is driven by the wx main loop rather than run_forever().
+    # A watcher thread blocks in select() and posts one iteration to the main thread when I/O is ready,
+    # then waits until that iteration has run; timers are served by a single wx.CallLater. Nothing runs
+    # while the loop is idle. Adding or removing a reader or writer wakes the watcher so that it selects
+    # on the new set of file descriptors.
+    def __init__(self):
+        self.__watching = False
+        self.__selector = _WxSelector(selectors.DefaultSelector())
+        self.__processing = False
+        self.__scheduled = False
+        self.__closing = False
+        self.__timer: Optional[wx.CallLater] = None
+        self.__processed = threading.Event()
+        self.__processed.set()
+        super().__init__(self.__selector)
+        missing = _missingPrivateApi(self)
+        if missing:
+            super().close()
+            version = ".".join(map(str, sys.version_info[:3]))
+            raise RuntimeError(f"WxEventLoop is not supported on Python {version}: asyncio has no {', '.join(missing)}")
+        self._thread_id = threading.get_ident()
+        self.__watcher = threading.Thread(target=self.__watch, name="WxEventLoop", daemon=True)
+        self.__watcher.start()
+        self.__watching = True
+
+    def run_forever(self):
+        raise RuntimeError("WxEventLoop is driven by the wx main loop")
+
+    def call_soon(self, callback, *args, context=None):
+        handle = super().call_soon(callback, *args, context=context)
+        self.__wakeup()
+        return handle
+
+    def call_at(self, when, callback, *args, context=None):
+        handle = super().call_at(when, callback, *args, context=context)
+        self.__wakeup()
+        return handle
+
+    def _add_reader(self, fd, callback, *args):
+        handle = super()._add_reader(fd, callback, *args)
+        self.__rewatch()
+        return handle
+
+    def _add_writer(self, fd, callback, *args):
+        handle = super()._add_writer(fd, callback, *args)
+        self.__rewatch()
+        return handle
+
+    def _remove_reader(self, fd):
+        removed = super()._remove_reader(fd)
+        self.__rewatch()
+        return removed
+
+    def _remove_writer(self, fd):
+        removed = super()._remove_writer(fd)
+        self.__rewatch()
+        return removed
+
+    def close(self):
+        if self.is_closed():
+            return
+        self.__closing = True
+        # The watcher may be waiting for an iteration that will never run, once the wx main loop has
+        # exited, so it is released before being waited for.
+        self.__processed.set()
+        self._write_to_self()
+        self.__watcher.join()
+        if self.__timer is not None:
+            self.__timer.Stop()
+        self._thread_id = None
+        super().close()
+
+    def __rewatch(self):
+        # select() is not guaranteed to see registrations made while it blocks, so it is interrupted.
+        if self.__watching and not self.__closing:
+            self._write_to_self()
+
+    def __wakeup(self):
+        if self.__processing or self.__scheduled or self.__closing:
+            return
+        self.__scheduled = True
+        wx.CallAfter(self.__process)
+
+    def __watch(self):
+        while not self.__closing:
+            self.__processed.wait()
+            self.__processed.clear()
+            if self.__closing:
+                break
+            try:
+                self.__selector.selector.select(None)
+            except (OSError, ValueError):
+                if self.__closing:
+                    break
+                raise
+            if self.__closing:
+                break
+            wx.CallAfter(self.__process)
+
+    def __process(self):
+        self.__scheduled = False
+        if self.__processing or self.is_closed():
+            return
+        self.__processing = True
+        asyncio.events._set_running_loop(self)
+        try:
+            self._run_once()
+        finally:
+            asyncio.events._set_running_loop(None)
+            self.__processing = False
+            self.__processed.set()
+        if self._ready:
+            self.__wakeup()
+        elif self._scheduled:
+            delay = max(self._scheduled[0].when() - self.time(), 0)
+            milliseconds = max(math.ceil(delay * 1000), 1)
+            if self.__timer is None:
+                self.__timer = wx.CallLater(milliseconds, self.__process)
+            else:
+                self.__timer.Start(milliseconds)
+
+_loop: Optional[WxEventLoop] = None
+
+def install() -> WxEventLoop:
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = WxEventLoop()
+        asyncio.set_event_loop(_loop)
+    return _loop
+
+def getEventLoop() -> WxEventLoop:
+    return install()
+
+T = TypeVar("T")
+def spawn(coro: Coroutine[Any, Any, T]) -> "asyncio.Task[T]":
+    return getEventLoop().create_task(coro)
+
+E = TypeVar("E", bound=wx.Event)
+def asyncHandler(func: Callable[[E], Coroutine[Any, Any, None]]) -> Callable[[E], None]:
+    # The coroutine starts after the wx handler has returned, so it receives a copy of the event.
+    def handler(evt: E):
+        spawn(func(evt.Clone()))
+    return handler
+
+T = TypeVar("T")
+def changed(mutable: Mutable[T]) -> "asyncio.Future[T]":
+    future = getEventLoop().create_future()
+    def listener(value: T):
+        subscription.dispose()
+        if not future.done():
+            future.set_result(value)
+    subscription = mutable._addListener(listener, False)
+    future.add_done_callback(lambda _: subscription.dispose())
+    return future
+
+T = TypeVar("T")
+class MutableIterator(Generic[T]):
+    # Yields the values a Mutable changes to. Values assigned faster than they are consumed are
+    # coalesced, so each step returns the newest one.
+    def __init__(self, mutable: Mutable[T]):
+        self.__pending = _NOTHING
+        self.__waiter: Optional[asyncio.Future] = None
+        self.__subscription = mutable._addListener(self.__onValue, False)
+
+    def __onValue(self, value: T):
+        self.__pending = value
+        if self.__waiter is not None and not self.__waiter.done():
+            self.__waiter.set_result(None)
+
+    def __aiter__(self) -> "MutableIterator[T]":
+        return self
+
+    async def __anext__(self) -> T:
+        try:
+            while self.__pending is _NOTHING:
+                if not self.__subscription.active:
+                    raise StopAsyncIteration
+                self.__waiter = getEventLoop().create_future()
+                try:
+                    await self.__waiter
+                finally:
+                    self.__waiter = None
+        except asyncio.CancelledError:
+            self.close()
+            raise
+        value, self.__pending = self.__pending, _NOTHING
+        return value
+
+    async def aclose(self):
+        self.close()
+
+    def close(self):
+        self.__subscription.dispose()
+        if self.__waiter is not None and not self.__waiter.done():
+            self.__waiter.set_result(None)
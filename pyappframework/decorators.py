@@ -1,7 +1,8 @@
 # Library Imports
-from typing import Callable, TypeVar
+from typing import Callable, TypeVar, Union, Awaitable
 from typing_extensions import ParamSpec, Concatenate
 import wx
+import inspect
 
 T = TypeVar("T")
 P = ParamSpec("P")
@@ -13,7 +14,13 @@ def chainable(func: Callable[Concatenate[T, P], None]) -> Callable[Concatenate[T
 
 T = TypeVar("T")
 E = TypeVar("E", bound=wx.Event)
-def event_handler(func: Callable[[T, E], None]) -> Callable[[T, E], None]:
+def event_handler(func: Callable[[T, E], Union[None, Awaitable[None]]]) -> Callable[[T, E], None]:
+    if inspect.iscoroutinefunction(func):
+        def func_wrapper(self: T, evt: E) -> None:
+            from .aio import spawn
+            evt.Skip()
+            spawn(func(self, evt.Clone()))
+        return func_wrapper
     def func_wrapper(self: T, evt: E) -> None:
         func(self, evt)
         evt.Skip()
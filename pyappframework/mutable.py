@@ -1,8 +1,15 @@
 # Library Imports
 import wx
-from typing import TypeVar, Generic, Callable, Any, Union
+from typing import TypeVar, Generic, Callable, Any, Union, Optional, Awaitable, AsyncIterator, IO
 import itertools
 import threading
+import contextlib
+import abc
+import types
+import weakref
+import collections
+import json
+import time
 
 # Internal Imports
 
@@ -11,6 +18,14 @@ EVT_MUTATION = wx.NewEventType()
 
 IDGenerator = itertools.count()
 
+_NOTHING = object()
+
+_pendingLock = threading.Lock()
+
+_tracker = None
+
+_tracer = None
+
 T = TypeVar("T")
 class MutationEvent(Generic[T], wx.PyCommandEvent):
     def __init__(self, id: int, oldValue: T, newValue: T):
@@ -32,55 +47,726 @@ SYNC_GETTER_TYPE = Union[Callable[[], T], tuple[object, str]]
 T = TypeVar("T")
 SYNC_SETTER_TYPE = Union[Callable[[T], None], tuple[object, str]]
 
+T = TypeVar("T")
+COMPARATOR_TYPE = Callable[[T, T], bool]
+
+def identical(oldValue: Any, newValue: Any) -> bool:
+    return oldValue is newValue
+
+def equal(oldValue: Any, newValue: Any) -> bool:
+    if oldValue is newValue:
+        return True
+    try:
+        return bool(oldValue == newValue)
+    except (ValueError, TypeError):
+        # Element-wise comparisons such as NumPy arrays cannot be reduced with bool().
+        try:
+            return getattr(oldValue, "shape", None) == getattr(newValue, "shape", None) and bool((oldValue == newValue).all())
+        except (ValueError, TypeError, AttributeError):
+            return False
+
+class _Transaction:
+    __slots__ = ("depth", "pending")
+
+    def __init__(self):
+        self.depth = 0
+        self.pending = {}
+
+    def defer(self, mutable: "Mutable", oldValue: Any, changes: Optional[list] = None):
+        entry = self.pending.get(id(mutable))
+        if entry is None:
+            self.pending[id(mutable)] = (mutable, oldValue, None if changes is None else list(changes))
+        elif changes is not None:
+            entry[2].extend(changes)
+
+    def flush(self):
+        frozen = [window for window in wx.GetTopLevelWindows() if window.IsShown()]
+        for window in frozen:
+            window.Freeze()
+        error: Optional[Exception] = None
+        try:
+            # Listeners may assign other Mutables; those are still deferred and delivered by the next round.
+            # A listener that raises doesn't keep the other changes from being delivered; the first error
+            # is raised once everything pending has been.
+            while self.pending:
+                pending, self.pending = self.pending, {}
+                for mutable, oldValue, changes in pending.values():
+                    try:
+                        newValue = mutable._get()
+                        if changes is not None or mutable._compare is None or not mutable._compare(oldValue, newValue):
+                            mutable._notify(oldValue, newValue, changes)
+                    except Exception as e:
+                        if error is None:
+                            error = e
+        finally:
+            # Nothing is left for the next, unrelated transaction, even when a BaseException got through.
+            self.pending = {}
+            for window in frozen:
+                if window:
+                    window.Thaw()
+        if error is not None:
+            raise error
+
+_transaction = _Transaction()
+
+class batch(contextlib.ContextDecorator):
+    def __enter__(self):
+        _transaction.depth += 1
+        return self
+
+    def __exit__(self, *exc):
+        try:
+            if _transaction.depth == 1 and _transaction.pending:
+                _transaction.flush()
+        finally:
+            _transaction.depth -= 1
+        return False
+
+class SyncScheduler:
+    def __init__(self, func: Callable[[], None]):
+        self._func = func
+        self._timer: Optional[wx.CallLater] = None
+        self._pending = False
+
+    def __call__(self, evt: Optional[wx.Event] = None):
+        self._schedule()
+        if evt is not None:
+            evt.Skip()
+
+    @abc.abstractmethod
+    def _schedule(self):
+        pass
+
+    def flush(self, evt: Optional[wx.Event] = None):
+        if self._timer is not None:
+            self._timer.Stop()
+        if self._pending:
+            self._pending = False
+            self._func()
+        if evt is not None:
+            evt.Skip()
+
+    def cancel(self, evt: Optional[wx.Event] = None):
+        if self._timer is not None:
+            self._timer.Stop()
+        self._pending = False
+        if evt is not None:
+            evt.Skip()
+
+class DebounceScheduler(SyncScheduler):
+    def __init__(self, func: Callable[[], None], delay: int):
+        super().__init__(func)
+        self._delay = delay
+
+    def _schedule(self):
+        self._pending = True
+        if self._timer is None:
+            self._timer = wx.CallLater(self._delay, self.flush)
+        else:
+            self._timer.Start(self._delay)
+
+class ThrottleScheduler(SyncScheduler):
+    def __init__(self, func: Callable[[], None], interval: int):
+        super().__init__(func)
+        self._interval = interval
+
+    def _schedule(self):
+        if self._timer is not None and self._timer.IsRunning():
+            self._pending = True
+            return
+        self._func()
+        if self._timer is None:
+            self._timer = wx.CallLater(self._interval, self._onInterval)
+        else:
+            self._timer.Start(self._interval)
+
+    def _onInterval(self):
+        if self._pending:
+            self._pending = False
+            self._func()
+            self._timer.Start(self._interval)
+
+class SyncPolicy:
+    def __init__(self, flushOnFocusLoss: bool = True):
+        self.flushOnFocusLoss = flushOnFocusLoss
+
+    @abc.abstractmethod
+    def schedule(self, func: Callable[[], None]) -> SyncScheduler:
+        pass
+
+class Debounce(SyncPolicy):
+    def __init__(self, delay: int, flushOnFocusLoss: bool = True):
+        super().__init__(flushOnFocusLoss)
+        self.delay = delay
+
+    def schedule(self, func: Callable[[], None]) -> SyncScheduler:
+        return DebounceScheduler(func, self.delay)
+
+class Throttle(SyncPolicy):
+    FRAME = 16
+
+    def __init__(self, interval: int = FRAME, flushOnFocusLoss: bool = True):
+        super().__init__(flushOnFocusLoss)
+        self.interval = interval
+
+    def schedule(self, func: Callable[[], None]) -> SyncScheduler:
+        return ThrottleScheduler(func, self.interval)
+
+class MutationStats:
+    __slots__ = ("label", "assignments", "suppressed", "notifications", "listenerTime", "maxListenerTime", "slowestListener", "__mutable")
+
+    def __init__(self, mutable: "Mutable", label: str):
+        self.label = label
+        self.assignments = 0
+        self.suppressed = 0
+        self.notifications = 0
+        self.listenerTime = 0.0
+        self.maxListenerTime = 0.0
+        self.slowestListener: Optional[str] = None
+        self.__mutable = weakref.ref(mutable)
+
+    @property
+    def listenerCount(self) -> int:
+        mutable = self.__mutable()
+        return mutable.listenerCount if mutable is not None else 0
+
+    def toDict(self) -> dict:
+        return {
+            "label": self.label,
+            "assignments": self.assignments,
+            "suppressed": self.suppressed,
+            "notifications": self.notifications,
+            "listenerCount": self.listenerCount,
+            "listenerTime": self.listenerTime,
+            "maxListenerTime": self.maxListenerTime,
+            "slowestListener": self.slowestListener,
+        }
+
+class Cascade:
+    # One notification of a Mutable, with the notifications caused by assignments made from its listeners.
+    __slots__ = ("label", "duration", "children")
+
+    def __init__(self, label: str):
+        self.label = label
+        self.duration = 0.0
+        self.children: list[Cascade] = []
+
+    @property
+    def size(self) -> int:
+        return 1 + sum(child.size for child in self.children)
+
+    @property
+    def depth(self) -> int:
+        return 1 + max((child.depth for child in self.children), default=0)
+
+    def toDict(self) -> dict:
+        return {"label": self.label, "duration": self.duration, "children": [child.toDict() for child in self.children]}
+
+class Tracer:
+    # Installed by startTracing(); while no tracer is installed the only cost is one global lookup per
+    # assignment and per notification.
+    # Notifications whose listeners assign other Mutables are kept as Cascade trees, newest last.
+    def __init__(self, maxCascades: int = 1000):
+        self.__stats: dict[int, MutationStats] = {}
+        self.__labels: dict[int, str] = {}
+        self.__stack: list[Cascade] = []
+        self.cascades: collections.deque[Cascade] = collections.deque(maxlen=maxCascades)
+
+    def setLabel(self, mutable: "Mutable", label: str):
+        self.__labels[mutable.evtId] = label
+        stats = self.__stats.get(mutable.evtId)
+        if stats is not None:
+            stats.label = label
+
+    def stats(self, mutable: "Mutable") -> Optional[MutationStats]:
+        return self.__stats.get(mutable.evtId)
+
+    def allStats(self) -> list[MutationStats]:
+        return list(self.__stats.values())
+
+    def top(self, count: int = 10, key: str = "listenerTime") -> list[MutationStats]:
+        return sorted(self.__stats.values(), key=lambda stats: getattr(stats, key), reverse=True)[:count]
+
+    def reset(self):
+        self.__stats.clear()
+        self.cascades.clear()
+
+    def toDict(self) -> dict:
+        return {
+            "mutables": [stats.toDict() for stats in self.__stats.values()],
+            "cascades": [cascade.toDict() for cascade in self.cascades],
+        }
+
+    def export(self, file: Union[str, IO[str]]):
+        if isinstance(file, str):
+            with open(file, "w") as f:
+                json.dump(self.toDict(), f, indent=2)
+        else:
+            json.dump(self.toDict(), file, indent=2)
+
+    def __statsOf(self, mutable: "Mutable") -> MutationStats:
+        stats = self.__stats.get(mutable.evtId)
+        if stats is None:
+            label = self.__labels.get(mutable.evtId, "%s#%d" % (type(mutable).__name__, mutable.evtId))
+            stats = self.__stats[mutable.evtId] = MutationStats(mutable, label)
+        return stats
+
+    def _record(self, mutable: "Mutable", suppressed: bool):
+        stats = self.__statsOf(mutable)
+        stats.assignments += 1
+        if suppressed:
+            stats.suppressed += 1
+
+    def _dispatch(self, mutable: "Mutable", oldValue: Any, newValue: Any, changes: Optional[list]):
+        stats = self.__statsOf(mutable)
+        stats.notifications += 1
+        cascade = Cascade(stats.label)
+        if self.__stack:
+            self.__stack[-1].children.append(cascade)
+        self.__stack.append(cascade)
+        start = time.perf_counter()
+        try:
+            evt = None
+            for func, wantsEvent in mutable._listeners:
+                begin = time.perf_counter()
+                if wantsEvent:
+                    if evt is None:
+                        evt = mutable._createEvent(oldValue, newValue, changes)
+                    func(evt)
+                else:
+                    func(newValue)
+                elapsed = time.perf_counter() - begin
+                stats.listenerTime += elapsed
+                if elapsed > stats.maxListenerTime:
+                    stats.maxListenerTime = elapsed
+                    stats.slowestListener = getattr(func, "__qualname__", repr(func))
+            for computed in mutable._dependents:
+                computed._refresh()
+        finally:
+            cascade.duration = time.perf_counter() - start
+            self.__stack.pop()
+        if not self.__stack and cascade.children:
+            self.cascades.append(cascade)
+
+def startTracing(maxCascades: int = 1000) -> Tracer:
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer(maxCascades)
+    return _tracer
+
+def stopTracing() -> Optional[Tracer]:
+    global _tracer
+    tracer, _tracer = _tracer, None
+    return tracer
+
+def getTracer() -> Optional[Tracer]:
+    return _tracer
+
+@contextlib.contextmanager
+def tracing(maxCascades: int = 1000):
+    installed = _tracer is None
+    tracer = startTracing(maxCascades)
+    try:
+        yield tracer
+    finally:
+        if installed:
+            stopTracing()
+
 T = TypeVar("T")
 class Mutable(Generic[T]):
-    def __init__(self, val: T):
+    # Listeners are kept in an immutable tuple of (callable, wantsEvent) pairs, so notifying never copies
+    # and listeners may be added while a notification is in progress.
+    # Listeners registered through addListener() receive a MutationEvent, which is only created when at
+    # least one of them is present; value listeners (syncTo) are called with the new value directly.
+    # Assignments made off the main thread are parked in _pending and delivered by a single wx.CallAfter;
+    # values replaced before delivery are counted in droppedCount.
+    # With a comparator, assignments it reports as equal to the current value are stored without notifying
+    # and without bumping the version.
+    __slots__ = ("rawValue", "evtId", "droppedCount", "_version", "_compare", "_listeners", "_dependents", "_pending", "__weakref__")
+
+    readOnly = False
+
+    def __init__(self, val: T, compare: Optional[COMPARATOR_TYPE[T]] = None):
         self.rawValue = val
         self.evtId = next(IDGenerator)
-        self.evtBinder = wx.PyEventBinder(EVT_MUTATION, 1)
-        self.evtHandler = wx.EvtHandler()
+        self.droppedCount = 0
+        self._version = 0
+        self._compare = compare
+        self._listeners = ()
+        self._dependents = ()
+        self._pending = _NOTHING
 
-    def addListener(self, func: Callable[[MutationEvent], None]):
-        self.evtBinder.Bind(self.evtHandler, self.evtId, wx.ID_ANY, func)
-        evt = MutationEvent(self.evtId, self.rawValue, self.rawValue)
-        self.evtHandler.ProcessEvent(evt)
+    def _addListener(self, func: Callable, wantsEvent: bool, weak: bool = False, owner: Optional[wx.Window] = None) -> "Subscription":
+        subscription = Subscription(self)
+        if weak:
+            func = _weakCallable(func, subscription.dispose)
+        entry = (func, wantsEvent)
+        subscription._entry = entry
+        self._listeners = self._listeners + (entry,)
+        if owner is not None:
+            owner.Bind(wx.EVT_WINDOW_DESTROY, subscription.dispose, owner)
+        return subscription
+
+    def _removeListener(self, entry: tuple):
+        self._listeners = tuple(listener for listener in self._listeners if listener is not entry)
+
+    def _addDependent(self, computed: "Computed"):
+        self._dependents = self._dependents + (computed,)
+
+    def _removeDependent(self, computed: "Computed"):
+        self._dependents = tuple(c for c in self._dependents if c is not computed)
+
+    @property
+    def listenerCount(self) -> int:
+        return len(self._listeners)
+
+    def _createEvent(self, oldValue: T, newValue: T, changes: Optional[list]) -> MutationEvent:
+        return MutationEvent(self.evtId, oldValue, newValue)
+
+    def _notify(self, oldValue: T, newValue: T, changes: Optional[list] = None):
+        if _tracer is not None:
+            _tracer._dispatch(self, oldValue, newValue, changes)
+            return
+        evt = None
+        for func, wantsEvent in self._listeners:
+            if wantsEvent:
+                if evt is None:
+                    evt = self._createEvent(oldValue, newValue, changes)
+                func(evt)
+            else:
+                func(newValue)
+        for computed in self._dependents:
+            computed._refresh()
+
+    def _invalidate(self):
+        for computed in self._dependents:
+            computed._markDirty()
+
+    def _get(self) -> T:
+        return self.rawValue
+
+    def _read(self):
+        if _tracker is not None:
+            _tracker._collect(self)
+
+    def _same(self, oldValue: T, newValue: T) -> bool:
+        return (self._compare or equal)(oldValue, newValue)
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def addListener(self, func: Callable[[MutationEvent], None], weak: bool = False, owner: Optional[wx.Window] = None) -> "Subscription":
+        subscription = self._addListener(func, True, weak, owner)
+        value = self._get()
+        func(self._createEvent(value, value, []))
+        return subscription
 
     @property
     def value(self) -> T:
+        if _tracker is not None:
+            _tracker._collect(self)
         return self.rawValue
 
     @value.setter
     def value(self, val: T):
-        evt = MutationEvent(self.evtId, self.rawValue, val)
+        if not wx.IsMainThread():
+            self._post(val)
+            return
+        oldValue = self.rawValue
         self.rawValue = val
-        self.evtHandler.ProcessEvent(evt)
+        if self._compare is not None and self._compare(oldValue, val):
+            if _tracer is not None:
+                _tracer._record(self, True)
+            return
+        if _tracer is not None:
+            _tracer._record(self, False)
+        self._version += 1
+        if self._dependents:
+            self._invalidate()
+        if self._listeners or self._dependents:
+            if _transaction.depth:
+                _transaction.defer(self, oldValue)
+            else:
+                self._notify(oldValue, val)
+
+    def _post(self, val: T):
+        with _pendingLock:
+            scheduled = self._pending is not _NOTHING
+            if scheduled:
+                self.droppedCount += 1
+            self._pending = val
+        if not scheduled:
+            wx.CallAfter(self._deliver)
+
+    def _deliver(self):
+        with _pendingLock:
+            val, self._pending = self._pending, _NOTHING
+        if val is not _NOTHING:
+            self.value = val
+
+    @property
+    def hasPendingValue(self) -> bool:
+        return self._pending is not _NOTHING
+
+    def changed(self) -> Awaitable[T]:
+        from .aio import changed
+        return changed(self)
 
-    def syncFrom(self, getter: SYNC_GETTER_TYPE[T]) -> Callable[[wx.Event], None]:
+    def __aiter__(self) -> AsyncIterator[T]:
+        from .aio import MutableIterator
+        return MutableIterator(self)
+
+    def syncFrom(self, getter: SYNC_GETTER_TYPE[T], policy: Optional["SyncPolicy"] = None) -> Callable[[wx.Event], None]:
         def sync_getter():
             if isinstance(getter, tuple):
                 value = getattr(getter[0], getter[1])
             else:
                 value = getter()
-            if self.value != value:
+            if not self._same(self.value, value):
                 self.value = value
+        sync_getter()
+        if policy is not None:
+            return policy.schedule(sync_getter)
         def listener(evt: wx.Event):
             sync_getter()
             evt.Skip()
-        sync_getter()
         return listener
 
-    def syncTo(self, setter: SYNC_SETTER_TYPE[T]):
-        def listener(evt: MutationEvent):
-            if isinstance(setter, tuple):
-                setattr(setter[0], setter[1], evt.newValue)
-            else:
-                setter(evt.newValue)
+    def syncTo(self, setter: SYNC_SETTER_TYPE[T], owner: Optional[wx.Window] = None, weak: bool = False) -> "Subscription":
+        listener = _setterOf(setter)
+        if owner is None:
+            owner = _ownerOf(setter)
+        if weak and isinstance(setter, tuple):
+            subscription = self._addListener(_weakSetattr(setter[0], setter[1], lambda: subscription.dispose()), False, False, owner)
+        else:
+            subscription = self._addListener(listener, False, weak, owner)
+        listener(self._get())
+        return subscription
+
+    def sync(self, getter: SYNC_GETTER_TYPE[T], setter: SYNC_SETTER_TYPE[T], policy: Optional["SyncPolicy"] = None, owner: Optional[wx.Window] = None) -> Callable[[wx.Event], None]:
+        self.syncTo(setter, owner)
+        if self.readOnly:
+            # Edits made in the control cannot be stored, so the control is reverted to the current value.
+            revert = _setterOf(setter)
+            def sync_setter():
+                revert(self._get())
+            if policy is not None:
+                return policy.schedule(sync_setter)
+            def listener(evt: wx.Event):
+                sync_setter()
+                evt.Skip()
+            return listener
+        return self.syncFrom(getter, policy)
+
+T = TypeVar("T")
+class Computed(Generic[T], Mutable[T]):
+    # Dependencies are the Mutables read through .value while the function runs. A change marks every
+    # downstream Computed dirty before any listener runs, so each node recomputes at most once per change,
+    # and only when it is read or observed by a listener or another Computed.
+    # Only an observed Computed is registered with its dependencies, so one that is no longer used isn't
+    # kept alive by them. An unobserved one compares the versions of its dependencies when it is read.
+    __slots__ = ("_func", "_dirty", "_dependencies", "_versions", "_collecting", "_pendingOld")
+
+    readOnly = True
+
+    def __init__(self, func: Callable[[], T], compare: Optional[COMPARATOR_TYPE[T]] = identical):
+        super().__init__(_NOTHING, compare or identical)
+        self._func = func
+        self._dirty = True
+        self._dependencies = ()
+        self._versions = ()
+        self._collecting = None
+        self._pendingOld = _NOTHING
+
+    def _collect(self, mutable: Mutable):
+        self._collecting[id(mutable)] = mutable
+
+    def _observed(self) -> bool:
+        return bool(self._listeners or self._dependents)
+
+    def _stale(self) -> bool:
+        return any(mutable.version != version for mutable, version in zip(self._dependencies, self._versions))
+
+    def _observe(self):
+        if self._dirty or self._stale():
+            self._recompute()
+        else:
+            for mutable in self._dependencies:
+                mutable._addDependent(self)
+
+    def _unobserve(self):
+        for mutable in self._dependencies:
+            mutable._removeDependent(self)
+        self._pendingOld = _NOTHING
+
+    def _addListener(self, func: Callable, wantsEvent: bool, weak: bool = False, owner: Optional[wx.Window] = None) -> "Subscription":
+        observed = self._observed()
+        subscription = super()._addListener(func, wantsEvent, weak, owner)
+        if not observed:
+            self._observe()
+        return subscription
+
+    def _removeListener(self, entry: tuple):
+        super()._removeListener(entry)
+        if not self._observed():
+            self._unobserve()
+
+    def _addDependent(self, computed: "Computed"):
+        observed = self._observed()
+        super()._addDependent(computed)
+        if not observed:
+            self._observe()
+
+    def _removeDependent(self, computed: "Computed"):
+        super()._removeDependent(computed)
+        if not self._observed():
+            self._unobserve()
+
+    def _recompute(self):
+        global _tracker
+        if self._collecting is not None:
+            raise RuntimeError("Computed value depends on itself")
+        self._collecting = {}
+        previous, _tracker = _tracker, self
+        try:
+            value = self._func()
+        finally:
+            _tracker = previous
+            collected, self._collecting = self._collecting, None
+        dependencies = tuple(collected.values())
+        observed = self._observed()
+        for mutable in self._dependencies:
+            if (not observed or id(mutable) not in collected) and self in mutable._dependents:
+                mutable._removeDependent(self)
+        if observed:
+            for mutable in dependencies:
+                if self not in mutable._dependents:
+                    mutable._addDependent(self)
+        else:
+            # Nothing is notified of this change, so a later one must not be compared against the value
+            # from before it.
+            self._pendingOld = _NOTHING
+        self._dependencies = dependencies
+        self._versions = tuple(mutable._version for mutable in dependencies)
+        if self.rawValue is _NOTHING or not self._compare(self.rawValue, value):
+            self.rawValue = value
+            self._version += 1
+        self._dirty = False
+
+    def dispose(self):
+        for mutable in self._dependencies:
+            if self in mutable._dependents:
+                mutable._removeDependent(self)
+        self._dependencies = ()
+        self._versions = ()
+        self._dirty = True
+
+    def _markDirty(self):
+        if not self._dirty:
+            self._dirty = True
+            if self._pendingOld is _NOTHING:
+                self._pendingOld = self.rawValue
+            self._invalidate()
+
+    def _refresh(self):
+        oldValue, self._pendingOld = self._pendingOld, _NOTHING
+        if oldValue is _NOTHING or not (self._listeners or self._dependents):
+            return
+        newValue = self._get()
+        if self._compare(oldValue, newValue):
+            return
+        if _transaction.depth:
+            _transaction.defer(self, oldValue)
+        else:
+            self._notify(oldValue, newValue)
+
+    def _get(self) -> T:
+        if self._dirty or (not self._dependents and not self._listeners and self._stale()):
+            self._recompute()
+        return self.rawValue
+
+    @property
+    def version(self) -> int:
+        self._get()
+        return self._version
+
+    @property
+    def value(self) -> T:
+        if self._dirty or (not self._dependents and not self._listeners and self._stale()):
+            self._recompute()
+        if _tracker is not None:
+            _tracker._collect(self)
+        return self.rawValue
+
+    @value.setter
+    def value(self, val: T):
+        raise AttributeError("Computed value is read-only")
+
+class Subscription:
+    __slots__ = ("__mutable", "_entry")
+
+    def __init__(self, mutable: Mutable):
+        self.__mutable: Optional[Mutable] = mutable
+        self._entry = None
+
+    @property
+    def active(self) -> bool:
+        return self.__mutable is not None
+
+    def dispose(self, evt: Optional[wx.Event] = None):
+        if self.__mutable is not None:
+            self.__mutable._removeListener(self._entry)
+            self.__mutable = None
+        if evt is not None:
             evt.Skip()
-        self.addListener(listener)
 
-    def sync(self, getter: SYNC_GETTER_TYPE[T], setter: SYNC_SETTER_TYPE[T]) -> Callable[[wx.Event], None]:
-        self.syncTo(setter)
-        return self.syncFrom(getter)
+def _weakCallable(func: Callable, onDead: Callable[[], None]) -> Callable:
+    def dead(ref: weakref.ref):
+        onDead()
+    if isinstance(func, types.MethodType):
+        ref = weakref.WeakMethod(func, dead)
+        def call(arg):
+            target = ref()
+            if target is not None:
+                target(arg)
+        return call
+    owner = getattr(func, "__self__", None)
+    if owner is not None and not isinstance(owner, types.ModuleType):
+        # Bound builtins (e.g. wx methods) are created on each attribute access, so the instance is referenced.
+        return _weakSetattr(owner, func.__name__, onDead, True)
+    ref = weakref.ref(func, dead)
+    def call(arg):
+        target = ref()
+        if target is not None:
+            target(arg)
+    return call
+
+def _weakSetattr(obj: object, name: str, onDead: Callable[[], None], isMethod: bool = False) -> Callable:
+    def dead(ref: weakref.ref):
+        onDead()
+    ref = weakref.ref(obj, dead)
+    def call(arg):
+        target = ref()
+        if target is None:
+            return
+        if isMethod:
+            getattr(target, name)(arg)
+        else:
+            setattr(target, name, arg)
+    return call
+
+def _ownerOf(setter: SYNC_SETTER_TYPE) -> Optional[wx.Window]:
+    owner = setter[0] if isinstance(setter, tuple) else getattr(setter, "__self__", None)
+    return owner if isinstance(owner, wx.Window) else None
+
+def _setterOf(setter: SYNC_SETTER_TYPE[T]) -> Callable[[T], None]:
+    if isinstance(setter, tuple):
+        obj, name = setter
+        def func(value: T):
+            setattr(obj, name, value)
+        return func
+    return setter
 
 T = TypeVar("T")
 MutableValue = Union[Mutable[T], T]
@@ -0,0 +1,316 @@
+# Library Imports
+import wx
+from typing import TypeVar, Generic, Iterable, Iterator, Optional, Union, NamedTuple, Any, overload
+from collections.abc import MutableSequence, MutableMapping
+
+# Internal Imports
+from . import mutable
+from .mutable import Mutable, MutationEvent, _transaction, _NOTHING
+
+
+INSERT = "insert"
+REMOVE = "remove"
+REPLACE = "replace"
+MOVE = "move"
+
+class ListChange(NamedTuple):
+    kind: str
+    index: int
+    removed: list
+    inserted: list
+    target: int = -1
+
+class DictChange(NamedTuple):
+    kind: str
+    key: Any
+    oldValue: Any
+    newValue: Any
+
+T = TypeVar("T")
+class ListMutationEvent(Generic[T], MutationEvent[list[T]]):
+    # The old list is only rebuilt, by undoing the changes on a copy of the live list, when oldValue is read;
+    # like the collection itself, it is only meaningful while the event is being dispatched.
+    def __init__(self, id: int, newValue: list[T], changes: list[ListChange]):
+        super().__init__(id, None, newValue)
+        self.__changes = changes
+        self.__oldValue = _NOTHING
+
+    @property
+    def changes(self) -> list[ListChange]:
+        return self.__changes
+
+    @property
+    def oldValue(self) -> list[T]:
+        if self.__oldValue is _NOTHING:
+            value = list(self.newValue)
+            for change in reversed(self.__changes):
+                if change.kind == MOVE:
+                    count = len(change.removed)
+                    del value[change.target:change.target + count]
+                    value[change.index:change.index] = change.removed
+                else:
+                    value[change.index:change.index + len(change.inserted)] = change.removed
+            self.__oldValue = value
+        return self.__oldValue
+
+K, V = (TypeVar("K"), TypeVar("V"))
+class DictMutationEvent(Generic[K, V], MutationEvent[dict[K, V]]):
+    def __init__(self, id: int, newValue: dict[K, V], changes: list[DictChange]):
+        super().__init__(id, None, newValue)
+        self.__changes = changes
+        self.__oldValue = _NOTHING
+
+    @property
+    def changes(self) -> list[DictChange]:
+        return self.__changes
+
+    @property
+    def oldValue(self) -> dict[K, V]:
+        if self.__oldValue is _NOTHING:
+            value = dict(self.newValue)
+            for change in reversed(self.__changes):
+                if change.kind == INSERT:
+                    del value[change.key]
+                else:
+                    value[change.key] = change.oldValue
+            self.__oldValue = value
+        return self.__oldValue
+
+def _checkThread():
+    if not wx.IsMainThread():
+        raise RuntimeError("Mutable collections must be changed on the main thread")
+
+T = TypeVar("T")
+class MutableCollection(Generic[T], Mutable[T]):
+    # Structural changes are reported as lists of change records instead of whole old/new values.
+    # Listeners added with addListener() receive a ListMutationEvent or DictMutationEvent; syncTo()
+    # setters receive the live collection. Mutations must be made on the main thread: unlike Mutable,
+    # a collection is changed in place and cannot be posted, so a change from another thread raises.
+    __slots__ = ()
+
+    def _changed(self, changes: list):
+        _checkThread()
+        if mutable._tracer is not None:
+            mutable._tracer._record(self, False)
+        self._version += 1
+        if self._dependents:
+            self._invalidate()
+        if self._listeners or self._dependents:
+            if _transaction.depth:
+                _transaction.defer(self, None, changes)
+            else:
+                self._notify(None, self.rawValue, changes)
+
+    @property
+    def value(self) -> T:
+        self._read()
+        return self.rawValue
+
+    @value.setter
+    def value(self, val: T):
+        _checkThread()
+        self._reset(val)
+
+    @property
+    def hasPendingValue(self) -> bool:
+        return False
+
+    def _reset(self, val: T):
+        pass
+
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
+
+T = TypeVar("T")
+class MutableList(Generic[T], MutableCollection[list[T]], MutableSequence[T]):
+    __slots__ = ()
+
+    def __init__(self, val: Iterable[T] = ()):
+        super().__init__(list(val))
+
+    def _createEvent(self, oldValue: Any, newValue: list[T], changes: Optional[list]) -> MutationEvent:
+        return ListMutationEvent(self.evtId, newValue, changes or [])
+
+    def _reset(self, val: Iterable[T]):
+        removed, self.rawValue = self.rawValue, list(val)
+        self._changed([ListChange(REPLACE, 0, removed, list(self.rawValue))])
+
+    def __len__(self) -> int:
+        self._read()
+        return len(self.rawValue)
+
+    def __iter__(self) -> Iterator[T]:
+        self._read()
+        return iter(self.rawValue)
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+    def __getitem__(self, index):
+        self._read()
+        return self.rawValue[index]
+
+    def __setitem__(self, index: Union[int, slice], value: Any):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self.rawValue))
+            if step != 1:
+                items = list(self.rawValue)
+                items[index] = value
+                self._reset(items)
+                return
+            self.splice(start, max(stop - start, 0), value)
+            return
+        index = self.__normalize(index)
+        removed = self.rawValue[index]
+        self.rawValue[index] = value
+        self._changed([ListChange(REPLACE, index, [removed], [value])])
+
+    def __delitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self.rawValue))
+            if step != 1:
+                items = list(self.rawValue)
+                del items[index]
+                self._reset(items)
+                return
+            self.splice(start, max(stop - start, 0))
+            return
+        index = self.__normalize(index)
+        removed = self.rawValue.pop(index)
+        self._changed([ListChange(REMOVE, index, [removed], [])])
+
+    def insert(self, index: int, value: T):
+        index = self.__clamp(index)
+        self.rawValue.insert(index, value)
+        self._changed([ListChange(INSERT, index, [], [value])])
+
+    def append(self, value: T):
+        self.rawValue.append(value)
+        self._changed([ListChange(INSERT, len(self.rawValue) - 1, [], [value])])
+
+    def extend(self, values: Iterable[T]):
+        self.splice(len(self.rawValue), 0, values)
+
+    def __iadd__(self, values: Iterable[T]):
+        self.extend(values)
+        return self
+
+    def pop(self, index: int = -1) -> T:
+        index = self.__normalize(index)
+        removed = self.rawValue.pop(index)
+        self._changed([ListChange(REMOVE, index, [removed], [])])
+        return removed
+
+    def clear(self):
+        if self.rawValue:
+            self.splice(0, len(self.rawValue))
+
+    def splice(self, index: int, deleteCount: int, values: Iterable[T] = ()) -> list[T]:
+        inserted = list(values)
+        index = self.__clamp(index)
+        removed = self.rawValue[index:index + max(deleteCount, 0)]
+        if not removed and not inserted:
+            return removed
+        self.rawValue[index:index + len(removed)] = inserted
+        kind = REPLACE if removed and inserted else (REMOVE if removed else INSERT)
+        self._changed([ListChange(kind, index, removed, inserted)])
+        return removed
+
+    def move(self, index: int, target: int, count: int = 1):
+        # target is the index of the first moved item once the move is complete.
+        if index < 0:
+            index += len(self.rawValue)
+        if count < 0 or index < 0 or index + count > len(self.rawValue) or not 0 <= target <= len(self.rawValue) - count:
+            raise IndexError("MutableList move out of range")
+        if count == 0 or index == target:
+            return
+        items = self.rawValue[index:index + count]
+        del self.rawValue[index:index + count]
+        self.rawValue[target:target] = items
+        self._changed([ListChange(MOVE, index, items, items, target)])
+
+    def sort(self, *args, **kw):
+        items = list(self.rawValue)
+        items.sort(*args, **kw)
+        self._reset(items)
+
+    def reverse(self):
+        self._reset(reversed(self.rawValue))
+
+    def __clamp(self, index: int) -> int:
+        # Like list.insert and slices, out of range indices are moved to the nearest end.
+        return min(max(index + len(self.rawValue) if index < 0 else index, 0), len(self.rawValue))
+
+    def __normalize(self, index: int) -> int:
+        if index < 0:
+            index += len(self.rawValue)
+        if not 0 <= index < len(self.rawValue):
+            raise IndexError("MutableList index out of range")
+        return index
+
+    def __repr__(self) -> str:
+        return f"MutableList({self.rawValue!r})"
+
+K, V = (TypeVar("K"), TypeVar("V"))
+class MutableDict(Generic[K, V], MutableCollection[dict[K, V]], MutableMapping[K, V]):
+    __slots__ = ()
+
+    def __init__(self, val: Any = (), **kw: V):
+        super().__init__(dict(val, **kw))
+
+    def _createEvent(self, oldValue: Any, newValue: dict[K, V], changes: Optional[list]) -> MutationEvent:
+        return DictMutationEvent(self.evtId, newValue, changes or [])
+
+    def _reset(self, val: Any):
+        old, new = self.rawValue, dict(val)
+        self.rawValue = new
+        changes = [DictChange(REMOVE, key, value, _NOTHING) for key, value in old.items() if key not in new]
+        for key, value in new.items():
+            if key not in old:
+                changes.append(DictChange(INSERT, key, _NOTHING, value))
+            elif old[key] is not value:
+                changes.append(DictChange(REPLACE, key, old[key], value))
+        if changes:
+            self._changed(changes)
+
+    def __len__(self) -> int:
+        self._read()
+        return len(self.rawValue)
+
+    def __iter__(self) -> Iterator[K]:
+        self._read()
+        return iter(self.rawValue)
+
+    def __contains__(self, key: object) -> bool:
+        self._read()
+        return key in self.rawValue
+
+    def __getitem__(self, key: K) -> V:
+        self._read()
+        return self.rawValue[key]
+
+    def __setitem__(self, key: K, value: V):
+        old = self.rawValue.get(key, _NOTHING)
+        self.rawValue[key] = value
+        self._changed([DictChange(INSERT if old is _NOTHING else REPLACE, key, old, value)])
+
+    def __delitem__(self, key: K):
+        old = self.rawValue.pop(key)
+        self._changed([DictChange(REMOVE, key, old, _NOTHING)])
+
+    def update(self, *args, **kw):
+        changes = []
+        for key, value in dict(*args, **kw).items():
+            old = self.rawValue.get(key, _NOTHING)
+            self.rawValue[key] = value
+            changes.append(DictChange(INSERT if old is _NOTHING else REPLACE, key, old, value))
+        if changes:
+            self._changed(changes)
+
+    def clear(self):
+        if self.rawValue:
+            self._reset({})
+
+    def __repr__(self) -> str:
+        return f"MutableDict({self.rawValue!r})"
@@ -0,0 +1,195 @@
+# Library Imports
+import wx
+import threading
+import itertools
+import logging
+import concurrent.futures as cf
+from typing import TypeVar, Generic, Callable, Optional, Hashable
+
+# Internal Imports
+from .mutable import Mutable
+
+_logger = logging.getLogger(__name__)
+
+class TaskCancelled(Exception):
+    pass
+
+T = TypeVar("T")
+class Task(Generic[T]):
+    def __init__(self, id: int, result: Optional[Mutable[T]], progress: Optional[Mutable[int]], error: Optional[Mutable[Optional[BaseException]]], owner: Optional[wx.Window], key: Optional[Hashable]):
+        self.id = id
+        self.result = result
+        self.progress = progress
+        self.error = error
+        self.owner = owner
+        self.key = key
+        self.func: Optional[Callable] = None
+        self.future: Optional[cf.Future] = None
+        self.flags: Optional[_CancelFlags] = None
+        self.__cancelled = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.__cancelled.is_set()
+
+    def done(self) -> bool:
+        return self.future is not None and self.future.done()
+
+    def cancel(self, evt: Optional[wx.Event] = None):
+        self.__cancelled.set()
+        if self.flags is not None:
+            self.flags.set(self.id)
+        if self.future is not None:
+            self.future.cancel()
+        if evt is not None:
+            evt.Skip()
+
+class ThreadProgress:
+    def __init__(self, task: Task):
+        self.__task = task
+
+    def __call__(self, value: int):
+        if self.__task.cancelled:
+            raise TaskCancelled
+        assert self.__task.progress is not None
+        self.__task.progress.value = value
+
+    @property
+    def cancelled(self) -> bool:
+        return self.__task.cancelled
+
+class _CancelFlags:
+    # Cancellations shared with the worker processes. A task is cancelled when its slot holds its id;
+    # ids are never reused, so a slot taken over by a later task can only hide a cancellation, in which
+    # case the task runs to the end and its outcome is discarded as before.
+    def __init__(self, size: int = 1024):
+        import multiprocessing
+        self.__slots = multiprocessing.RawArray("q", [-1] * size)
+
+    def set(self, taskId: int):
+        self.__slots[taskId % len(self.__slots)] = taskId
+
+    def isSet(self, taskId: int) -> bool:
+        return self.__slots[taskId % len(self.__slots)] == taskId
+
+_progressQueue = None
+_cancelFlags: Optional[_CancelFlags] = None
+
+def _initializeWorker(queue, flags: _CancelFlags):
+    global _progressQueue, _cancelFlags
+    _progressQueue = queue
+    _cancelFlags = flags
+
+class ProcessProgress:
+    def __init__(self, taskId: int):
+        self.__taskId = taskId
+
+    def __call__(self, value: int):
+        if self.cancelled:
+            raise TaskCancelled
+        assert _progressQueue is not None
+        _progressQueue.put((self.__taskId, value))
+
+    @property
+    def cancelled(self) -> bool:
+        assert _cancelFlags is not None
+        return _cancelFlags.isSet(self.__taskId)
+
+class TaskExecutor:
+    # Runs work on a thread or process pool and writes the outcome into Mutables on the main thread.
+    # A submission supersedes any earlier one with the same key (by default its result Mutable): the
+    # earlier task is cancelled and whatever it produces is discarded. The progress callable raises
+    # TaskCancelled once the task is cancelled, in worker processes too. An exception raised by a task
+    # submitted without an error Mutable is logged to the "pyappframework.tasks" logger with the task.
+    def __init__(self, backend: str = "thread", maxWorkers: Optional[int] = None):
+        assert backend in ("thread", "process")
+        self.__backend = backend
+        self.__ids = itertools.count()
+        self.__tasks: dict[int, Task] = {}
+        self.__latest: dict[Hashable, Task] = {}
+        self.__queue = None
+        self.__flags = None
+        self.__drain = None
+        if backend == "thread":
+            self.__executor = cf.ThreadPoolExecutor(maxWorkers)
+        else:
+            import multiprocessing
+            self.__queue = multiprocessing.Queue()
+            self.__flags = _CancelFlags()
+            self.__executor = cf.ProcessPoolExecutor(maxWorkers, initializer=_initializeWorker, initargs=(self.__queue, self.__flags))
+            self.__drain = threading.Thread(target=self.__drainProgress, name="TaskExecutorProgress", daemon=True)
+            self.__drain.start()
+
+    def submit(self, func: Callable[..., T], *args, result: Optional[Mutable[T]] = None, progress: Optional[Mutable[int]] = None, error: Optional[Mutable[Optional[BaseException]]] = None, owner: Optional[wx.Window] = None, key: Optional[Hashable] = None, **kw) -> Task[T]:
+        if key is None:
+            key = result
+        task = Task[T](next(self.__ids), result, progress, error, owner, key)
+        task.func = func
+        task.flags = self.__flags
+        if key is not None:
+            previous = self.__latest.get(key)
+            if previous is not None:
+                previous.cancel()
+            self.__latest[key] = task
+        if progress is not None:
+            kw["progress"] = ThreadProgress(task) if self.__backend == "thread" else ProcessProgress(task.id)
+        self.__tasks[task.id] = task
+        if owner is not None:
+            owner.Bind(wx.EVT_WINDOW_DESTROY, task.cancel, owner)
+        task.future = self.__executor.submit(func, *args, **kw)
+        task.future.add_done_callback(lambda _: wx.CallAfter(self.__deliver, task))
+        return task
+
+    def cancelAll(self):
+        for task in list(self.__tasks.values()):
+            task.cancel()
+
+    def shutdown(self, wait: bool = True):
+        self.cancelAll()
+        self.__executor.shutdown(wait)
+        if self.__queue is not None:
+            self.__queue.put(None)
+
+    def __deliver(self, task: Task):
+        self.__tasks.pop(task.id, None)
+        if task.key is not None and self.__latest.get(task.key) is task:
+            del self.__latest[task.key]
+        if task.owner:
+            task.owner.Unbind(wx.EVT_WINDOW_DESTROY, task.owner, handler=task.cancel)
+        assert task.future is not None
+        if task.cancelled or task.future.cancelled():
+            return
+        exception = task.future.exception()
+        if isinstance(exception, TaskCancelled):
+            return
+        if exception is not None:
+            if task.error is None:
+                # Raising here would only unwind the wx.CallAfter that delivers the task.
+                _logger.error("Task %d (%r) failed", task.id, task.func, exc_info=(type(exception), exception, exception.__traceback__))
+                return
+            task.error.value = exception
+        elif task.result is not None:
+            task.result.value = task.future.result()
+
+    def __drainProgress(self):
+        assert self.__queue is not None
+        while True:
+            item = self.__queue.get()
+            if item is None:
+                break
+            taskId, value = item
+            task = self.__tasks.get(taskId)
+            if task is not None and task.progress is not None and not task.cancelled:
+                task.progress.value = value
+
+_executor: Optional[TaskExecutor] = None
+
+def getExecutor() -> TaskExecutor:
+    global _executor
+    if _executor is None:
+        _executor = TaskExecutor()
+    return _executor
+
+T = TypeVar("T")
+def submit(func: Callable[..., T], *args, **kw) -> Task[T]:
+    return getExecutor().submit(func, *args, **kw)
@@ -1,5 +1,52 @@
-from .window import Window
-from .menubar import Menu, MenuComponent, MenuItem, MenuSeparator
-from .artprovider import ArtID, SVGArtProvider
-from .view import View
-from . import controls
+# Library Imports
+import importlib
+from typing import TYPE_CHECKING
+
+# Internal Imports
+# The template submodule would shadow the function of the same name once imported, so it is bound here.
+from .template import Template, template
+
+# Other names are imported from their modules on first use, so importing pyappframework.ui loads neither
+# wx.svg nor the controls.
+_MODULES = {
+    "Window": "window",
+    "Menu": "menubar",
+    "MenuComponent": "menubar",
+    "MenuItem": "menubar",
+    "MenuSeparator": "menubar",
+    "ArtID": "artprovider",
+    "SVGArtProvider": "artprovider",
+    "View": "view",
+    "LayoutScheduler": "layout",
+    "layoutScheduler": "layout",
+    "requestLayout": "layout",
+    "EventRouter": "router",
+    "ColumnarModel": "columnar",
+}
+
+_SUBMODULES = {"aot", "attribute", "artprovider", "build", "columnar", "compiler", "controls", "layout", "menubar", "reconciler", "router", "template", "view", "window"}
+
+__all__ = list(_MODULES) + ["Template", "template", "controls"]
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_MODULES) | _SUBMODULES)
+
+if TYPE_CHECKING:
+    from .window import Window
+    from .menubar import Menu, MenuComponent, MenuItem, MenuSeparator
+    from .artprovider import ArtID, SVGArtProvider
+    from .view import View
+    from .layout import LayoutScheduler, layoutScheduler, requestLayout
+    from .router import EventRouter
+    from .columnar import ColumnarModel
+    from . import controls
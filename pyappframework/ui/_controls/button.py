@@ -6,6 +6,9 @@ from .control import Control
 from ..view import PrimitiveView
 
 class Button(Control):
+    _patchable = {"label": "SetLabel"}
+    __slots__ = ("__init_args",)
+
     def __init__(self, *args, **kw):
         super().__init__()
         self.__init_args = (args, kw)
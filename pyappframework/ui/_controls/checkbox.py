@@ -6,8 +6,12 @@ from .control import Control
 from ...mutable import Mutable, MutableValue, valueof, ismutable
 from ..view import PrimitiveView
 from .. import attribute as attr
+from ..router import bind
 
 class CheckBox(Control):
+    _patchable = {"label": "SetLabel"}
+    __slots__ = ("value", "label")
+
     def __init__(self, value: Mutable[bool], label: MutableValue[str]):
         super().__init__()
         self.value = value
@@ -18,6 +22,6 @@ class CheckBox(Control):
         cb.SetLabel(valueof(self.label))
         cb.SetValue(valueof(self.value))
         if ismutable(self.label):
-            root.getWxInstance().Bind(wx.EVT_CHECKBOX, self.label.sync(cb.GetLabelText, cb.SetLabelText), cb)
-        root.getWxInstance().Bind(wx.EVT_CHECKBOX, self.value.sync(cb.GetValue, cb.SetValue), cb)
+            bind(root.getWxInstance(), wx.EVT_CHECKBOX, self.label.sync(cb.GetLabelText, cb.SetLabelText), cb)
+        bind(root.getWxInstance(), wx.EVT_CHECKBOX, self.value.sync(cb.GetValue, cb.SetValue), cb)
         return cb
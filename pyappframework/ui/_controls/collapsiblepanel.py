@@ -8,11 +8,14 @@ from .. import attribute as attr
 from ..view import PrimitiveView
 
 class CollapsiblePanel(Control):
+    __slots__ = ("__init_args", "__sizer")
+
+    body = attr.BodyAttribute.field()
+
     def __init__(self, sizer: wx.Sizer, *args, **kw):
         super().__init__()
         self.__init_args = (args, kw)
         self.__sizer = sizer
-        self.body = attr.BodyAttribute(self)
 
     def _initialize(self, root: PrimitiveView, parent: PrimitiveView) -> wx.Window:
         cp = wx.CollapsiblePane(parent.getWxInstance(), *self.__init_args[0], **self.__init_args[1])
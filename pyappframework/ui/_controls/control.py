@@ -6,12 +6,15 @@ from .. import attribute as attr
 from ..view import PrimitiveView
 
 class Control(PrimitiveView):
-    def __init__(self):
-        super().__init__()
-        self.sizer = attr.Attribute(self, attr.SizerChildAttributeHandler(), None, 1)
-        self.eventHandler = attr.Attribute(self, attr.EventHandlerAttributeHandler[wx.Window, wx.Window, wx.Window](), None)
-        self.export = attr.Attribute(self, attr.ExportAttributeHandler[wx.Window, wx.Window, wx.Window](), None, 1)
-        self.visible = attr.Attribute(self, attr.VisibilityAttributeHandler(), None, 1)
-        self.tooltip = attr.Attribute(self, attr.ToolTipAttributeHandler(), None, 1)
-        self.rawModifier = attr.Attribute(self, attr.RawModifierAttributeHandler(), None, 1)
-        self.font = attr.Attribute(self, attr.FontAttributeHandler(), None, 1)
+    # Controls are created in large numbers, so they and their subclasses keep their state in slots,
+    # including the state of the slot-less AttributeContainer and PrimitiveView bases.
+    __slots__ = ("_props", "_attributes", "_attribDelegates", "_attribCalls", "_PrimitiveView__wx_instance", "__weakref__")
+
+    sizer = attr.Attribute.field(attr.SizerChildAttributeHandler(), None, 1)
+    eventHandler = attr.Attribute.field(attr.EventHandlerAttributeHandler[wx.Window, wx.Window, wx.Window](), None)
+    export = attr.Attribute.field(attr.ExportAttributeHandler[wx.Window, wx.Window, wx.Window](), None, 1)
+    visible = attr.Attribute.field(attr.VisibilityAttributeHandler(), None, 1)
+    tooltip = attr.Attribute.field(attr.ToolTipAttributeHandler(), None, 1)
+    rawModifier = attr.Attribute.field(attr.RawModifierAttributeHandler(), None, 1)
+    font = attr.Attribute.field(attr.FontAttributeHandler(), None, 1)
+    key = attr.TypedAttribute.field()
@@ -10,14 +10,21 @@ from ...decorators import chainable
 from .. import attribute as attr
 
 class DataViewCtrl(Control):
+    __slots__ = ("__init_args",)
+
+    model = attr.TypedAttribute[wx.Window, wx.Window, wx.Window, dv.DataViewModel].field()
+
     def __init__(self, *args, **kw):
         super().__init__()
         self.__init_args = (args, kw)
-        self.model = attr.TypedAttribute[wx.Window, wx.Window, wx.Window, dv.DataViewModel](self)
 
     def _initialize(self, root: PrimitiveView, parent: PrimitiveView) -> wx.Window:
         dvc = dv.DataViewCtrl(parent.getWxInstance(), *self.__init_args[0], **self.__init_args[1])
         model = self.model.getTypedValue()
         if model is not None:
             dvc.AssociateModel(model)
+            # Models such as ColumnarModel set up the columns they provide.
+            attach = getattr(model, "attach", None)
+            if attach is not None:
+                attach(dvc)
         return dvc
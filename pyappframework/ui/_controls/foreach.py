@@ -0,0 +1,192 @@
+# Library Imports
+import wx
+import bisect
+from typing import TypeVar, Generic, Callable, Hashable, Optional, Sequence
+
+# Internal Imports
+from ..view import PrimitiveView, _BuildRoot
+from ..build import _build
+from ...mutable import Mutable, MutableValue, batch, identical, ismutable
+from ..layout import requestLayout
+
+
+T = TypeVar("T")
+class _Row(Generic[T]):
+    __slots__ = ("key", "item", "window", "flags")
+
+    def __init__(self, key: Hashable, item: Mutable[T], window: wx.Window):
+        self.key = key
+        self.item = item
+        self.window = window
+        self.flags = (0, 0, 0)
+
+def _stableIndices(sequence: list[int]) -> set[int]:
+    # Indices into sequence of one longest increasing subsequence; the rows at those positions keep
+    # their relative order, so only the others have to move.
+    tails: list[int] = []
+    tailIndices: list[int] = []
+    previous = [-1] * len(sequence)
+    for i, value in enumerate(sequence):
+        position = bisect.bisect_left(tails, value)
+        if position == len(tails):
+            tails.append(value)
+            tailIndices.append(i)
+        else:
+            tails[position] = value
+            tailIndices[position] = i
+        previous[i] = tailIndices[position - 1] if position > 0 else -1
+    stable = set()
+    i = tailIndices[-1] if tailIndices else -1
+    while i >= 0:
+        stable.add(i)
+        i = previous[i]
+    return stable
+
+T = TypeVar("T")
+class ForEach(PrimitiveView):
+    # A body element that builds one row view per item of source and keeps them in sync with it.
+    # Rows are matched by key; rows whose key is still present are left untouched (their item Mutable
+    # receives the new item), and of the others only those outside a longest run of rows that kept their
+    # order are moved. Removed rows are destroyed and new ones are built in place.
+    # In sizer-based containers the rows follow a hidden anchor window in the sizer, keeping the
+    # proportion, flag and border their sizer attribute gave them; in a Notebook they are pages.
+    def __init__(self, source: MutableValue[Sequence[T]], *, row: Callable[[Mutable[T]], PrimitiveView], key: Optional[Callable[[T], Hashable]] = None):
+        super().__init__()
+        self.__source = source
+        self.__row = row
+        self.__key = key
+        self.__rows: list[_Row[T]] = []
+        self.__root: Optional[PrimitiveView] = None
+        self.__container: Optional[PrimitiveView] = None
+        self.__anchor: Optional[wx.Window] = None
+        self.__start = 0
+
+    def _initialize(self, root: PrimitiveView, parent: PrimitiveView) -> wx.Window:
+        # Containers such as CollapsiblePanel replace their wx instance after building the body, so the
+        # window rows are created in is kept as it is now.
+        container = parent.getWxInstance()
+        self.__root = _BuildRoot(root.getWxInstance())
+        self.__container = _BuildRoot(container)
+        if isinstance(container, wx.BookCtrlBase):
+            self.__start = container.GetPageCount()
+            owner = container
+        else:
+            sizer = container.GetSizer()
+            assert sizer is not None, "ForEach requires a container with a sizer or a Notebook"
+            owner = self.__anchor = wx.Window(container, size=(0, 0))
+            self.__anchor.Hide()
+            _build.add(sizer, self.__anchor, (), {})
+        if ismutable(self.__source):
+            self.__source.syncTo(self.__reconcile, owner=owner)
+        else:
+            self.__reconcile(self.__source)
+        return owner
+
+    @property
+    def rows(self) -> list[wx.Window]:
+        return [row.window for row in self.__rows]
+
+    def __keyOf(self, item: T) -> Hashable:
+        return item if self.__key is None else self.__key(item)
+
+    def __reconcile(self, items: Sequence[T]):
+        assert self.__container is not None
+        container = self.__container.getWxInstance()
+        if not container:
+            return
+        items = list(items)
+        keys = [self.__keyOf(item) for item in items]
+        present = set(keys)
+        if len(present) != len(keys):
+            raise ValueError("ForEach keys must be unique")
+        _build.flush()
+        container.Freeze()
+        try:
+            with batch():
+                # Rows are removed and detached by position, last first, so the positions of the rows
+                # before them stay valid and no lookup in the container is needed.
+                first = self.__firstIndex(container)
+                for position in reversed(range(len(self.__rows))):
+                    if self.__rows[position].key not in present:
+                        self.__remove(container, first + position, self.__rows[position])
+                survivors = [row for row in self.__rows if row.key in present]
+                previousIndex = {row.key: i for i, row in enumerate(survivors)}
+                byKey = {row.key: row for row in survivors}
+                order = [previousIndex[key] for key in keys if key in byKey]
+                stableKeys = {survivors[order[i]].key for i in _stableIndices(order)}
+                for position in reversed(range(len(survivors))):
+                    if survivors[position].key not in stableKeys:
+                        self.__detach(container, first + position)
+                created = {key: self.__create(key, item) for key, item in zip(keys, items) if key not in byKey}
+                self.__adopt(container, list(created.values()))
+                rows = []
+                for index, (key, item) in enumerate(zip(keys, items)):
+                    row = byKey.get(key)
+                    if row is None:
+                        row = created[key]
+                        self.__insert(container, first + index, row, rows[-1] if rows else None)
+                    else:
+                        row.item.value = item
+                        if key not in stableKeys:
+                            self.__insert(container, first + index, row, rows[-1] if rows else None)
+                    rows.append(row)
+                self.__rows = rows
+        finally:
+            container.Thaw()
+        if isinstance(container, wx.ScrolledWindow):
+            container.FitInside()
+        requestLayout(container)
+
+    def __create(self, key: Hashable, item: T) -> _Row[T]:
+        assert self.__root is not None and self.__container is not None
+        mutable = Mutable[T](item, compare=identical)
+        window = self.__row(mutable).initialize(self.__root, self.__container)
+        return _Row[T](key, mutable, window)
+
+    def __adopt(self, container: wx.Window, rows: list[_Row[T]]):
+        # New rows add themselves to the end of the sizer (queued while the enclosing tree is being built);
+        # they are taken back out, keeping the flags of their sizer attribute, to be inserted after the
+        # anchor. Their items are looked up by position, from the last one, so this stays linear.
+        if self.__anchor is None or not rows:
+            return
+        _build.flush()
+        sizer = container.GetSizer()
+        end = sizer.GetItemCount()
+        for row in reversed(rows):
+            sizerItem = sizer.GetItem(end - 1) if end > 0 else None
+            if sizerItem is not None and sizerItem.GetWindow() is row.window:
+                end -= 1
+                detached = end
+            else:
+                sizerItem = sizer.GetItem(row.window)
+                if sizerItem is None:
+                    continue
+                detached = row.window
+            row.flags = (sizerItem.GetProportion(), sizerItem.GetFlag(), sizerItem.GetBorder())
+            sizer.Detach(detached)
+
+    def __firstIndex(self, container: wx.Window) -> int:
+        # The page or sizer index of the first row.
+        if self.__anchor is None:
+            return self.__start
+        return next(i for i, item in enumerate(container.GetSizer().GetChildren()) if item.GetWindow() is self.__anchor) + 1
+
+    def __remove(self, container: wx.Window, index: int, row: _Row[T]):
+        if self.__anchor is None:
+            container.DeletePage(index)
+        else:
+            container.GetSizer().Detach(index)
+            row.window.Destroy()
+
+    def __detach(self, container: wx.Window, index: int):
+        if self.__anchor is None:
+            container.RemovePage(index)
+        else:
+            container.GetSizer().Detach(index)
+
+    def __insert(self, container: wx.Window, index: int, row: _Row[T], previous: Optional[_Row[T]]):
+        if self.__anchor is None:
+            container.InsertPage(index, row.window, row.window.GetLabel())
+            return
+        container.GetSizer().Insert(index, row.window, *row.flags)
+        row.window.MoveAfterInTabOrder(previous.window if previous is not None else self.__anchor)
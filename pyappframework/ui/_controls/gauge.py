@@ -5,12 +5,21 @@ from typing import Optional
 # Internal Imports
 from ..view import PrimitiveView
 from .control import Control
+from ...mutable import Mutable, MutableValue
 
 class Gauge(Control):
-    def __init__(self, *args, **kw):
+    _patchable = {"value": "SetValue", "range": "SetRange"}
+    __slots__ = ("value", "__init_args")
+
+    def __init__(self, *args, value: Optional[MutableValue[int]] = None, **kw):
         super().__init__()
+        self.value = value
         self.__init_args = (args, kw)
 
     def _initialize(self, root: PrimitiveView, parent: PrimitiveView) -> wx.Window:
         ga = wx.Gauge(parent.getWxInstance(), *self.__init_args[0], **self.__init_args[1])
+        if isinstance(self.value, Mutable):
+            self.value.syncTo(ga.SetValue)
+        elif self.value is not None:
+            ga.SetValue(self.value)
         return ga
@@ -16,10 +16,13 @@ from .control import Control
 from ...decorators import chainable, event_handler
 
 class GLView(Control):
+    __slots__ = ("__init_args", "__context", "__initialized")
+
+    contextArgs = attr.ArgumentAttribute[wx.Window, wx.Window, wx.Window].field()
+
     def __init__(self, *args, **kw):
         super().__init__()
         self.__init_args = (args, kw)
-        self.contextArgs = attr.ArgumentAttribute[wx.Window, wx.Window, wx.Window](self)
         self.__context = None
         self.__initialized = False
 
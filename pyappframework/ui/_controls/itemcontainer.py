@@ -0,0 +1,55 @@
+# Library Imports
+import wx
+from typing import Callable, Sequence, TypeVar
+
+# Internal Imports
+from ...mutable import MutableValue, ismutable
+from ...mutablecollections import MutableList, ListChange, ListMutationEvent, MOVE
+
+T = TypeVar("T")
+
+def bindItems(container: wx.ItemContainer, items: MutableValue[Sequence[T]], format: Callable[[T], str]):
+    # Fills a ListBox or Choice with items. The changes of a MutableList are applied in place with
+    # Insert/Delete/SetString, so the rows around them (and the selection) are left alone, unless
+    # rebuilding the whole control is cheaper; other Mutables set all the items again on assignment.
+    def reset(values: Sequence[T]):
+        container.Set([format(item) for item in values])
+
+    def apply(evt: ListMutationEvent[T]):
+        changes = evt.changes
+        if not changes:
+            return
+        count = container.GetCount()
+        cost = sum(len(change.removed) + len(change.inserted) for change in changes)
+        if container.IsSorted() or cost > max(count, len(evt.newValue)):
+            reset(evt.newValue)
+            return
+        container.Freeze()
+        try:
+            for change in changes:
+                applyChange(change)
+        finally:
+            container.Thaw()
+
+    def applyChange(change: ListChange):
+        index = change.index
+        if change.kind == MOVE:
+            for _ in change.removed:
+                container.Delete(index)
+            container.Insert([format(item) for item in change.inserted], change.target)
+            return
+        common = min(len(change.removed), len(change.inserted))
+        for offset in range(common):
+            container.SetString(index + offset, format(change.inserted[offset]))
+        for _ in range(len(change.removed) - common):
+            container.Delete(index + common)
+        if len(change.inserted) > common:
+            container.Insert([format(item) for item in change.inserted[common:]], index + common)
+
+    if isinstance(items, MutableList):
+        reset(items.rawValue)
+        items.addListener(apply, owner=container)
+    elif ismutable(items):
+        items.syncTo(reset, owner=container)
+    else:
+        reset(items)
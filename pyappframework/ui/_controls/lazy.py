@@ -0,0 +1,84 @@
+# Library Imports
+import wx
+from typing import Callable, Optional, Union
+
+# Internal Imports
+from ..view import PrimitiveView, _BuildRoot
+from ..build import _build
+from .control import Control
+from ..layout import requestLayout
+
+
+class Lazy(Control):
+    # Creates an empty placeholder panel and builds the real subtree into it the first time the
+    # placeholder is shown or painted, e.g. when a Notebook page is selected or a CollapsiblePanel is
+    # expanded. The content is initialized with the original root, so its sizer, export and eventHandler
+    # attributes behave as if it had been built up front.
+    # The placeholder needs a non-zero size to be painted, so it should usually be expanded by its sizer.
+    __slots__ = ("__init_args", "__content", "__root", "__instance", "__scheduled")
+
+    def __init__(self, content: Union[PrimitiveView, Callable[[], PrimitiveView]], *args, **kw):
+        super().__init__()
+        self.__init_args = (args, kw)
+        self.__content = content
+        self.__root: Optional[PrimitiveView] = None
+        self.__instance: Optional[wx.Window] = None
+        self.__scheduled = False
+
+    def _initialize(self, root: PrimitiveView, parent: PrimitiveView) -> wx.Window:
+        label = self.__init_args[1].pop("label", None)
+        panel = wx.Panel(parent.getWxInstance(), *self.__init_args[0], **self.__init_args[1])
+        if label is not None:
+            panel.SetLabel(label)
+        panel.SetSizer(wx.BoxSizer(wx.VERTICAL))
+        self.setWxInstance(panel)
+        self.__root = _BuildRoot(root.getWxInstance())
+        panel.Bind(wx.EVT_SHOW, self.__onShow)
+        panel.Bind(wx.EVT_PAINT, self.__onPaint)
+        return panel
+
+    @property
+    def materialized(self) -> bool:
+        return self.__instance is not None
+
+    def materialize(self) -> wx.Window:
+        if self.__instance is not None:
+            return self.__instance
+        assert self.__root is not None
+        panel = self.getWxInstance()
+        panel.Unbind(wx.EVT_SHOW, handler=self.__onShow)
+        panel.Unbind(wx.EVT_PAINT, handler=self.__onPaint)
+        content = self.__content
+        if not isinstance(content, PrimitiveView):
+            content = content()
+        self.__content = None
+        # The fallback sizer item is added within the same build, so the panel is laid out once.
+        _build.begin(panel)
+        try:
+            self.__instance = content.initialize(self.__root, self)
+            _build.flush()
+            sizer = panel.GetSizer()
+            if sizer.GetItem(self.__instance) is None:
+                sizer.Add(self.__instance, 1, wx.EXPAND)
+        except BaseException as e:
+            _build.end(type(e), e, e.__traceback__)
+            raise
+        _build.end(None, None, None)
+        requestLayout(panel.GetParent())
+        return self.__instance
+
+    def __onShow(self, evt: wx.ShowEvent):
+        evt.Skip()
+        if evt.IsShown():
+            self.materialize()
+
+    def __onPaint(self, evt: wx.PaintEvent):
+        # Building the subtree while painting is not allowed, so it is deferred to the next idle time.
+        evt.Skip()
+        if not self.__scheduled:
+            self.__scheduled = True
+            wx.CallAfter(self.__materializeIfAlive)
+
+    def __materializeIfAlive(self):
+        if self.getWxInstance():
+            self.materialize()
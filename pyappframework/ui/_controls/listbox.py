@@ -1,16 +1,24 @@
 # Library Imports
 import wx
-from typing import Optional
+from typing import Callable, Optional, Sequence
 
 # Internal Imports
 from ..view import PrimitiveView
 from .control import Control
+from .itemcontainer import bindItems
+from ...mutable import MutableValue
 
 class ListBox(Control):
-    def __init__(self, *args, **kw):
+    __slots__ = ("__init_args", "__items", "__format")
+
+    def __init__(self, *args, items: Optional[MutableValue[Sequence]] = None, format: Callable[..., str] = str, **kw):
         super().__init__()
         self.__init_args = (args, kw)
+        self.__items = items
+        self.__format = format
 
     def _initialize(self, root: PrimitiveView, parent: PrimitiveView) -> wx.Window:
         lb = wx.ListBox(parent.getWxInstance(), *self.__init_args[0], **self.__init_args[1])
+        if self.__items is not None:
+            bindItems(lb, self.__items, self.__format)
         return lb
@@ -6,12 +6,16 @@ from typing import Optional
 from .. import attribute as attr
 from ..view import PrimitiveView
 from .control import Control
+from .foreach import ForEach
 
 class Notebook(Control):
+    __slots__ = ("__init_args",)
+
+    body = attr.BodyAttribute.field()
+
     def __init__(self, *args, **kw):
         super().__init__()
         self.__init_args = (args, kw)
-        self.body = attr.BodyAttribute(self)
 
     def _initialize(self, root: PrimitiveView, parent: PrimitiveView) -> wx.Window:
         nb = wx.Notebook(parent.getWxInstance(), *self.__init_args[0], **self.__init_args[1])
@@ -19,6 +23,9 @@ class Notebook(Control):
         if isinstance(self.body.value, list):
             for view in self.body.value:
                 assert isinstance(view, PrimitiveView)
+                if isinstance(view, ForEach):
+                    view.initialize(root, self)
+                    continue
                 instance = view.initialize(root, self)
                 assert instance is not None
                 nb.AddPage(instance, instance.GetLabel())
@@ -8,11 +8,15 @@ from ..view import PrimitiveView
 from .control import Control
 
 class Panel(Control):
+    _patchable = {"label": "SetLabel"}
+    __slots__ = ("__init_args", "__sizer")
+
+    body = attr.BodyAttribute.field()
+
     def __init__(self, sizer: wx.Sizer, *args, **kw):
         super().__init__()
         self.__init_args = (args, kw)
         self.__sizer = sizer
-        self.body = attr.BodyAttribute(self)
 
     def _initialize(self, root: PrimitiveView, parent: PrimitiveView) -> wx.Window:
         label = self.__init_args[1].pop("label", None)
@@ -12,6 +12,8 @@ from ..view import PrimitiveView
 from .control import Control
 
 class Plot(Control):
+    __slots__ = ("__init_args",)
+
     def __init__(self, *args, **kw):
         super().__init__()
         self.__init_args = (args, kw)
@@ -5,14 +5,37 @@ from typing import Optional
 # Internal Imports
 from ..view import PrimitiveView
 from .control import Control
-from ...mutable import Mutable
+from .. import attribute as attr
+from ..router import bind
+from ...mutable import Mutable, SyncPolicy, Debounce, Throttle
 
 class SearchCtrl(Control):
+    __slots__ = ("value",)
+
+    syncPolicy = attr.TypedAttribute[wx.Window, wx.Window, wx.Window, SyncPolicy].field()
+    debounce = attr.TypedAttribute[wx.Window, wx.Window, wx.Window, int].field()
+    throttle = attr.TypedAttribute[wx.Window, wx.Window, wx.Window, int].field()
+
     def __init__(self, value: Mutable[str]):
         super().__init__()
         self.value = value
 
     def _initialize(self, root: PrimitiveView, parent: PrimitiveView) -> wx.Window:
         sc = wx.SearchCtrl(parent.getWxInstance())
-        root.getWxInstance().Bind(wx.EVT_TEXT, self.value.sync(sc.GetValue, sc.SetValue), sc)
+        policy = self.getSyncPolicy()
+        listener = self.value.sync(sc.GetValue, sc.SetValue, policy)
+        bind(root.getWxInstance(), wx.EVT_TEXT, listener, sc)
+        if policy is not None:
+            if policy.flushOnFocusLoss:
+                sc.Bind(wx.EVT_KILL_FOCUS, listener.flush)
+            sc.Bind(wx.EVT_WINDOW_DESTROY, listener.cancel, sc)
         return sc
+
+    def getSyncPolicy(self) -> Optional[SyncPolicy]:
+        if self.syncPolicy.getTypedValue() is not None:
+            return self.syncPolicy.getTypedValue()
+        if self.debounce.getTypedValue() is not None:
+            return Debounce(self.debounce.getTypedValue())
+        if self.throttle.getTypedValue() is not None:
+            return Throttle(self.throttle.getTypedValue())
+        return None
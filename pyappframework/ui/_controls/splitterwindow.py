@@ -14,12 +14,15 @@ class Orientation(Enum):
     VERTICAL = 1
 
 class SplitterWindow(Control):
+    __slots__ = ("__init_args", "__ori", "__pos")
+
+    body = attr.BodyAttribute.field()
+
     def __init__(self, ori: Orientation, pos: int = 0, *args, **kw):
         super().__init__()
         self.__init_args = (args, kw)
         self.__ori = ori
         self.__pos = pos
-        self.body = attr.BodyAttribute(self)
 
     def _initialize(self, root: PrimitiveView, parent: PrimitiveView) -> wx.Window:
         contents = self.body.value
@@ -5,11 +5,12 @@ from typing import Union
 # Internal Imports
 from ..view import PrimitiveView
 from .control import Control
-from ...mutable import Mutable
-from ... import MutableValue
+from ...mutable import Mutable, MutableValue
 
 
 class StaticBitmap(Control):
+    __slots__ = ("image",)
+
     def __init__(self, image: Union[MutableValue[wx.Image], MutableValue[wx.Bitmap]]):
         super().__init__()
         self.image = image
@@ -18,7 +19,7 @@ class StaticBitmap(Control):
         sb = wx.StaticBitmap(parent.getWxInstance())
         if isinstance(self.image, Mutable):
             if isinstance(self.image.value, wx.Image):
-                self.image.syncTo(lambda img: sb.SetBitmap(img.ConvertToBitmap()))
+                self.image.syncTo(lambda img: sb.SetBitmap(img.ConvertToBitmap()), owner=sb)
             elif isinstance(self.image.value, wx.Bitmap):
                 self.image.syncTo(sb.SetBitmap)
             else:
@@ -8,11 +8,15 @@ from .control import Control
 from .. import attribute as attr
 
 class StaticBox(Control):
+    _patchable = {"label": "SetLabel"}
+    __slots__ = ("__sizer", "__init_args")
+
+    body = attr.BodyAttribute.field()
+
     def __init__(self, sizer: wx.Sizer, *args, **kw):
         super().__init__()
         self.__sizer = sizer
         self.__init_args = (args, kw)
-        self.body = attr.BodyAttribute(self)
 
     def _initialize(self, root: PrimitiveView, parent: PrimitiveView) -> wx.Window:
         sb = wx.StaticBox(parent.getWxInstance(), *self.__init_args[0], **self.__init_args[1])
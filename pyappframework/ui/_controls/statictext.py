@@ -8,6 +8,9 @@ from .control import Control
 from ...mutable import MutableValue, valueof, ismutable
 
 class StaticText(Control):
+    _patchable = {"label": "SetLabelText"}
+    __slots__ = ("label",)
+
     def __init__(self, label: MutableValue[str]):
         super().__init__()
         self.label = label
@@ -11,9 +11,12 @@ from .. import attribute as attr
 
 
 class ToolBar(Control):
+    __slots__ = ("__init_args",)
+
+    body = attr.BodyAttribute[wx.Window, wx.Window, wx.Window, "Tool"].field()
+
     def __init__(self, *args, **kw):
         super().__init__()
-        self.body = attr.BodyAttribute[wx.Window, wx.Window, wx.Window, Tool](self)
         self.__init_args = (args, kw)
 
     def _initialize(self, root: PrimitiveView, parent: PrimitiveView) -> wx.Window:
@@ -7,6 +7,8 @@ from ..view import PrimitiveView
 from .control import Control
 
 class TreeCtrl(Control):
+    __slots__ = ("__init_args",)
+
     def __init__(self, *args, **kw):
         super().__init__()
         self.__init_args = (args, kw)
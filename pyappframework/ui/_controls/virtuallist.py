@@ -0,0 +1,158 @@
+# Library Imports
+import wx
+import bisect
+import itertools
+from typing import Callable, Optional, Union
+
+# Internal Imports
+from ..view import PrimitiveView, _BuildRoot
+from .control import Control
+from ...mutable import Mutable, MutableValue, batch, valueof, ismutable
+
+
+class _Row:
+    __slots__ = ("index", "window")
+
+    def __init__(self, index: Mutable[int], window: wx.Window):
+        self.index = index
+        self.window = window
+
+class VirtualList(Control):
+    # Only the rows intersecting the viewport, plus overscan rows on either side, exist as windows.
+    # Each row view is built once from a Mutable[int] index; scrolling moves rows out of view to new
+    # positions and assigns their new index, so row contents should be bound to that Mutable.
+    # Row offsets are kept as prefix sums of the row heights and searched with bisect; call
+    # invalidateHeights() when variable heights change.
+    __slots__ = ("__init_args", "__count", "__row", "__rowHeight", "__overscan", "__offsets", "__rows", "__root", "__scheduled")
+
+    def __init__(self, count: MutableValue[int], row: Callable[[Mutable[int]], PrimitiveView], *args, rowHeight: Union[int, Callable[[int], int]] = 24, overscan: int = 4, **kw):
+        super().__init__()
+        if isinstance(rowHeight, int) and rowHeight <= 0:
+            raise ValueError(f"VirtualList rowHeight must be positive, not {rowHeight}")
+        self.__init_args = (args, kw)
+        self.__count = count
+        self.__row = row
+        self.__rowHeight = rowHeight
+        self.__overscan = overscan
+        self.__offsets = [0]
+        self.__rows: list[_Row] = []
+        self.__root: Optional[PrimitiveView] = None
+        self.__scheduled = False
+
+    def _initialize(self, root: PrimitiveView, parent: PrimitiveView) -> wx.Window:
+        label = self.__init_args[1].pop("label", None)
+        sw = wx.ScrolledWindow(parent.getWxInstance(), *self.__init_args[0], **self.__init_args[1])
+        if label is not None:
+            sw.SetLabel(label)
+        sw.SetScrollRate(0, self.__rowHeight if isinstance(self.__rowHeight, int) else 16)
+        self.setWxInstance(sw)
+        self.__root = _BuildRoot(root.getWxInstance())
+        sw.Bind(wx.EVT_SCROLLWIN, self.__onScroll)
+        sw.Bind(wx.EVT_SIZE, self.__onSize)
+        if ismutable(self.__count):
+            self.__count.syncTo(self.__setCount, owner=sw)
+        else:
+            self.__setCount(valueof(self.__count))
+        return sw
+
+    @property
+    def count(self) -> int:
+        return len(self.__offsets) - 1
+
+    @property
+    def rowCount(self) -> int:
+        return len(self.__rows)
+
+    def rowOffset(self, index: int) -> int:
+        return self.__offsets[index]
+
+    def rowAt(self, y: int) -> int:
+        return min(bisect.bisect_right(self.__offsets, y) - 1, self.count - 1)
+
+    def invalidateHeights(self):
+        self.__setCount(self.count)
+
+    def refresh(self):
+        # Reassigning the index notifies the row bindings again, for when the underlying data changed.
+        with batch():
+            for row in self.__rows:
+                row.index.value = row.index.value
+
+    def scrollTo(self, index: int):
+        sw = self.getWxInstance()
+        unit = sw.GetScrollPixelsPerUnit()[1]
+        sw.Scroll(-1, self.__offsets[index] // max(unit, 1))
+        self.__update()
+
+    def __setCount(self, count: int):
+        rowHeight = self.__rowHeight
+        if isinstance(rowHeight, int):
+            self.__offsets = list(range(0, (count + 1) * rowHeight, rowHeight))
+        else:
+            heights = [rowHeight(i) for i in range(count)]
+            if heights and min(heights) <= 0:
+                index = next(i for i, height in enumerate(heights) if height <= 0)
+                raise ValueError(f"VirtualList rowHeight must be positive, not {heights[index]} for row {index}")
+            self.__offsets = [0] + list(itertools.accumulate(heights))
+        sw = self.getWxInstance()
+        sw.SetVirtualSize(0, self.__offsets[-1])
+        self.__update()
+
+    def __onScroll(self, evt: wx.ScrollWinEvent):
+        # The scroll position changes after the default handler has run.
+        evt.Skip()
+        self.__scheduleUpdate()
+
+    def __onSize(self, evt: wx.SizeEvent):
+        evt.Skip()
+        self.__scheduleUpdate()
+
+    def __scheduleUpdate(self):
+        if not self.__scheduled:
+            self.__scheduled = True
+            wx.CallAfter(self.__update)
+
+    def __update(self):
+        self.__scheduled = False
+        sw = self.getWxInstance()
+        if not sw:
+            return
+        offsets = self.__offsets
+        top = sw.CalcUnscrolledPosition(0, 0)[1]
+        width, height = sw.GetClientSize()
+        first = max(bisect.bisect_right(offsets, top) - 1 - self.__overscan, 0)
+        last = min(bisect.bisect_left(offsets, top + height) + self.__overscan, self.count)
+        placed: dict[int, _Row] = {}
+        free: list[_Row] = []
+        for row in self.__rows:
+            index = row.index.rawValue
+            if first <= index < last and index not in placed and row.window.IsShown():
+                placed[index] = row
+            else:
+                free.append(row)
+        sw.Freeze()
+        try:
+            with batch():
+                for index in range(first, last):
+                    row = placed.get(index)
+                    if row is None:
+                        if free:
+                            row = free.pop()
+                            row.index.value = index
+                            row.window.Show()
+                        else:
+                            row = self.__createRow(index)
+                    y = sw.CalcScrolledPosition(0, offsets[index])[1]
+                    row.window.SetSize(0, y, width, offsets[index + 1] - offsets[index])
+                for row in free:
+                    row.window.Hide()
+        finally:
+            sw.Thaw()
+
+    def __createRow(self, index: int) -> _Row:
+        assert self.__root is not None
+        mutable = Mutable[int](index)
+        window = self.__row(mutable).initialize(self.__root, self)
+        row = _Row(mutable, window)
+        self.__rows.append(row)
+        return row
@@ -0,0 +1,122 @@
+# Library Imports
+import wx
+from typing import Callable, Optional, Sequence
+
+# Internal Imports
+from ..view import PrimitiveView
+from .control import Control
+from ...mutable import MutableValue, ismutable
+from ...mutablecollections import MutableList, ListChange, ListMutationEvent, MOVE
+
+
+class _ListCtrl(wx.ListCtrl):
+    def __init__(self, parent: wx.Window, text: Callable[[int], str], *args, **kw):
+        super().__init__(parent, *args, **kw)
+        self.__text = text
+
+    def OnGetItemText(self, item: int, column: int) -> str:
+        return self.__text(item)
+
+def _remap(row: int, change: ListChange) -> Optional[int]:
+    # The position of a row once a change has been made, or None if it was removed.
+    if change.kind == MOVE:
+        count = len(change.removed)
+        if change.index <= row < change.index + count:
+            return row - change.index + change.target
+        if row >= change.index + count:
+            row -= count
+        return row + count if row >= change.target else row
+    if row < change.index:
+        return row
+    if row < change.index + len(change.removed):
+        return row if row - change.index < len(change.inserted) else None
+    return row - len(change.removed) + len(change.inserted)
+
+class VirtualListBox(Control):
+    # A single column virtual wx.ListCtrl over a sequence. The control keeps no copy of the items and asks
+    # for the text of the rows it paints only, so items are formatted on demand and a list of millions
+    # costs no more to show than a screenful. The changes of a MutableList update the item count and
+    # repaint from the first changed row, and the selection follows the rows it was on.
+    __slots__ = ("__init_args", "__items", "__format", "__values")
+
+    def __init__(self, items: MutableValue[Sequence], *args, format: Callable[..., str] = str, **kw):
+        super().__init__()
+        self.__init_args = (args, kw)
+        self.__items = items
+        self.__format = format
+        self.__values: Sequence = ()
+
+    def _initialize(self, root: PrimitiveView, parent: PrimitiveView) -> wx.Window:
+        kw = dict(self.__init_args[1])
+        kw["style"] = kw.get("style", wx.LC_SINGLE_SEL) | wx.LC_REPORT | wx.LC_VIRTUAL | wx.LC_NO_HEADER
+        lc = _ListCtrl(parent.getWxInstance(), self.__text, *self.__init_args[0], **kw)
+        lc.InsertColumn(0, "")
+        lc.Bind(wx.EVT_SIZE, self.__onSize)
+        self.setWxInstance(lc)
+        items = self.__items
+        if isinstance(items, MutableList):
+            items.addListener(self.__apply, owner=lc)
+        elif ismutable(items):
+            items.syncTo(self.__set, owner=lc)
+        else:
+            self.__set(items)
+        return lc
+
+    @property
+    def count(self) -> int:
+        return len(self.__values)
+
+    def selectedRows(self) -> list[int]:
+        lc = self.getWxInstance()
+        rows = []
+        row = lc.GetFirstSelected()
+        while row != -1:
+            rows.append(row)
+            row = lc.GetNextSelected(row)
+        return rows
+
+    def __text(self, row: int) -> str:
+        return self.__format(self.__values[row])
+
+    def __onSize(self, evt: wx.SizeEvent):
+        evt.Skip()
+        lc = self.getWxInstance()
+        lc.SetColumnWidth(0, lc.GetClientSize()[0])
+
+    def __set(self, values: Sequence):
+        self.__values = values
+        lc = self.getWxInstance()
+        lc.SetItemCount(len(values))
+        lc.Refresh()
+
+    def __apply(self, evt: ListMutationEvent):
+        self.__values = evt.newValue
+        lc = self.getWxInstance()
+        count = len(evt.newValue)
+        if not evt.changes:
+            lc.SetItemCount(count)
+            return
+        selected = self.selectedRows()
+        first, last = count, -1
+        for change in evt.changes:
+            if change.kind == MOVE:
+                first = min(first, change.index, change.target)
+                last = max(last, change.index + len(change.removed) - 1, change.target + len(change.removed) - 1)
+            elif len(change.removed) == len(change.inserted):
+                first = min(first, change.index)
+                last = max(last, change.index + len(change.inserted) - 1)
+            else:
+                # Every row after an insertion or removal shows another item.
+                first = min(first, change.index)
+                last = count - 1
+            selected = [row for row in (_remap(row, change) for row in selected) if row is not None]
+        if lc.GetItemCount() != count:
+            lc.SetItemCount(count)
+        if selected != self.selectedRows():
+            for row in self.selectedRows():
+                lc.Select(row, False)
+            for row in selected:
+                lc.Select(row)
+        last = min(last, count - 1)
+        if first <= last:
+            lc.RefreshItems(first, last)
@@ -0,0 +1,100 @@
+# Library Imports
+import os
+import sys
+import hashlib
+import functools
+import importlib.util
+from types import ModuleType
+from typing import Callable, Optional
+
+# Internal Imports
+from .. import __version__
+
+AOT_DIRECTORY = "__aot__"
+
+def generatedPath(sourcePath: str) -> str:
+    # The construction code compiled from the views of a module lives in __aot__/ next to it, under the
+    # module's file name.
+    directory, filename = os.path.split(sourcePath)
+    return os.path.join(directory, AOT_DIRECTORY, filename)
+
+def digest(path: str) -> Optional[str]:
+    try:
+        with open(path, "rb") as file:
+            return hashlib.sha256(file.read()).hexdigest()
+    except OSError:
+        return None
+
+@functools.lru_cache(maxsize=None)
+def frameworkDigest() -> str:
+    # The version alone doesn't change while the framework is being worked on, so generated modules also
+    # record a digest of all of its sources, which mirror what the controls and attributes do.
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sha = hashlib.sha256()
+    for directory, directories, files in os.walk(root):
+        directories[:] = sorted(name for name in directories if name not in ("__pycache__", AOT_DIRECTORY))
+        for name in sorted(files):
+            if name.endswith(".py"):
+                path = os.path.join(directory, name)
+                sha.update(os.path.relpath(path, root).encode())
+                sha.update(str(digest(path)).encode())
+    return sha.hexdigest()
+
+class _Loader:
+    # Finds the construction function compiled by pyappframework.ui.compiler for a View class. It is only
+    # used while the generated module was made from the same sources by the same framework, down to its
+    # own sources; otherwise the view is built from its body() as usual.
+    __slots__ = ("enabled", "builders", "modules", "digests")
+
+    def __init__(self):
+        self.enabled = True
+        self.builders: dict[type, Optional[Callable]] = {}
+        self.modules: dict[str, Optional[ModuleType]] = {}
+        self.digests: dict[str, Optional[str]] = {}
+
+    def lookup(self, cls: type) -> Optional[Callable]:
+        if not self.enabled:
+            return None
+        try:
+            return self.builders[cls]
+        except KeyError:
+            builder = self.builders[cls] = self.__load(cls)
+            return builder
+
+    def clear(self):
+        self.builders.clear()
+        self.modules.clear()
+        self.digests.clear()
+
+    def __load(self, cls: type) -> Optional[Callable]:
+        path = getattr(sys.modules.get(cls.__module__), "__file__", None)
+        if path is None:
+            return None
+        module = self.__module(generatedPath(path))
+        if module is None or module.VERSION != __version__ or getattr(module, "FRAMEWORK", None) != frameworkDigest():
+            return None
+        sources = module.SOURCES.get(cls.__qualname__)
+        if sources is None:
+            return None
+        directory = os.path.dirname(path)
+        for source, expected in sources.items():
+            source = os.path.normpath(os.path.join(directory, source))
+            if source not in self.digests:
+                self.digests[source] = digest(source)
+            if self.digests[source] != expected:
+                return None
+        return module.BUILDERS[cls.__qualname__]
+
+    def __module(self, path: str) -> Optional[ModuleType]:
+        if path in self.modules:
+            return self.modules[path]
+        module = None
+        if os.path.exists(path):
+            spec = importlib.util.spec_from_file_location(f"{AOT_DIRECTORY}.{os.path.splitext(os.path.basename(path))[0]}", path)
+            if spec is not None and spec.loader is not None:
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+        self.modules[path] = module
+        return module
+
+_loader = _Loader()
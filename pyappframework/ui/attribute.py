@@ -1,41 +1,125 @@
 # Library Imports
 import wx
 import abc
+import inspect
+import functools
 from typing import Callable, Optional, Generic, Any, TypeVar, Union
 
 # Internal Imports
-from ..decorators import event_handler
-from ..mutable import Mutable, MutationEvent
+from ..mutable import Mutable, MutableValue, MutationEvent, valueof
+from .layout import requestLayout
+from .router import bind
+from .build import _build
 
 # R: Generic type for root
 # P: Generic type for parent
 # T: Generic type for Target
 # V: Generic type for Value
+class _CallRecording:
+    # Attribute calls are only kept while descriptions that are compared or replayed later are made: the
+    # body() of reactive views, which the reconciler diffs, and the trees recorded by templates and the
+    # compiler. Nodes made anywhere else don't keep them.
+    __slots__ = ("depth",)
+
+    def __init__(self):
+        self.depth = 0
+
+    def __enter__(self):
+        self.depth += 1
+
+    def __exit__(self, *exc):
+        self.depth -= 1
+
+_recording = _CallRecording()
+
 R, P, T = (TypeVar("R"), TypeVar("P"), TypeVar("T"))
 class AttributeContainer(Generic[R, P, T]):
+    # While _recording is active, the constructor arguments (_props) and attribute calls are kept as a
+    # description of the node, which reactive views compare between renders. Other nodes keep neither;
+    # their _props is None, and they can't be compared.
+    # The empty __slots__ only keeps this class from adding a __dict__. The instance attributes are
+    # declared by slotted subclasses such as Control, since views such as Window also derive from wx
+    # classes with their own instance layout.
+    __slots__ = ()
+
+    def __new__(cls, *args, **kw):
+        self = super().__new__(cls)
+        self._props = (args, kw) if _recording.depth else None
+        return self
+
     def __init__(self):
-        self.__attrib_delegates = []
+        # Attributes are created on first use by their AttributeField; the call and delegate lists are
+        # shared empty tuples until the first attribute is called.
+        self._attributes: Optional[dict[str, "Attribute"]] = None
+        self._attribDelegates: Union[list, tuple] = ()
+        self._attribCalls: Union[list, tuple] = ()
 
     def addAttribDelegate(self, func: Callable[[R, P, T], None]):
-        self.__attrib_delegates.append(func)
+        if self._attribDelegates:
+            self._attribDelegates.append(func)
+        else:
+            self._attribDelegates = [func]
+
+    def addAttribCall(self, attribute: "Attribute", args: tuple, kw: dict):
+        if not _recording.depth:
+            return
+        if self._attribCalls:
+            self._attribCalls.append((attribute, args, kw))
+        else:
+            self._attribCalls = [(attribute, args, kw)]
 
     def runAttribDelegates(self, root: R, parent: P, target: T):
-        for delegate in self.__attrib_delegates:
+        for delegate in self._attribDelegates:
             delegate(root, parent, target)
 
 R, P, T = (TypeVar("R"), TypeVar("P"), TypeVar("T"))
 class AttributeHandler(Generic[R, P, T]):
+    # Handlers are shared by every instance of a class, so they must not keep per-object state.
     @abc.abstractmethod
     def _handle_value(self, obj: AttributeContainer[R, P, T], *args, **kw) -> Any:
         pass
 
+A = TypeVar("A", bound="Attribute")
+class AttributeField(Generic[A]):
+    # Declares an attribute on a container class. The Attribute itself is only created when the attribute
+    # is first accessed on an instance, and is kept in the instance's _attributes.
+    __slots__ = ("kind", "args", "name")
+
+    def __init__(self, kind: type[A], args: tuple):
+        self.kind = kind
+        self.args = args
+        self.name: Optional[str] = None
+
+    def __set_name__(self, owner: type, name: str):
+        self.name = name
+
+    def __get__(self, obj: Optional[AttributeContainer], owner: Optional[type] = None) -> A:
+        if obj is None:
+            return self  # type: ignore
+        attributes = obj._attributes
+        if attributes is None:
+            attributes = obj._attributes = {}
+        attribute = attributes.get(self.name)
+        if attribute is None:
+            attribute = attributes[self.name] = self.kind(obj, *self.args)
+            attribute.name = self.name
+        return attribute
+
 R, P, T = (TypeVar("R"), TypeVar("P"), TypeVar("T"))
 class Attribute(Generic[R, P, T]):
+    __slots__ = ("obj", "handler", "value", "count", "name")
+
     def __init__(self, obj: AttributeContainer[R, P, T], handler: Optional[AttributeHandler[R, P, T]] = None, default = None, count: int = -1):
         self.obj = obj
         self.handler = handler
         self.value = default
         self.count = count
+        self.name: Optional[str] = None
+
+    @classmethod
+    def field(cls, *args) -> AttributeField:
+        # args are passed to the constructor after the owning object.
+        return AttributeField(cls, args)
 
     def checkCount(self):
         if self.count >= 0:
@@ -44,6 +128,7 @@ class Attribute(Generic[R, P, T]):
 
     def __call__(self, *args, **kw) -> Any:
         self.checkCount()
+        self.obj.addAttribCall(self, args, kw)
         if self.handler is not None:
             self.value = self.handler._handle_value(self.obj, *args, **kw)
         else:
@@ -54,12 +139,15 @@ class Attribute(Generic[R, P, T]):
 
 R, P, T = (TypeVar("R"), TypeVar("P"), TypeVar("T"))
 class ArgumentAttribute(Generic[R, P, T], Attribute[R, P, T]):
+    __slots__ = ()
+
     def __init__(self, obj: AttributeContainer[R, P, T]):
         super().__init__(obj, None, None, 1)
         self.value = ((), {})
     
     def __call__(self, *args, **kw) -> Any:
         self.checkCount()
+        self.obj.addAttribCall(self, args, kw)
         self.value = (args, kw)
         return self.obj
     
@@ -70,11 +158,14 @@ class ArgumentAttribute(Generic[R, P, T], Attribute[R, P, T]):
 
 R, P, T, V = (TypeVar("R"), TypeVar("P"), TypeVar("T"), TypeVar("V"))
 class TypedAttribute(Generic[R, P, T, V], Attribute[R, P, T]):
+    __slots__ = ()
+
     def __init__(self, obj: AttributeContainer[R, P, T]):
         super().__init__(obj, None, None, 1)
 
     def __call__(self, val: V, /) -> Any:
         self.checkCount()
+        self.obj.addAttribCall(self, (val,), {})
         self.value = val
         return self.obj
 
@@ -91,7 +182,7 @@ class SizerChildAttributeHandler(AttributeHandler[wx.Window, wx.Window, wx.Windo
         def func(root: wx.Window, parent: wx.Window, target: wx.Window):
             parent_sizer = target.GetParent().GetSizer()
             if parent_sizer is not None:
-                parent_sizer.Add(target, *args, **kw)
+                _build.add(parent_sizer, target, args, kw)
         return func
 
 class FontAttributeHandler(AttributeHandler[wx.Window, wx.Window, wx.Window]):
@@ -111,8 +202,11 @@ class EventHandlerAttributeHandler(AttributeHandler[R, P, T]):
         obj.addAttribDelegate(self._delegate(evt, func))
 
     def _delegate(self, evt: wx.Event, handler: Callable[[wx.Event], None]):
+        if inspect.iscoroutinefunction(handler):
+            from ..aio import asyncHandler
+            handler = asyncHandler(handler)
         def func(root, parent, target):
-            root.Bind(evt, handler, target)
+            bind(root, evt, handler, target)
         return func
 
 R, P, T = (TypeVar("R"), TypeVar("P"), TypeVar("T"))
@@ -152,6 +246,8 @@ CONTENTS_LIST_INPUT_TYPE = list[Union[C, CONTENTS_LIST_TYPE[C]]]
 
 R, P, T, V = (TypeVar("R"), TypeVar("P"), TypeVar("T"), TypeVar("V"))
 class BodyAttribute(Generic[R, P, T, V], Attribute[R, P, T]):
+    __slots__ = ()
+
     def __init__(self, obj: AttributeContainer[R, P, T]):
         super().__init__(obj, None, [], 1)
 
@@ -172,22 +268,17 @@ class BodyAttribute(Generic[R, P, T, V], Attribute[R, P, T]):
         return self.value
 
 class VisibilityAttributeHandler(AttributeHandler[wx.Window, wx.Window, wx.Window]):
-    def __init__(self):
-        super().__init__()
-        self.__target = None
-
-    def _handle_value(self, obj: AttributeContainer[wx.Window, wx.Window, wx.Window], vm: Mutable[bool], /):
-        obj.addAttribDelegate(self._delegate(obj, vm))
+    def _handle_value(self, obj: AttributeContainer[wx.Window, wx.Window, wx.Window], vm: MutableValue[bool], /):
+        obj.addAttribDelegate(self._delegate(vm))
 
-    def _delegate(self, obj: AttributeContainer[wx.Window, wx.Window, wx.Window], vm: Mutable[bool]):
+    def _delegate(self, vm: MutableValue[bool]):
         def func(root: wx.Window, parent: wx.Window, target: wx.Window):
-            self.__target = target
-            vm.addListener(self._onValueChange)
-            target.Show(vm.value)
+            if isinstance(vm, Mutable):
+                vm.addListener(functools.partial(self._onValueChange, target), owner=target)
+            target.Show(valueof(vm))
         return func
 
-    @event_handler
-    def _onValueChange(self, evt: MutationEvent):
-        assert self.__target is not None
-        self.__target.Show(evt.newValue)
-        self.__target.GetParent().Layout()
+    def _onValueChange(self, target: wx.Window, evt: MutationEvent):
+        target.Show(evt.newValue)
+        requestLayout(target.GetParent())
+        evt.Skip()
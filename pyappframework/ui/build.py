@@ -0,0 +1,70 @@
+# Library Imports
+import wx
+from typing import Optional
+
+# Internal Imports
+from ..mutable import batch
+
+class _Build:
+    # State of the outermost PrimitiveView.initialize() call. While a tree is built, its top-level window
+    # is frozen, Mutable notifications and layout requests are batched, and sizer attributes only queue
+    # their Add(); the queue is flushed in order and the window the tree was built into is laid out once
+    # at the end. With enabled cleared, sizer items are added right away and nothing is frozen or batched;
+    # only the final layout is kept.
+    __slots__ = ("depth", "enabled", "pending", "window", "frozen", "batch", "layouts")
+
+    def __init__(self):
+        self.depth = 0
+        self.enabled = True
+        self.pending: list[tuple[wx.Sizer, wx.Window, tuple, dict]] = []
+        self.window: Optional[wx.Window] = None
+        self.frozen: Optional[wx.Window] = None
+        self.batch: Optional[batch] = None
+        self.layouts = 0
+
+    def begin(self, parent: wx.Window):
+        self.depth += 1
+        if self.depth > 1:
+            return
+        self.window = parent
+        if self.enabled:
+            self.frozen = wx.GetTopLevelParent(parent) or parent
+            self.frozen.Freeze()
+            self.batch = batch()
+            self.batch.__enter__()
+
+    def end(self, *exc):
+        self.depth -= 1
+        if self.depth:
+            return
+        window, frozen, transaction = self.window, self.frozen, self.batch
+        self.window = self.frozen = self.batch = None
+        try:
+            try:
+                self.flush()
+                if window and exc[0] is None:
+                    window.Layout()
+                    self.layouts += 1
+            finally:
+                if transaction is not None:
+                    transaction.__exit__(*exc)
+        finally:
+            if frozen:
+                frozen.Thaw()
+
+    def add(self, sizer: wx.Sizer, window: wx.Window, args: tuple, kw: dict):
+        if self.batch is not None:
+            self.pending.append((sizer, window, args, kw))
+        else:
+            sizer.Add(window, *args, **kw)
+
+    def flush(self):
+        # Sizers only keep their own children in order, so flushing early (to look up a sizer item of a
+        # window just built) never reorders anything.
+        while self.pending:
+            pending, self.pending = self.pending, []
+            for sizer, window, args, kw in pending:
+                if window:
+                    sizer.Add(window, *args, **kw)
+
+_build = _Build()
@@ -0,0 +1,166 @@
+# Library Imports
+import wx
+from wx import dataview as dv
+import collections
+from typing import Callable, Mapping, Optional, Union
+
+try:
+    import numpy as np
+except ImportError as ex:
+    raise ImportError("Required dependency numpy is not present") from ex
+
+# Internal Imports
+
+
+COLUMN_FORMAT = Union[str, Callable[["np.ndarray"], "np.ndarray"], None]
+
+class ColumnarModel(dv.DataViewVirtualListModel):
+    # A virtual list model over NumPy column arrays, which are never copied. Rows are shown through an index
+    # of base rows: None while the data is neither sorted nor filtered, otherwise a permutation from the
+    # argsort of the sort column (computed once per column) narrowed by the filter mask. The control only
+    # asks for the visible rows, which are formatted a block at a time, one vectorized call per column, and
+    # kept in a small LRU cache until the data, order or filter changes.
+    def __init__(self, columns: Union[Mapping[str, "np.ndarray"], "np.ndarray"], formats: Optional[Mapping[str, COLUMN_FORMAT]] = None, blockSize: int = 256, cachedBlocks: int = 32):
+        names, arrays = self.__split(columns)
+        super().__init__(len(arrays[0]) if arrays else 0)
+        self.__names = names
+        self.__columns = arrays
+        self.__rows = len(arrays[0]) if arrays else 0
+        self.__formats: dict[str, COLUMN_FORMAT] = dict(formats or {})
+        self.__blockSize = blockSize
+        self.__cachedBlocks = cachedBlocks
+        self.__blocks: collections.OrderedDict[tuple[int, int], list[str]] = collections.OrderedDict()
+        self.__orders: dict[int, "np.ndarray"] = {}
+        self.__index: Optional["np.ndarray"] = None
+        self.__mask: Optional["np.ndarray"] = None
+        self.__sortColumn: Optional[int] = None
+        self.__ascending = True
+
+    @staticmethod
+    def __split(columns: Union[Mapping[str, "np.ndarray"], "np.ndarray"]) -> tuple[list[str], list["np.ndarray"]]:
+        if isinstance(columns, np.ndarray):
+            if columns.dtype.names is None:
+                raise TypeError("A structured array or a mapping of column names to arrays is required")
+            columns = {name: columns[name] for name in columns.dtype.names}
+        arrays = [np.asarray(array) for array in columns.values()]
+        if any(array.ndim != 1 or len(array) != len(arrays[0]) for array in arrays):
+            raise ValueError("Columns must be one-dimensional arrays of the same length")
+        return list(columns), arrays
+
+    def __size(self) -> int:
+        return self.__rows if self.__index is None else len(self.__index)
+
+    def __invalidate(self):
+        self.__blocks.clear()
+        self.Reset(self.__size())
+
+    def __reindex(self):
+        order = None
+        if self.__sortColumn is not None:
+            order = self.__orders.get(self.__sortColumn)
+            if order is None:
+                # A stable sort is about three times slower on millions of rows; rows with equal keys are
+                # kept in no particular order.
+                order = self.__orders[self.__sortColumn] = np.argsort(self.__columns[self.__sortColumn])
+            if not self.__ascending:
+                order = order[::-1]
+        if self.__mask is None:
+            self.__index = order
+        elif order is None:
+            self.__index = np.flatnonzero(self.__mask)
+        else:
+            self.__index = order[self.__mask[order]]
+        self.__invalidate()
+
+    def setColumns(self, columns: Union[Mapping[str, "np.ndarray"], "np.ndarray"]):
+        # Replaces the data; the sort column and filter are kept if they still apply.
+        names = self.__names
+        self.__names, self.__columns = self.__split(columns)
+        self.__rows = len(self.__columns[0]) if self.__columns else 0
+        self.__orders.clear()
+        if self.__names != names:
+            self.__sortColumn = None
+        if self.__mask is not None and len(self.__mask) != self.__rows:
+            self.__mask = None
+        self.__reindex()
+
+    def columnNames(self) -> list[str]:
+        return list(self.__names)
+
+    def column(self, name: str) -> "np.ndarray":
+        return self.__columns[self.__names.index(name)]
+
+    def sort(self, column: Union[str, int, None], ascending: bool = True):
+        self.__sortColumn = self.__names.index(column) if isinstance(column, str) else column
+        self.__ascending = ascending
+        self.__reindex()
+
+    def sortColumn(self) -> tuple[Optional[int], bool]:
+        return self.__sortColumn, self.__ascending
+
+    def filter(self, mask: Optional["np.ndarray"]):
+        # mask is a boolean array over the rows of the data, e.g. model.column("price") > 100.
+        if mask is not None:
+            mask = np.asarray(mask, dtype=bool)
+            if mask.shape != (self.__rows,):
+                raise ValueError(f"The mask must have one element for each of the {self.__rows} rows")
+        self.__mask = mask
+        self.__reindex()
+
+    def dataRow(self, row: int) -> int:
+        # The row of the data shown in a row of the control.
+        return row if self.__index is None else int(self.__index[row])
+
+    def dataRows(self) -> "np.ndarray":
+        return np.arange(self.__rows) if self.__index is None else self.__index
+
+    def __format(self, col: int, values: "np.ndarray") -> list[str]:
+        fmt = self.__formats.get(self.__names[col])
+        if fmt is None:
+            strings = values.astype(str)
+        elif isinstance(fmt, str):
+            strings = np.char.mod(fmt, values)
+        else:
+            strings = fmt(values)
+        return strings.tolist() if isinstance(strings, np.ndarray) else list(strings)
+
+    def __block(self, col: int, block: int) -> list[str]:
+        key = (col, block)
+        strings = self.__blocks.get(key)
+        if strings is not None:
+            self.__blocks.move_to_end(key)
+            return strings
+        start = block * self.__blockSize
+        stop = min(start + self.__blockSize, self.__size())
+        column = self.__columns[col]
+        values = column[start:stop] if self.__index is None else column[self.__index[start:stop]]
+        strings = self.__blocks[key] = self.__format(col, values)
+        if len(self.__blocks) > self.__cachedBlocks:
+            self.__blocks.popitem(last=False)
+        return strings
+
+    def GetColumnCount(self) -> int:
+        return len(self.__columns)
+
+    def GetColumnType(self, col: int) -> str:
+        return "string"
+
+    def GetValueByRow(self, row: int, col: int) -> str:
+        return self.__block(col, row // self.__blockSize)[row % self.__blockSize]
+
+    def attach(self, dvc: dv.DataViewCtrl):
+        # Adds a text column for each data column if the control has none, and sorts by a column when its
+        # header is clicked, toggling the direction on further clicks.
+        if dvc.GetColumnCount() == 0:
+            for col, name in enumerate(self.__names):
+                dvc.AppendTextColumn(name, col, flags=dv.DATAVIEW_COL_SORTABLE | dv.DATAVIEW_COL_RESIZABLE)
+        def onHeaderClick(evt: dv.DataViewEvent):
+            col = evt.GetColumn()
+            column = dvc.GetColumn(col)
+            if column is None:
+                evt.Skip()
+                return
+            ascending = not self.__ascending if self.__sortColumn == column.GetModelColumn() else True
+            self.sort(column.GetModelColumn(), ascending)
+            column.SetSortOrder(ascending)
+        dvc.Bind(dv.EVT_DATAVIEW_COLUMN_HEADER_CLICK, onHeaderClick)
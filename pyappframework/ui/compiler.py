@@ -0,0 +1,331 @@
+# Library Imports
+import wx
+import os
+import sys
+import enum
+import inspect
+import argparse
+import importlib
+import sysconfig
+from typing import Any, Optional
+
+# Internal Imports
+from .. import __version__
+from .attribute import AttributeContainer, BodyAttribute, _recording
+from .view import View
+from .template import _Unsupported, _sizerFactory
+from .aot import AOT_DIRECTORY, generatedPath, digest, frameworkDigest
+
+
+class _Method:
+    # A method of the view, looked up on the stand-in for self. Called, it runs with the stand-in; passed as
+    # a value, e.g. as an event handler, it becomes an attribute of the view in the generated code.
+    __slots__ = ("view", "name", "func")
+
+    def __init__(self, view: "_Self", name: str, func: Any):
+        self.view = view
+        self.name = name
+        self.func = func
+
+    def __call__(self, *args, **kw):
+        return self.func(self.view, *args, **kw)
+
+class _Self:
+    # Stands in for self while body() is evaluated. Only methods defined on the class can be used, since
+    # anything else read from the instance could differ between instances.
+    def __init__(self, cls: type):
+        object.__setattr__(self, "_Self__cls", cls)
+
+    def __getattr__(self, name: str):
+        value = inspect.getattr_static(self.__cls, name, None)
+        if inspect.isfunction(value):
+            return _Method(self, name, value)
+        raise _Unsupported(f"body() reads self.{name}, which is not a method")
+
+    def __setattr__(self, name: str, value: Any):
+        raise _Unsupported(f"body() assigns self.{name}")
+
+def _controls() -> dict[type, str]:
+    from ._controls.panel import Panel
+    from ._controls.staticbox import StaticBox
+    from ._controls.statictext import StaticText
+    from ._controls.button import Button
+    from ._controls.staticline import StaticLine
+    from ._controls.gauge import Gauge
+    return {Panel: "Panel", StaticBox: "StaticBox", StaticText: "StaticText", Button: "Button", StaticLine: "StaticLine", Gauge: "Gauge"}
+
+def _eventBinders() -> dict[int, str]:
+    return {id(value): f"wx.{name}" for name, value in vars(wx).items() if isinstance(value, wx.PyEventBinder)}
+
+class _Emitter:
+    # Writes the construction of a description tree as one statement per wx call, in the order the
+    # declarative build makes them: a control, then its children, then its attributes.
+    def __init__(self):
+        self.lines: list[str] = []
+        self.imports: set[str] = set()
+        self.count = 0
+        self.controls = _controls()
+        self.binders = _eventBinders()
+
+    def name(self, prefix: str) -> str:
+        self.count += 1
+        return f"{prefix}{self.count}"
+
+    def constant(self, value: Any) -> str:
+        if isinstance(value, enum.Enum):
+            return f"{self.function(type(value))}.{value.name}"
+        if isinstance(value, tuple):
+            return f"({''.join(self.constant(item) + ', ' for item in value)})"
+        if value is None or type(value) in (bool, int, float, str, bytes):
+            return repr(value)
+        raise _Unsupported(f"{value!r} can't be written as a constant")
+
+    def function(self, value: Any) -> str:
+        if isinstance(value, _Method):
+            return f"view.{value.name}"
+        module, qualname = getattr(value, "__module__", None), getattr(value, "__qualname__", "<locals>")
+        if module is None or "<" in qualname or module == "__main__":
+            raise _Unsupported(f"{value!r} can't be imported by the generated code")
+        target: Any = sys.modules.get(module)
+        for part in qualname.split("."):
+            target = getattr(target, part, None)
+        if target is not value:
+            raise _Unsupported(f"{value!r} can't be imported by the generated code")
+        self.imports.add(module)
+        return f"{module}.{qualname}"
+
+    def arguments(self, args: tuple, kw: dict, *leading: str) -> str:
+        return ", ".join([*leading, *(self.constant(arg) for arg in args), *(f"{key}={self.constant(arg)}" for key, arg in kw.items())])
+
+    def node(self, node: Any, parent: str, sizer: Optional[str]) -> str:
+        kind = self.controls.get(type(node))
+        if kind is None:
+            raise _Unsupported(f"{type(node).__qualname__} is not supported")
+        if node._props is None:
+            raise _Unsupported(f"a {type(node).__qualname__} was made outside of body()")
+        args, kw = node._props
+        window = self.name("w")
+        if kind in ("Panel", "StaticBox"):
+            self.container(node, kind, window, parent, args, kw)
+        elif kind == "StaticText":
+            label = inspect.signature(type(node).__init__).bind(node, *args, **kw).arguments["label"]
+            self.lines.append(f"{window} = wx.StaticText({parent})")
+            self.lines.append(f"{window}.SetLabelText({self.constant(label)})")
+        elif kind == "Gauge":
+            kw = dict(kw)
+            value = kw.pop("value", None)
+            self.lines.append(f"{window} = wx.Gauge({self.arguments(args, kw, parent)})")
+            if value is not None:
+                self.lines.append(f"{window}.SetValue({self.constant(value)})")
+        else:
+            self.lines.append(f"{window} = wx.{kind}({self.arguments(args, kw, parent)})")
+        self.attributes(node, window, parent, sizer)
+        return window
+
+    def container(self, node: Any, kind: str, window: str, parent: str, args: tuple, kw: dict):
+        sizer, args = args[0], args[1:]
+        kw = dict(kw)
+        label = kw.pop("label", None) if kind == "Panel" else None
+        self.lines.append(f"{window} = wx.{kind}({self.arguments(args, kw, parent)})")
+        if label is not None:
+            self.lines.append(f"{window}.SetLabel({self.constant(label)})")
+        factory, sizerArgs = _sizerFactory(sizer)
+        childSizer = self.name("s")
+        self.lines.append(f"{childSizer} = wx.{factory.__name__}({self.arguments(sizerArgs, {})})")
+        self.lines.append(f"{window}.SetSizer({childSizer})")
+        body = node.body.value if isinstance(node.body, BodyAttribute) else None
+        for child in body or ():
+            self.node(child, window, childSizer)
+
+    def attributes(self, node: AttributeContainer, window: str, parent: str, sizer: Optional[str]):
+        for attribute, args, kw in node._attribCalls:
+            if attribute.name == "sizer":
+                if sizer is not None:
+                    self.lines.append(f"{sizer}.Add({self.arguments(args, kw, window)})")
+                else:
+                    # The sizer of the window the tree is built into is only known when it is built.
+                    self.lines.append(f"if {parent}.GetSizer() is not None:")
+                    self.lines.append(f"    {parent}.GetSizer().Add({self.arguments(args, kw, window)})")
+            elif attribute.name == "eventHandler":
+                evt, handler = args
+                if id(evt) not in self.binders:
+                    raise _Unsupported(f"{evt!r} is not an event binder of the wx module")
+                if inspect.iscoroutinefunction(getattr(handler, "func", handler)):
+                    raise _Unsupported("coroutine event handlers are not supported")
+                self.lines.append(f"bind(root, {self.binders[id(evt)]}, {self.function(handler)}, {window})")
+            elif attribute.name == "export":
+                if not args[0].isidentifier():
+                    raise _Unsupported(f"{args[0]!r} is not an identifier")
+                self.lines.append(f"root.{args[0]} = {window}")
+            elif attribute.name == "visible":
+                self.lines.append(f"{window}.Show({self.constant(args[0])})")
+            elif attribute.name == "tooltip":
+                self.lines.append(f"{window}.SetToolTip({self.constant(args[0])})")
+            elif attribute.name == "rawModifier":
+                self.lines.append(f"{self.function(args[0])}({window})")
+            elif attribute.name != "key":
+                raise _Unsupported(f"the {attribute.name} attribute is not supported")
+
+def _real(path: str) -> str:
+    return os.path.normcase(os.path.realpath(path))
+
+def _libraryPrefixes() -> list[str]:
+    return [_real(sysconfig.get_path(name)) + os.sep for name in ("stdlib", "platstdlib", "purelib", "platlib")]
+
+_FRAMEWORK = _real(os.path.dirname(os.path.dirname(__file__))) + os.sep
+
+# Builtins whose results depend on their arguments only. Any other call body() makes outside of its own
+# modules and the framework, like gettext's _(), os.environ.get() or wx.GetDisplaySize(), may return
+# something else on another machine or in another environment, while the generated code would keep the
+# value it returned at compile time.
+_PURE_BUILTINS = {id(func) for func in (len, min, max, abs, round, sum, sorted, any, all, divmod, pow, repr, format, chr, ord, hex, oct, bin, isinstance, issubclass)}
+_PURE_TYPES = (str, bytes, int, float, complex, tuple, list, dict, set, frozenset)
+
+class _Calls:
+    # Profiles body(), recording the files of the functions it calls (its dependencies) and the calls
+    # from code outside the standard library, installed packages and the framework, into them or into
+    # builtins, whose results can't be relied on once compiled.
+    def __init__(self):
+        self.files: set[str] = set()
+        self.impure: list[str] = []
+        self.library = _libraryPrefixes()
+        self.__user: dict[str, bool] = {}
+
+    def isLibrary(self, path: str) -> bool:
+        # An installed framework is under a library prefix too, but calls into it are what body() is made of.
+        if path.startswith("<frozen"):
+            return True
+        real = _real(path)
+        return not real.startswith(_FRAMEWORK) and any(real.startswith(prefix) for prefix in self.library)
+
+    def isUser(self, frame: Any) -> bool:
+        if frame is None:
+            return False
+        path = frame.f_code.co_filename
+        user = self.__user.get(path)
+        if user is None:
+            user = self.__user[path] = not self.isLibrary(path) and not _real(path).startswith(_FRAMEWORK)
+        return user
+
+    def __call__(self, frame: Any, event: str, arg: Any):
+        if event == "call":
+            self.files.add(frame.f_code.co_filename)
+            if self.isUser(frame.f_back) and self.isLibrary(frame.f_code.co_filename):
+                self.impure.append(frame.f_code.co_name)
+        elif event == "c_call" and self.isUser(frame):
+            if id(arg) not in _PURE_BUILTINS and not isinstance(getattr(arg, "__self__", None), _PURE_TYPES):
+                self.impure.append(getattr(arg, "__qualname__", repr(arg)))
+
+def _sources(cls: type, called: set[str]) -> dict[str, str]:
+    # The files the generated code depends on: the modules of the class, its bases and the functions body()
+    # called, except for the framework (whose version is checked), the standard library and installed
+    # packages.
+    excluded = _libraryPrefixes() + [_FRAMEWORK]
+    source = inspect.getsourcefile(cls)
+    assert source is not None
+    files = {inspect.getsourcefile(klass) for klass in cls.__mro__[1:] if klass.__module__ != "builtins"} | called
+    sources = {os.path.basename(source): digest(source)}
+    for path in sorted(filter(None, files)):
+        if os.path.exists(path) and not any(_real(path).startswith(prefix) for prefix in excluded):
+            sources[os.path.relpath(path, os.path.dirname(source))] = digest(path)
+    return sources
+
+def compileView(cls: type) -> tuple[list[str], set[str], dict[str, str]]:
+    # Returns the body of the construction function, the modules it imports and the sources it was made from.
+    # body() is evaluated once, here: values it reads from module globals (wx.Platform, a configuration
+    # loaded at import time...) are frozen into the generated code, which is only checked against the
+    # hashes of its sources. Calls whose results could differ at run time are rejected (see _Calls).
+    if not (isinstance(cls, type) and issubclass(cls, View)):
+        raise _Unsupported(f"{cls!r} is not a View")
+    if cls.reactive:
+        raise _Unsupported("reactive views are rebuilt from body() and can't be compiled")
+    calls = _Calls()
+    previous = sys.getprofile()
+    sys.setprofile(calls)
+    try:
+        with _recording:
+            description = cls.body(_Self(cls))
+    except _Unsupported:
+        raise
+    except Exception as e:
+        raise _Unsupported(f"body() failed without an instance: {e!r}") from e
+    finally:
+        sys.setprofile(previous)
+    if calls.impure:
+        raise _Unsupported(f"body() calls {', '.join(sorted(set(calls.impure)))}, whose results would be frozen")
+    emitter = _Emitter()
+    window = emitter.node(description, "parent", None)
+    emitter.lines.append(f"return {window}")
+    return emitter.lines, emitter.imports, _sources(cls, calls.files)
+
+def generate(compiled: dict[type, tuple[list[str], set[str], dict[str, str]]]) -> str:
+    functions, imports, sources = [], {"wx"}, {}
+    for n, (cls, (lines, modules, files)) in enumerate(compiled.items()):
+        imports.update(modules)
+        sources[cls.__qualname__] = files
+        functions.append((cls.__qualname__, f"build{n}", lines))
+    out = [
+        f"# Generated by python -m pyappframework.ui.compiler from {next(iter(compiled)).__module__}; do not edit.",
+        "# The views are built from body() again once any of the sources below change.",
+        *(f"import {module}" for module in sorted(imports)),
+        "from pyappframework.ui.router import bind",
+        "",
+        f"VERSION = {__version__!r}",
+        f"FRAMEWORK = {frameworkDigest()!r}",
+        f"SOURCES = {sources!r}",
+    ]
+    for qualname, name, lines in functions:
+        out += ["", f"def {name}(view, root, parent):  # {qualname}", *(f"    {line}" for line in lines)]
+    out += ["", "BUILDERS = {" + ", ".join(f"{qualname!r}: {name}" for qualname, name, _ in functions) + "}", ""]
+    return "\n".join(out)
+
+def compileModule(module: Any, names: Optional[list[str]] = None) -> tuple[Optional[str], dict[str, str]]:
+    # Compiles the named views of a module (all the views it defines by default) and writes the generated
+    # module. Returns its path, if anything was compiled, and why the other views were not.
+    candidates = []
+    for name, value in vars(module).items():
+        if isinstance(value, type) and issubclass(value, View) and value.__module__ == module.__name__ and (names is None or name in names):
+            candidates.append(value)
+    if names is not None:
+        missing = set(names) - {cls.__name__ for cls in candidates}
+        if missing:
+            raise _Unsupported(f"{', '.join(sorted(missing))} not found in {module.__name__}")
+    compiled, skipped = {}, {}
+    for cls in candidates:
+        try:
+            compiled[cls] = compileView(cls)
+        except _Unsupported as e:
+            skipped[cls.__qualname__] = str(e)
+    path = generatedPath(module.__file__)
+    if not compiled:
+        return None, skipped
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as file:
+        file.write(generate(compiled))
+    return path, skipped
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python -m pyappframework.ui.compiler",
+                                     description=f"Compiles the body() of views into construction code written to {AOT_DIRECTORY}/ next to their module.")
+    parser.add_argument("targets", nargs="+", help="module or module:Class to compile")
+    args = parser.parse_args(argv)
+    sys.path.insert(0, os.getcwd())
+    status = 0
+    for target in args.targets:
+        moduleName, _, className = target.partition(":")
+        module = importlib.import_module(moduleName)
+        try:
+            path, skipped = compileModule(module, className.split(",") if className else None)
+        except _Unsupported as e:
+            print(f"{target}: {e}", file=sys.stderr)
+            status = 1
+            continue
+        for qualname, reason in skipped.items():
+            print(f"{moduleName}:{qualname} was not compiled: {reason}", file=sys.stderr)
+            status = 1 if className else status
+        if path is not None:
+            print(f"wrote {path}")
+    return status
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -1,21 +1,86 @@
-from ._controls.button import Button
-from ._controls.panel import Panel
-from ._controls.splitterwindow import SplitterWindow, Orientation
-from ._controls.statictext import StaticText
-from ._controls.staticbox import StaticBox
-from ._controls.staticline import StaticLine
-from ._controls.staticbitmap import StaticBitmap
-from ._controls.textctrl import TextCtrl
-from ._controls.toolbar import NormalTool, ControlTool, RadioTool, ToolSeparator, ToolSpacer, ToolBar
-from ._controls.treectrl import TreeCtrl
-from ._controls.dataviewctrl import DataViewCtrl
-from ._controls.notebook import Notebook
-from ._controls.checkbox import CheckBox
-from ._controls.listbox import ListBox
-from ._controls.choice import Choice
-from ._controls.scrollablepanel import ScrollablePanel
-from ._controls.collapsiblepanel import CollapsiblePanel
-from ._controls.gauge import Gauge
-from ._controls.infobar import InfoBar
-from ._controls.searchctrl import SearchCtrl
-from ._controls.webview import WebView
+# Library Imports
+import importlib
+from typing import TYPE_CHECKING
+
+# Controls are imported on first use, so applications only load the modules (and the wx extension
+# modules behind them, like wx.html2 or wx.dataview) of the controls they use. Plot and GLView need
+# matplotlib and PyOpenGL, which are only required once they are used.
+_MODULES = {
+    "Button": "button",
+    "Panel": "panel",
+    "SplitterWindow": "splitterwindow",
+    "Orientation": "splitterwindow",
+    "StaticText": "statictext",
+    "StaticBox": "staticbox",
+    "StaticLine": "staticline",
+    "StaticBitmap": "staticbitmap",
+    "TextCtrl": "textctrl",
+    "NormalTool": "toolbar",
+    "ControlTool": "toolbar",
+    "RadioTool": "toolbar",
+    "ToolSeparator": "toolbar",
+    "ToolSpacer": "toolbar",
+    "ToolBar": "toolbar",
+    "TreeCtrl": "treectrl",
+    "DataViewCtrl": "dataviewctrl",
+    "Notebook": "notebook",
+    "CheckBox": "checkbox",
+    "ListBox": "listbox",
+    "Choice": "choice",
+    "ScrollablePanel": "scrollablepanel",
+    "CollapsiblePanel": "collapsiblepanel",
+    "Gauge": "gauge",
+    "InfoBar": "infobar",
+    "SearchCtrl": "searchctrl",
+    "WebView": "webview",
+    "Lazy": "lazy",
+    "VirtualList": "virtuallist",
+    "VirtualListBox": "virtuallistbox",
+    "ForEach": "foreach",
+    "Plot": "plot",
+    "GLView": "glcanvas",
+}
+
+_OPTIONAL = {"plot", "glcanvas"}
+
+__all__ = [name for name, module in _MODULES.items() if module not in _OPTIONAL]
+
+def __getattr__(name: str):
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"._controls.{module}", __package__), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_MODULES))
+
+if TYPE_CHECKING:
+    from ._controls.button import Button
+    from ._controls.panel import Panel
+    from ._controls.splitterwindow import SplitterWindow, Orientation
+    from ._controls.statictext import StaticText
+    from ._controls.staticbox import StaticBox
+    from ._controls.staticline import StaticLine
+    from ._controls.staticbitmap import StaticBitmap
+    from ._controls.textctrl import TextCtrl
+    from ._controls.toolbar import NormalTool, ControlTool, RadioTool, ToolSeparator, ToolSpacer, ToolBar
+    from ._controls.treectrl import TreeCtrl
+    from ._controls.dataviewctrl import DataViewCtrl
+    from ._controls.notebook import Notebook
+    from ._controls.checkbox import CheckBox
+    from ._controls.listbox import ListBox
+    from ._controls.choice import Choice
+    from ._controls.scrollablepanel import ScrollablePanel
+    from ._controls.collapsiblepanel import CollapsiblePanel
+    from ._controls.gauge import Gauge
+    from ._controls.infobar import InfoBar
+    from ._controls.searchctrl import SearchCtrl
+    from ._controls.webview import WebView
+    from ._controls.lazy import Lazy
+    from ._controls.virtuallist import VirtualList
+    from ._controls.virtuallistbox import VirtualListBox
+    from ._controls.foreach import ForEach
+    from ._controls.plot import Plot
+    from ._controls.glcanvas import GLView
@@ -0,0 +1,87 @@
+# Library Imports
+import wx
+
+class LayoutScheduler:
+    # Windows whose layout is out of date are only marked dirty; a single pass queued with wx.CallAfter()
+    # lays them out on the next event loop iteration. The pass freezes each top-level window once and lays
+    # out its dirty windows ancestors first. A dirty descendant that changed size meanwhile was already laid
+    # out by its own size event, so it is skipped. With enabled cleared, windows are laid out right away.
+    __slots__ = ("enabled", "dirty", "scheduled", "requests", "coalesced", "passes", "layouts")
+
+    def __init__(self):
+        self.enabled = True
+        self.dirty: dict[int, wx.Window] = {}
+        self.scheduled = False
+        self.reset()
+
+    def reset(self):
+        self.requests = 0
+        self.coalesced = 0
+        self.passes = 0
+        self.layouts = 0
+
+    def invalidate(self, window: wx.Window):
+        if not window:
+            return
+        self.requests += 1
+        if not self.enabled:
+            window.Layout()
+            self.layouts += 1
+            return
+        if id(window) in self.dirty:
+            self.coalesced += 1
+            return
+        self.dirty[id(window)] = window
+        if not self.scheduled:
+            self.scheduled = True
+            wx.CallAfter(self.flush)
+
+    def flush(self):
+        self.scheduled = False
+        while self.dirty:
+            dirty, self.dirty = self.dirty, {}
+            self.passes += 1
+            groups: dict[int, list[tuple[int, wx.Window]]] = {}
+            for window in dirty.values():
+                if not window:
+                    continue
+                depth, top = 0, window
+                while not top.IsTopLevel() and top.GetParent():
+                    top = top.GetParent()
+                    depth += 1
+                groups.setdefault(id(top), []).append((depth, window))
+            for windows in groups.values():
+                self.__layout(dirty, windows)
+
+    def __layout(self, dirty: dict[int, wx.Window], windows: list[tuple[int, wx.Window]]):
+        windows.sort(key=lambda entry: entry[0])
+        sizes = {id(window): window.GetSize() for _, window in windows}
+        top = wx.GetTopLevelParent(windows[0][1]) or windows[0][1]
+        top.Freeze()
+        try:
+            for _, window in windows:
+                if not window:
+                    continue
+                if window.GetSize() != sizes[id(window)] and self.__hasDirtyAncestor(dirty, window):
+                    self.coalesced += 1
+                    continue
+                window.Layout()
+                self.layouts += 1
+        finally:
+            if top:
+                top.Thaw()
+
+    @staticmethod
+    def __hasDirtyAncestor(dirty: dict[int, wx.Window], window: wx.Window) -> bool:
+        while not window.IsTopLevel():
+            window = window.GetParent()
+            if not window:
+                return False
+            if id(window) in dirty:
+                return True
+        return False
+
+layoutScheduler = LayoutScheduler()
+
+def requestLayout(window: wx.Window):
+    layoutScheduler.invalidate(window)
@@ -33,10 +33,11 @@ class MenuComponent(AttributeContainer[wx.Window, Optional["MenuComponent"], MEN
         pass
 
 class Menu(MenuComponent):
+    body = attr.BodyAttribute.field()
+
     def __init__(self, *args, **kw):
         super().__init__()
         self.__init_args = (args, kw)
-        self.body = attr.BodyAttribute(self)
 
     def _initialize(self, root: wx.MenuBar, parent: Optional[MenuComponent]) -> wx.Menu:
         menu = wx.Menu()
@@ -55,10 +56,11 @@ class Menu(MenuComponent):
         return menu
 
 class MenuItem(MenuComponent):
+    eventHandler = attr.Attribute.field(attr.EventHandlerAttributeHandler[wx.Window, Optional[MenuComponent], MENUBAR_TYPES]())
+
     def __init__(self, *args, **kw):
         super().__init__()
         self.__init_args = (args, kw)
-        self.eventHandler = attr.Attribute(self, attr.EventHandlerAttributeHandler[wx.Window, Optional[MenuComponent], MENUBAR_TYPES]())
 
     def _initialize(self, root: wx.MenuBar, parent: Optional[MenuComponent]) -> wx.MenuItem:
         assert parent is not None
@@ -0,0 +1,353 @@
+# Library Imports
+import wx
+import difflib
+import inspect
+import types
+import functools
+from typing import Any, Callable, Optional
+
+# Internal Imports
+from .attribute import AttributeContainer, BodyAttribute
+from .view import PrimitiveView, View, _BuildRoot
+from .build import _build
+from ..mutable import Mutable, batch
+from .layout import requestLayout
+from .router import bind, unbind
+
+
+def sameValue(a: Any, b: Any) -> bool:
+    # Descriptions are rebuilt on every render, so values are compared structurally: functions by code
+    # and captured variables, sizers by their layout parameters and nested views by their description.
+    if a is b:
+        return True
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, (tuple, list)):
+        return len(a) == len(b) and all(sameValue(x, y) for x, y in zip(a, b))
+    if isinstance(a, dict):
+        return a.keys() == b.keys() and all(sameValue(a[key], b[key]) for key in a)
+    if isinstance(a, types.FunctionType):
+        return a.__code__ is b.__code__ and sameValue(a.__defaults__, b.__defaults__) and _sameClosure(a.__closure__, b.__closure__)
+    if isinstance(a, types.MethodType):
+        return a.__func__ is b.__func__ and a.__self__ is b.__self__
+    if isinstance(a, wx.Sizer):
+        return _sameSizer(a, b)
+    if isinstance(a, AttributeContainer):
+        return _sameDescription(a, b)
+    if isinstance(a, Mutable):
+        return False
+    try:
+        return bool(a == b)
+    except Exception:
+        return False
+
+def _sameClosure(a: Optional[tuple], b: Optional[tuple]) -> bool:
+    if a is None or b is None:
+        return a is b
+    return len(a) == len(b) and all(x.cell_contents is y.cell_contents for x, y in zip(a, b))
+
+def _sameSizer(a: wx.Sizer, b: wx.Sizer) -> bool:
+    if isinstance(a, wx.BoxSizer):
+        return a.GetOrientation() == b.GetOrientation()
+    if isinstance(a, wx.GridSizer):
+        return (a.GetRows(), a.GetCols(), a.GetVGap(), a.GetHGap()) == (b.GetRows(), b.GetCols(), b.GetVGap(), b.GetHGap())
+    return True
+
+def _sameDescription(a: AttributeContainer, b: AttributeContainer) -> bool:
+    # Nodes made while descriptions weren't recorded have none to compare.
+    if a._props is None or b._props is None:
+        return False
+    return sameValue(a._props, b._props) and _sameCalls(a, b) and sameValue(_children(a), _children(b))
+
+def _attributeCalls(node: AttributeContainer) -> dict[Optional[str], list[tuple[tuple, dict]]]:
+    calls: dict[Optional[str], list[tuple[tuple, dict]]] = {}
+    for attribute, args, kw in node._attribCalls:
+        calls.setdefault(attribute.name, []).append((args, kw))
+    return calls
+
+def _sameCalls(a: AttributeContainer, b: AttributeContainer) -> bool:
+    # Fast path for the common case of unchanged attributes, without building the name map.
+    if len(a._attribCalls) != len(b._attribCalls):
+        return False
+    for (x, xArgs, xKw), (y, yArgs, yKw) in zip(a._attribCalls, b._attribCalls):
+        if x.name != y.name or type(x.handler) is not type(y.handler):
+            return False
+        if not (sameValue(xArgs, yArgs) and sameValue(xKw, yKw)):
+            return False
+    return True
+
+def _signature(node: AttributeContainer) -> tuple:
+    # Children are matched by type and by their key or export id, if they have one.
+    key = None
+    for attribute, args, kw in node._attribCalls:
+        if attribute.name == "key":
+            key = ("key", args[0])
+            break
+        if key is None and attribute.name == "export":
+            key = ("export", args[0])
+    return (type(node), key)
+
+def _opcodes(a: list, b: list) -> list[tuple[str, int, int, int, int]]:
+    # SequenceMatcher is quadratic on runs of equal signatures, so the common prefix and suffix, which is
+    # usually everything, are matched directly.
+    start = 0
+    while start < len(a) and start < len(b) and a[start] == b[start]:
+        start += 1
+    end = 0
+    while end < len(a) - start and end < len(b) - start and a[-1 - end] == b[-1 - end]:
+        end += 1
+    opcodes = [("equal", 0, start, 0, start)] if start else []
+    if start < len(a) - end or start < len(b) - end:
+        matcher = difflib.SequenceMatcher(None, a[start:len(a) - end], b[start:len(b) - end], autojunk=False)
+        opcodes.extend((tag, i1 + start, i2 + start, j1 + start, j2 + start) for tag, i1, i2, j1, j2 in matcher.get_opcodes())
+    if end:
+        opcodes.append(("equal", len(a) - end, len(a), len(b) - end, len(b)))
+    return opcodes
+
+def _children(node: AttributeContainer) -> list:
+    if isinstance(node, View):
+        return [node._getBody()]
+    body = getattr(node, "body", None)
+    if isinstance(body, BodyAttribute) and isinstance(body.value, list):
+        return body.value
+    return []
+
+def _setChildren(node: AttributeContainer, children: list):
+    if isinstance(node, View):
+        node._setBody(children[0])
+    else:
+        node.body.value = children
+
+def _childContainer(node: PrimitiveView) -> Optional[wx.Window]:
+    # The window children are created in, if children can be inserted into and removed from its sizer.
+    window = node.getWxInstance()
+    if isinstance(node, View):
+        return window.GetParent()
+    if isinstance(window, wx.CollapsiblePane):
+        window = window.GetPane()
+    return window if window.GetSizer() is not None else None
+
+_signatures: dict[type, inspect.Signature] = {}
+
+def _arguments(node: AttributeContainer) -> Optional[dict[str, Any]]:
+    cls = type(node)
+    signature = _signatures.get(cls)
+    if signature is None:
+        signature = _signatures[cls] = inspect.signature(cls.__init__)
+    args, kw = node._props
+    try:
+        bound = signature.bind(node, *args, **kw)
+    except TypeError:
+        return None
+    arguments = dict(bound.arguments)
+    for name, parameter in signature.parameters.items():
+        if parameter.kind is inspect.Parameter.VAR_KEYWORD and name in arguments:
+            arguments.update(arguments.pop(name))
+    del arguments[next(iter(signature.parameters))]
+    return arguments
+
+def _sizerIndex(sizer: wx.Sizer, window: wx.Window) -> Optional[int]:
+    for index, item in enumerate(sizer.GetChildren()):
+        if item.GetWindow() is window:
+            return index
+    return None
+
+def _place(container: wx.Window, window: wx.Window, before: Optional[wx.Window]):
+    # A new window is added at the end of the sizer by its sizer attribute; move it in front of before.
+    sizer = container.GetSizer()
+    if sizer is None or before is None:
+        return
+    _build.flush()
+    item = sizer.GetItem(window)
+    index = _sizerIndex(sizer, before)
+    if item is None or index is None:
+        return
+    flags = (item.GetProportion(), item.GetFlag(), item.GetBorder())
+    sizer.Detach(window)
+    sizer.Insert(index, window, *flags)
+
+def _patchSizer(reconciler: "Reconciler", node: PrimitiveView, old: tuple, new: tuple) -> Optional[Callable[[], None]]:
+    def action():
+        window = node.getWxInstance()
+        sizer = window.GetParent().GetSizer()
+        index = _sizerIndex(sizer, window) if sizer is not None else None
+        if index is not None:
+            sizer.Detach(window)
+            sizer.Insert(index, window, *new[0], **new[1])
+    return action
+
+def _patchVisible(reconciler: "Reconciler", node: PrimitiveView, old: tuple, new: tuple) -> Optional[Callable[[], None]]:
+    if isinstance(old[0][0], Mutable) or isinstance(new[0][0], Mutable):
+        return None
+    def action():
+        window = node.getWxInstance()
+        window.Show(new[0][0])
+        requestLayout(window.GetParent())
+    return action
+
+def _patchToolTip(reconciler: "Reconciler", node: PrimitiveView, old: tuple, new: tuple) -> Optional[Callable[[], None]]:
+    return lambda: node.getWxInstance().SetToolTip(*new[0])
+
+def _patchFont(reconciler: "Reconciler", node: PrimitiveView, old: tuple, new: tuple) -> Optional[Callable[[], None]]:
+    font = new[0][0]
+    if isinstance(font, wx.FontInfo):
+        font = wx.Font(font)
+    return lambda: node.getWxInstance().SetFont(font)
+
+def _patchExport(reconciler: "Reconciler", node: PrimitiveView, old: tuple, new: tuple) -> Optional[Callable[[], None]]:
+    return lambda: setattr(reconciler.rootWindow, new[0][0], node.getWxInstance())
+
+def _patchEventHandler(reconciler: "Reconciler", node: PrimitiveView, old: tuple, new: tuple) -> Optional[Callable[[], None]]:
+    (oldEvent, oldHandler), (newEvent, newHandler) = old[0], new[0]
+    if oldEvent is not newEvent or inspect.iscoroutinefunction(oldHandler) or inspect.iscoroutinefunction(newHandler):
+        return None
+    def action():
+        window = node.getWxInstance()
+        unbind(reconciler.rootWindow, oldEvent, oldHandler, window)
+        bind(reconciler.rootWindow, newEvent, newHandler, window)
+    return action
+
+_patchers: dict[str, Callable[["Reconciler", PrimitiveView, tuple, tuple], Optional[Callable[[], None]]]] = {
+    "sizer": _patchSizer,
+    "visible": _patchVisible,
+    "tooltip": _patchToolTip,
+    "font": _patchFont,
+    "export": _patchExport,
+    "eventHandler": _patchEventHandler,
+}
+
+def _callSetter(node: PrimitiveView, setter: str, value: Any):
+    getattr(node.getWxInstance(), setter)(value)
+
+def _discard(node: AttributeContainer):
+    # Releases a description node that was not built because an existing node took its place.
+    if isinstance(node, View):
+        node._discard()
+
+class Reconciler:
+    # Brings a built tree in line with a freshly evaluated description of it. Nodes of the same type are
+    # patched in place when the differences are limited to patchable constructor arguments (listed in the
+    # control's _patchable) and the attributes in _patchers; the old node then takes over the new
+    # description. Children are matched by type and key with difflib; unmatched old children are destroyed
+    # and new ones are built in place. Everything else is rebuilt.
+    def __init__(self, root: wx.Window):
+        self.rootWindow = root
+        self.root = _BuildRoot(root)
+        self.patched = 0
+        self.built = 0
+        self.destroyed = 0
+
+    def reconcile(self, old: PrimitiveView, new: PrimitiveView) -> PrimitiveView:
+        self.rootWindow.Freeze()
+        try:
+            with batch():
+                return self.__reconcile(old, new)
+        finally:
+            self.rootWindow.Thaw()
+
+    def __reconcile(self, old: PrimitiveView, new: PrimitiveView) -> PrimitiveView:
+        if old is new:
+            return old
+        if self.__patch(old, new):
+            return old
+        container = old.getWxInstance().GetParent()
+        self.__build(container, new, old.getWxInstance())
+        self.__destroy(container, old)
+        return new
+
+    def __patch(self, old: PrimitiveView, new: PrimitiveView) -> bool:
+        if _signature(old) != _signature(new):
+            return False
+        actions = self.__propActions(old, new)
+        if actions is None:
+            return False
+        oldCalls, newCalls = ({}, {}) if _sameCalls(old, new) else (_attributeCalls(old), _attributeCalls(new))
+        for name in oldCalls.keys() | newCalls.keys():
+            oldArgs, newArgs = oldCalls.get(name, []), newCalls.get(name, [])
+            if sameValue(oldArgs, newArgs):
+                continue
+            patcher = _patchers.get(name) if name is not None else None
+            if patcher is None or len(oldArgs) != len(newArgs):
+                return False
+            for a, b in zip(oldArgs, newArgs):
+                if not sameValue(a, b):
+                    action = patcher(self, old, a, b)
+                    if action is None:
+                        return False
+                    actions.append(action)
+        oldChildren, newChildren = _children(old), _children(new)
+        opcodes = []
+        container = None
+        if oldChildren or newChildren:
+            opcodes = _opcodes([_signature(child) for child in oldChildren], [_signature(child) for child in newChildren])
+            if any(tag != "equal" for tag, *_ in opcodes):
+                container = _childContainer(old)
+                if container is None:
+                    return False
+        for action in actions:
+            action()
+        if actions:
+            self.patched += 1
+        old._props = new._props
+        old._attribCalls = new._attribCalls
+        _discard(new)
+        if opcodes:
+            _setChildren(old, self.__reconcileChildren(container, oldChildren, newChildren, opcodes))
+        return True
+
+    def __propActions(self, old: PrimitiveView, new: PrimitiveView) -> Optional[list[Callable[[], None]]]:
+        if old._props is None or new._props is None:
+            return None
+        if sameValue(old._props, new._props):
+            return []
+        patchable = getattr(type(old), "_patchable", None)
+        if not patchable:
+            return None
+        oldArguments, newArguments = _arguments(old), _arguments(new)
+        if oldArguments is None or newArguments is None or oldArguments.keys() != newArguments.keys():
+            return None
+        actions = []
+        for name, value in newArguments.items():
+            if sameValue(oldArguments[name], value):
+                continue
+            setter = patchable.get(name)
+            if setter is None or isinstance(oldArguments[name], Mutable) or isinstance(value, Mutable):
+                return None
+            actions.append(functools.partial(_callSetter, old, setter, value))
+        return actions
+
+    def __reconcileChildren(self, container: Optional[wx.Window], oldChildren: list, newChildren: list, opcodes: list) -> list:
+        children = []
+        pending = []
+        for tag, i1, i2, j1, j2 in opcodes:
+            if tag == "equal":
+                for old, new in zip(oldChildren[i1:i2], newChildren[j1:j2]):
+                    children.append(self.__reconcile(old, new))
+            else:
+                assert container is not None
+                for old in oldChildren[i1:i2]:
+                    self.__destroy(container, old)
+                for new in newChildren[j1:j2]:
+                    pending.append(len(children))
+                    children.append(new)
+        for index in reversed(pending):
+            before = children[index + 1].getWxInstance() if index + 1 < len(children) else None
+            self.__build(container, children[index], before)
+        return children
+
+    def __build(self, container: wx.Window, node: PrimitiveView, before: Optional[wx.Window]):
+        window = node.initialize(self.root, _BuildRoot(container))
+        _place(container, window, before)
+        self.built += 1
+        if container.GetSizer() is None:
+            container.SendSizeEvent()
+        requestLayout(container)
+
+    def __destroy(self, container: wx.Window, node: PrimitiveView):
+        window = node.getWxInstance()
+        sizer = container.GetSizer()
+        if sizer is not None:
+            sizer.Detach(window)
+        window.Destroy()
+        self.destroyed += 1
+        requestLayout(container)
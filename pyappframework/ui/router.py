@@ -0,0 +1,86 @@
+# Library Imports
+import wx
+import functools
+from typing import Callable, Optional
+
+class EventRouter:
+    # Routes the events bound for a root window through one handler per event binder, which looks the
+    # handlers up by the id of the event's source instead of scanning the root's dynamic event table.
+    # Like wx, the handler bound last is called first, and the next one is only called when it skips
+    # the event. Handlers are matched by their source's id only, so windows sharing an id (like wx.ID_OK)
+    # share their handlers. The entries of a window are dropped when it is destroyed.
+    __slots__ = ("root", "routes", "watched", "dispatched")
+
+    def __init__(self, root: wx.Window):
+        self.root = root
+        self.routes: dict[wx.PyEventBinder, dict[int, list[tuple[Callable[[wx.Event], None], wx.Window]]]] = {}
+        self.watched: set[int] = set()
+        self.dispatched = 0
+
+    @staticmethod
+    def of(root: wx.Window) -> "EventRouter":
+        router = getattr(root, "_eventRouter", None)
+        if router is None:
+            router = EventRouter(root)
+            root._eventRouter = router
+        return router
+
+    def bind(self, evt: wx.PyEventBinder, handler: Callable[[wx.Event], None], source: wx.Window):
+        table = self.routes.get(evt)
+        if table is None:
+            table = self.routes[evt] = {}
+            self.root.Bind(evt, functools.partial(self.__dispatch, table))
+        table.setdefault(source.GetId(), []).append((handler, source))
+        if isinstance(source, wx.Window) and id(source) not in self.watched:
+            self.watched.add(id(source))
+            source.Bind(wx.EVT_WINDOW_DESTROY, functools.partial(self.__forget, source), source)
+
+    def unbind(self, evt: wx.PyEventBinder, handler: Callable[[wx.Event], None], source: wx.Window) -> bool:
+        entries = self.routes.get(evt, {}).get(source.GetId(), [])
+        for n in range(len(entries) - 1, -1, -1):
+            if entries[n][0] == handler:
+                del entries[n]
+                return True
+        return False
+
+    def __dispatch(self, table: dict[int, list[tuple[Callable[[wx.Event], None], wx.Window]]], evt: wx.Event):
+        entries = table.get(evt.GetId())
+        if not entries:
+            evt.Skip()
+            return
+        self.dispatched += 1
+        for handler, _ in entries[::-1]:
+            evt.Skip(False)
+            handler(evt)
+            if not evt.GetSkipped():
+                return
+
+    def __forget(self, source: wx.Window, evt: wx.WindowDestroyEvent):
+        evt.Skip()
+        self.watched.discard(id(source))
+        sourceId = source.GetId()
+        for table in self.routes.values():
+            entries = table.get(sourceId)
+            if entries is not None:
+                entries[:] = [entry for entry in entries if entry[1] is not source]
+                if not entries:
+                    del table[sourceId]
+
+def _router(root: wx.Window, evt: wx.PyEventBinder) -> Optional[EventRouter]:
+    # Binders for id ranges can't be looked up by a single id and are always bound on the root.
+    if getattr(root, "eventRouting", False) and evt.expectedIDs == 0:
+        return EventRouter.of(root)
+    return None
+
+def bind(root: wx.Window, evt: wx.PyEventBinder, handler: Callable[[wx.Event], None], source: wx.Window):
+    router = _router(root, evt)
+    if router is not None:
+        router.bind(evt, handler, source)
+    else:
+        root.Bind(evt, handler, source)
+
+def unbind(root: wx.Window, evt: wx.PyEventBinder, handler: Callable[[wx.Event], None], source: wx.Window) -> bool:
+    router = _router(root, evt)
+    if router is not None:
+        return router.unbind(evt, handler, source)
+    return root.Unbind(evt, source, handler=handler)
@@ -0,0 +1,369 @@
+# Library Imports
+import wx
+import enum
+import types
+import inspect
+import functools
+import collections
+from typing import Any, Callable, Generic, Optional, TypeVar
+from typing_extensions import ParamSpec
+
+# Internal Imports
+from .attribute import AttributeContainer, Attribute, _recording
+from .. import mutable
+from ..mutable import Mutable
+
+
+class _Unsupported(Exception):
+    pass
+
+class _Reads:
+    # Dependency tracker installed while a template records; values read from Mutables would be baked
+    # into the plan. Reads are still passed on, e.g. to a Computed evaluating a reactive body.
+    __slots__ = ("count", "previous")
+
+    def __init__(self, previous: Any):
+        self.count = 0
+        self.previous = previous
+
+    def _collect(self, m: Mutable):
+        self.count += 1
+        if self.previous is not None:
+            self.previous._collect(m)
+
+_PARAMETER = object()
+_CONSTANT_TYPES = (type(None), bool, int, float, complex, str, bytes, enum.Enum)
+_PARAMETER_TYPES = (Mutable, AttributeContainer, types.FunctionType, types.MethodType, types.BuiltinFunctionType, functools.partial)
+
+def _constantKey(value: Any) -> Any:
+    # 1, 1.0 and True (and 0.0 and -0.0) compare equal, but a plan has its constants baked in, so the
+    # key tells them apart.
+    if isinstance(value, (tuple, frozenset)):
+        return (type(value), type(value)(_constantKey(item) for item in value))
+    if isinstance(value, float):
+        return (float, value.hex())
+    return (type(value), value)
+
+def _isConstant(value: Any) -> bool:
+    if isinstance(value, (tuple, frozenset)):
+        return all(_isConstant(item) for item in value)
+    return isinstance(value, _CONSTANT_TYPES)
+
+@functools.lru_cache(maxsize=None)
+def _slotNames(cls: type) -> tuple[str, ...]:
+    names = []
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name in ("__dict__", "__weakref__"):
+                continue
+            if name.startswith("__") and not name.endswith("__"):
+                name = f"_{klass.__name__.lstrip('_')}{name}"
+            names.append(name)
+    return tuple(names)
+
+def _sizerFactory(sizer: wx.Sizer) -> tuple[Callable[..., wx.Sizer], tuple]:
+    # Sizers belong to the window they are set on, so each instance gets a new one.
+    if sizer.GetItemCount():
+        raise _Unsupported
+    if type(sizer) is wx.BoxSizer:
+        return wx.BoxSizer, (sizer.GetOrientation(),)
+    if type(sizer) is wx.GridSizer:
+        return wx.GridSizer, (sizer.GetRows(), sizer.GetCols(), sizer.GetVGap(), sizer.GetHGap())
+    raise _Unsupported
+
+_LIST, _SET, _DICT, _TUPLE, _CELL, _FUNCTION, _METHOD, _SIZER = range(8)
+
+class _Plan:
+    # A flat construction plan, compiled to a function that takes the parameters and builds the tree with
+    # one statement per object. objects holds the constants, with None in place of the parameters and of
+    # the objects the steps create. Views and attributes are allocated first, then containers, closures
+    # and sizers are built children first, and finally the state of the views is assigned.
+    __slots__ = ("objects", "parameters", "created", "instances", "builds", "slots", "dicts", "root")
+
+    def __init__(self):
+        self.objects: list[Any] = []
+        self.parameters: list[int] = []
+        self.created: set[int] = set()
+        self.instances: list[tuple[int, type]] = []
+        self.builds: list[tuple[int, int, Any, Any]] = []
+        self.slots: list[tuple[int, str, int]] = []
+        self.dicts: list[tuple[int, tuple[tuple[str, int], ...]]] = []
+        self.root = -1
+
+    def constant(self, value: Any) -> int:
+        self.objects.append(value)
+        return len(self.objects) - 1
+
+    def source(self) -> str:
+        parameters = set(self.parameters)
+        def ref(index: int) -> str:
+            if index in parameters:
+                return f"p{index}"
+            return f"o{index}" if index in self.created else f"c{index}"
+        def items(indices) -> str:
+            return "".join(f"{ref(i)}, " for i in indices)
+        lines = []
+        for index, cls in self.instances:
+            lines.append(f"o{index} = new(c{self.constant(cls)})")
+        for op, index, a, b in self.builds:
+            if op == _LIST:
+                lines.append(f"o{index} = [{items(a)}]")
+            elif op == _SET:
+                lines.append(f"o{index} = {{{items(a)}}}" if a else f"o{index} = set()")
+            elif op == _DICT:
+                lines.append(f"o{index} = {{{''.join(f'c{self.constant(key)}: {ref(i)}, ' for key, i in a)}}}")
+            elif op == _TUPLE:
+                lines.append(f"o{index} = ({items(a)})")
+            elif op == _CELL:
+                lines.append(f"o{index} = Cell({ref(a)})")
+            elif op == _FUNCTION:
+                lines.append(f"o{index} = Function(c{self.constant(a.__code__)}, c{self.constant(a.__globals__)}, "
+                             f"c{self.constant(a.__name__)}, {ref(b[0])}, ({items(b[1])}))")
+                lines.append(f"o{index}.__qualname__ = c{self.constant(a.__qualname__)}")
+                if a.__kwdefaults__ is not None:
+                    lines.append(f"o{index}.__kwdefaults__ = c{self.constant(a.__kwdefaults__)}")
+            elif op == _METHOD:
+                lines.append(f"o{index} = Method({ref(a)}, {ref(b)})")
+            else:
+                lines.append(f"o{index} = c{self.constant(a)}({''.join(f'c{self.constant(arg)}, ' for arg in b)})")
+        for index, name, source in self.slots:
+            lines.append(f"o{index}.{name} = {ref(source)}")
+        for index, entries in self.dicts:
+            lines.append(f"o{index}.__dict__.update({{{''.join(f'{name!r}: {ref(i)}, ' for name, i in entries)}}})")
+        lines.append(f"return {ref(self.root)}")
+        constants = [f"c{i}" for i in range(len(self.objects)) if i not in parameters and i not in self.created]
+        return "\n".join([
+            f"def factory(new, Cell, Function, Method, {', '.join(constants)}):",
+            f"    def build({', '.join(f'p{i}' for i in self.parameters)}):",
+            *(f"        {line}" for line in lines),
+            "    return build",
+        ])
+
+    def compile(self, name: str) -> Callable[..., Any]:
+        source = self.source()
+        namespace: dict[str, Any] = {}
+        exec(compile(source, f"<template {name}>", "exec"), namespace)
+        parameters = set(self.parameters)
+        constants = [value for i, value in enumerate(self.objects) if i not in parameters and i not in self.created]
+        return namespace["factory"](object.__new__, types.CellType, types.FunctionType, types.MethodType, *constants)
+
+class _Compiler:
+    def __init__(self, parameters: list):
+        self.plan = _Plan()
+        self.refs: dict[int, int] = {}
+        self.created = self.plan.created
+        self.dynamic: dict[tuple[int, bool], bool] = {}
+        for parameter in parameters:
+            index = self.__allocate(parameter, None)
+            self.plan.parameters.append(index)
+            self.created.add(index)
+
+    def compile(self, root: AttributeContainer, name: str) -> Callable[..., Any]:
+        self.plan.root = self.__ref(root, True)
+        return self.plan.compile(name)
+
+    def __allocate(self, original: Any, constant: Any) -> int:
+        index = len(self.plan.objects)
+        self.plan.objects.append(constant)
+        self.refs[id(original)] = index
+        return index
+
+    def __create(self, original: Any) -> int:
+        index = self.__allocate(original, None)
+        self.created.add(index)
+        return index
+
+    def __isDynamic(self, value: Any, state: bool) -> bool:
+        # Whether value has to be recreated for each instance: views, attributes, parameters, sizers and
+        # whatever contains them. Lists, sets and dicts held by views are copied as well, since views may
+        # modify their state; inside closures they are shared.
+        if id(value) in self.refs:
+            return self.refs[id(value)] in self.created
+        if isinstance(value, (AttributeContainer, Attribute, wx.Sizer)):
+            return True
+        if isinstance(value, Mutable):
+            raise _Unsupported
+        if isinstance(value, (list, set, dict)) and state:
+            return True
+        cached = self.dynamic.get((id(value), state))
+        if cached is not None:
+            return cached
+        self.dynamic[(id(value), state)] = False
+        if isinstance(value, (list, tuple, set, frozenset)):
+            result = any(self.__isDynamic(item, state) for item in value)
+        elif isinstance(value, dict):
+            result = any(self.__isDynamic(item, state) for item in value.values())
+        elif isinstance(value, types.FunctionType):
+            result = any(self.__isDynamic(cell.cell_contents, False) for cell in value.__closure__ or ()) \
+                or self.__isDynamic(value.__defaults__, False)
+        elif isinstance(value, types.MethodType):
+            result = self.__isDynamic(value.__self__, False)
+        elif isinstance(value, functools.partial):
+            if any(self.__isDynamic(item, False) for item in (value.func, value.args, value.keywords)):
+                raise _Unsupported
+            result = False
+        else:
+            result = False
+        self.dynamic[(id(value), state)] = result
+        return result
+
+    def __ref(self, value: Any, state: bool) -> int:
+        index = self.refs.get(id(value))
+        if index is not None:
+            return index
+        if not self.__isDynamic(value, state):
+            return self.__allocate(value, value)
+        plan = self.plan
+        if isinstance(value, (AttributeContainer, Attribute)):
+            index = self.__create(value)
+            plan.instances.append((index, type(value)))
+            for name in _slotNames(type(value)):
+                try:
+                    item = getattr(value, name)
+                except AttributeError:
+                    continue
+                plan.slots.append((index, name, self.__state(name, item)))
+            if hasattr(value, "__dict__"):
+                plan.dicts.append((index, tuple((name, self.__state(name, item)) for name, item in vars(value).items())))
+            return index
+        if isinstance(value, wx.Sizer):
+            factory, args = _sizerFactory(value)
+            index = self.__create(value)
+            plan.builds.append((_SIZER, index, factory, args))
+            return index
+        if isinstance(value, types.FunctionType):
+            defaults = self.__ref(value.__defaults__, False)
+            cells = tuple(self.__cell(cell) for cell in value.__closure__ or ())
+            index = self.__create(value)
+            plan.builds.append((_FUNCTION, index, value, (defaults, cells)))
+            return index
+        if isinstance(value, types.MethodType):
+            func, obj = self.__ref(value.__func__, False), self.__ref(value.__self__, False)
+            index = self.__create(value)
+            plan.builds.append((_METHOD, index, func, obj))
+            return index
+        if type(value) is dict:
+            items = tuple((key, self.__ref(item, state)) for key, item in value.items())
+            index = self.__create(value)
+            plan.builds.append((_DICT, index, items, None))
+            return index
+        if type(value) in (list, tuple, set):
+            items = tuple(self.__ref(item, state) for item in value)
+            index = self.__create(value)
+            plan.builds.append(({list: _LIST, tuple: _TUPLE, set: _SET}[type(value)], index, items, None))
+            return index
+        raise _Unsupported
+
+    def __state(self, name: str, value: Any) -> int:
+        # The description (_props and the arguments in _attribCalls) is never modified, so only the
+        # parts of it that refer to views or parameters are recreated.
+        if name == "_props":
+            return self.__ref(value, False)
+        if name == "_attribCalls" and type(value) is list:
+            items = tuple(self.__ref(item, False) for item in value)
+            index = self.__create(value)
+            self.plan.builds.append((_LIST, index, items, None))
+            return index
+        return self.__ref(value, True)
+
+    def __cell(self, cell: types.CellType) -> int:
+        # Cells holding nothing that changes between instances are shared.
+        index = self.refs.get(id(cell))
+        if index is not None:
+            return index
+        if not self.__isDynamic(cell.cell_contents, False):
+            return self.__allocate(cell, cell)
+        contents = self.__ref(cell.cell_contents, False)
+        index = self.__create(cell)
+        self.plan.builds.append((_CELL, index, contents, None))
+        return index
+
+P = ParamSpec("P")
+V = TypeVar("V", bound=AttributeContainer)
+class Template(Generic[P, V]):
+    # Records the view tree the function returns once and replays it for later calls. Arguments that are
+    # Mutables, views or callables are parameters: the tree is recorded with the first values passed and
+    # every reference to them is replaced with the values of the later calls. The other arguments have to
+    # be constants (None, numbers, strings, enums and tuples of these) and select one of up to maxPlans
+    # plans. Calls with other arguments, and functions that read a Mutable's value or create Mutables or
+    # sizers other than box and grid sizers, are not recorded and just call the function.
+    def __init__(self, func: Callable[P, V], maxPlans: int = 128):
+        functools.update_wrapper(self, func)
+        self.__func = func
+        self.__signature = inspect.signature(func)
+        # Calls passing plain positional arguments skip Signature.bind().
+        parameters = list(self.__signature.parameters.values())
+        self.__simple = all(parameter.kind is parameter.POSITIONAL_OR_KEYWORD for parameter in parameters)
+        self.__defaults = tuple(parameter.default for parameter in parameters)
+        self.__required = sum(parameter.default is parameter.empty for parameter in parameters)
+        self.__plans: collections.OrderedDict[tuple, Optional[Callable[..., V]]] = collections.OrderedDict()
+        self.maxPlans = maxPlans
+        self.recorded = 0
+        self.replayed = 0
+        self.built = 0
+
+    def __get__(self, obj: Any, owner: Optional[type] = None) -> Any:
+        if obj is None:
+            return self
+        return types.MethodType(self, obj)
+
+    def __call__(self, *args: P.args, **kw: P.kwargs) -> V:
+        if self.__simple and not kw and self.__required <= len(args) <= len(self.__defaults):
+            values = args + self.__defaults[len(args):]
+        else:
+            bound = self.__signature.bind(*args, **kw)
+            bound.apply_defaults()
+            values = tuple(bound.arguments.values())
+        # Whether attribute calls are being recorded is part of the key, since plans replay the calls
+        # their tree kept.
+        key: list = [_recording.depth > 0]
+        parameters: list = []
+        for value in values:
+            if isinstance(value, _PARAMETER_TYPES):
+                for position, parameter in enumerate(parameters):
+                    if parameter is value:
+                        break
+                else:
+                    position = len(parameters)
+                    parameters.append(value)
+                key.append((_PARAMETER, position))
+            elif _isConstant(value):
+                key.append(_constantKey(value))
+            else:
+                self.built += 1
+                return self.__func(*args, **kw)
+        plans = self.__plans
+        key = tuple(key)
+        try:
+            plan = plans[key]
+        except KeyError:
+            pass
+        else:
+            plans.move_to_end(key)
+            if plan is None:
+                self.built += 1
+                return self.__func(*args, **kw)
+            self.replayed += 1
+            return plan(*parameters)
+        self.recorded += 1
+        reads = _Reads(mutable._tracker)
+        mutable._tracker = reads
+        try:
+            view = self.__func(*args, **kw)
+        finally:
+            mutable._tracker = reads.previous
+        plan = None
+        if not reads.count and isinstance(view, AttributeContainer):
+            try:
+                plan = _Compiler(parameters).compile(view, self.__qualname__)
+            except (_Unsupported, ValueError):
+                # ValueError: a closure cell that is still empty.
+                pass
+        plans[key] = plan
+        if len(plans) > self.maxPlans:
+            plans.popitem(last=False)
+        return view
+
+def template(func: Callable[P, V]) -> Template[P, V]:
+    return Template(func)
@@ -4,16 +4,27 @@ from typing_extensions import Self
 import abc
 
 # Internal Imports
-from .attribute import AttributeContainer
+from .attribute import AttributeContainer, _recording
+from .build import _build
+from .aot import _loader
+from ..mutable import Computed, batch
 
 class PrimitiveView(AttributeContainer[wx.Window, wx.Window, wx.Window]):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.__wx_instance = None
 
     def initialize(self, root: Self, parent: Self) -> wx.Window:
-        self.__wx_instance = self._initialize(root, parent)
-        self.runAttribDelegates(root.getWxInstance(), parent.getWxInstance(), self.__wx_instance)
+        _build.begin(parent.getWxInstance())
+        try:
+            self.__wx_instance = self._initialize(root, parent)
+            self.runAttribDelegates(root.getWxInstance(), parent.getWxInstance(), self.__wx_instance)
+        except BaseException as e:
+            _build.end(type(e), e, e.__traceback__)
+            raise
+        _build.end(None, None, None)
         return self.__wx_instance
 
     def setWxInstance(self, instance: wx.Window):
@@ -27,13 +38,81 @@ class PrimitiveView(AttributeContainer[wx.Window, wx.Window, wx.Window]):
     def _initialize(self, root: Self, parent: Self) -> wx.Window:
         pass
 
+class _BuildRoot(PrimitiveView):
+    # Window.initialize() replaces the root's wx instance with its body, so views that build subtrees
+    # after the initial build keep the root window seen at build time in one of these.
+    def __init__(self, instance: wx.Window):
+        super().__init__()
+        self.setWxInstance(instance)
+
+    def _initialize(self, root: PrimitiveView, parent: PrimitiveView) -> wx.Window:
+        raise RuntimeError("A build root wraps a window that already exists and is never initialized")
+
 class View(PrimitiveView):
+    # With reactive set, body() is evaluated as a Computed: when a Mutable read during body() changes, body()
+    # is evaluated again and the built widgets are patched to match the new description. Evaluating and
+    # diffing the description costs O(nodes) for every change; only the wx calls are limited to what changed.
+    # A view that is the root of its build, like a Window, is built by the code pyappframework.ui.compiler
+    # generated for it when that is up to date, without evaluating body().
+    reactive = False
+
     def __init__(self):
         super().__init__()
-        self.__body = self.body()
+        self.__compiled = None
+        if self.reactive:
+            self.__render = Computed(self.__describe)
+            self.__body = self.__render._get()
+        else:
+            self.__compiled = _loader.lookup(type(self))
+            self.__body = self.body() if self.__compiled is None else None
     
+    def __describe(self) -> PrimitiveView:
+        with _recording:
+            return self.body()
+
     def _initialize(self, root: PrimitiveView, parent: PrimitiveView) -> wx.Window:
-        return self.__body.initialize(root, parent)
+        if self.__compiled is not None:
+            if root is self:
+                return self.__compiled(self, root.getWxInstance(), parent.getWxInstance())
+            self.__body = self.body()
+        instance = self.__body.initialize(root, parent)
+        if self.reactive:
+            from .reconciler import Reconciler
+            self.__reconciler = Reconciler(root.getWxInstance())
+            self.__subscription = self.__render._addListener(self.__rerender, False)
+            self.__watch(instance)
+        return instance
+
+    def _getBody(self) -> PrimitiveView:
+        return self.__body
+
+    def _setBody(self, body: PrimitiveView):
+        instance = body.getWxInstance()
+        if self.reactive and instance is not self.__body.getWxInstance():
+            self.__watch(instance)
+        self.__body = body
+        self.setWxInstance(instance)
+
+    def _discard(self):
+        if self.reactive:
+            self.__render.dispose()
+
+    def __watch(self, instance: wx.Window):
+        # The body window is also destroyed when a render replaces it, so whether the view is gone is only
+        # checked once the render is over.
+        def onDestroy(evt: wx.WindowDestroyEvent):
+            evt.Skip()
+            wx.CallAfter(self.__disposeIfDestroyed)
+        instance.Bind(wx.EVT_WINDOW_DESTROY, onDestroy, instance)
+
+    def __disposeIfDestroyed(self):
+        if not self.__body.getWxInstance():
+            self.__subscription.dispose()
+            self.__render.dispose()
+
+    def __rerender(self, body: PrimitiveView):
+        with batch():
+            self._setBody(self.__reconciler.reconcile(self.__body, body))
 
     @abc.abstractmethod
     def body(self) -> PrimitiveView:
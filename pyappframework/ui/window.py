@@ -8,6 +8,10 @@ from .menubar import Menu
 from .view import View
 
 class Window(wx.Frame, View):
+    # With eventRouting set, the event handlers of the controls in the window are looked up in an EventRouter
+    # instead of each being bound on the window.
+    eventRouting = False
+
     def __init__(self, *args, **kw):
         wx.Frame.__init__(self, None, *args, **kw)
         View.__init__(self)
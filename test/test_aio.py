@@ -0,0 +1,99 @@
+# Library Imports
+import unittest
+import asyncio
+import threading
+import selectors
+import socket
+import time
+from unittest import mock
+import wx
+
+# Internal Imports
+import pyappframework as pyaf
+from pyappframework import aio
+
+class AsyncioTest(unittest.TestCase):
+    def setUp(self):
+        self.app = wx.App()
+        self.mutable = pyaf.Mutable[int](0)
+        self.results = []
+
+    def tearDown(self):
+        aio.getEventLoop().close()
+        self.app.Destroy()
+
+    def runTest(self):
+        task = aio.spawn(self.consume())
+        wx.CallLater(10000, self.app.ExitMainLoop)
+        self.app.MainLoop()
+        self.assertTrue(task.done())
+        self.assertEqual(self.results, [1, 3])
+
+    async def consume(self):
+        asyncio.get_running_loop().call_later(0.01, self.produce)
+        self.results.append(await self.mutable.changed())
+        async for value in self.mutable:
+            if value == 3:
+                self.results.append(value)
+                break
+        self.app.ExitMainLoop()
+
+    def produce(self):
+        self.mutable.value += 1
+        if self.mutable.value < 3:
+            asyncio.get_running_loop().call_later(0.01, self.produce)
+
+class CloseTest(unittest.TestCase):
+    def setUp(self):
+        self.app = wx.App()
+
+    def tearDown(self):
+        self.app.Destroy()
+
+    def runTest(self):
+        # The watcher posts an iteration once the loop is woken up, and waits for it; closing the loop
+        # without running the wx main loop must not wait forever.
+        loop = aio.WxEventLoop()
+        loop.call_soon_threadsafe(lambda: None)
+        closer = threading.Thread(target=loop.close, daemon=True)
+        closer.start()
+        closer.join(5)
+        self.assertFalse(closer.is_alive())
+        self.assertTrue(loop.is_closed())
+
+
+class ReaderTest(unittest.TestCase):
+    def setUp(self):
+        self.app = wx.App()
+        self.received = []
+
+    def tearDown(self):
+        self.app.Destroy()
+
+    def runTest(self):
+        # select() only watches the file descriptors it was called with, so the watcher has to be woken
+        # up to see a reader added while it waits.
+        with mock.patch.object(aio.selectors, "DefaultSelector", selectors.SelectSelector):
+            loop = aio.WxEventLoop()
+        reader, writer = socket.socketpair()
+        try:
+            loop.add_reader(reader, self.read, reader)
+            writer.send(b"x")
+            deadline = time.monotonic() + 5
+            while not self.received and time.monotonic() < deadline:
+                wx.Yield()
+                time.sleep(0.01)
+            self.assertEqual(self.received, [b"x"])
+            loop.remove_reader(reader)
+        finally:
+            loop.close()
+            reader.close()
+            writer.close()
+
+        # The private asyncio API the loop relies on is checked when it is created.
+        with mock.patch.object(aio, "_PRIVATE_LOOP_API", aio._PRIVATE_LOOP_API + ("_missing",)):
+            with self.assertRaisesRegex(RuntimeError, "_missing"):
+                aio.WxEventLoop()
+
+    def read(self, reader: socket.socket):
+        self.received.append(reader.recv(1))
@@ -0,0 +1,43 @@
+# Library Imports
+import unittest
+import wx
+
+# Internal Imports
+from pyappframework.ui import attribute as attr
+from pyappframework.ui import controls as ctl
+
+class AttributeStorageTest(unittest.TestCase):
+    def setUp(self):
+        self.app = wx.App()
+
+    def tearDown(self):
+        self.app.Destroy()
+
+    def runTest(self):
+        text = ctl.StaticText(label="Plain")
+        self.assertFalse(hasattr(text, "__dict__"))
+        self.assertIsNone(text._attributes)
+        self.assertEqual(text._attribCalls, ())
+
+        sized = ctl.StaticText(label="Sized").sizer(flag=wx.EXPAND)
+        self.assertEqual(list(sized._attributes), ["sizer"])
+        self.assertIs(sized.sizer, sized.sizer)
+        self.assertEqual(sized.sizer.name, "sizer")
+        # Attribute calls are only kept while descriptions that are compared later are made.
+        self.assertEqual(sized._attribCalls, ())
+        with attr._recording:
+            recorded = ctl.StaticText(label="Recorded").sizer(flag=wx.EXPAND)
+        self.assertEqual(recorded._attribCalls, [(recorded.sizer, (), {"flag": wx.EXPAND})])
+        self.assertEqual(recorded._props, ((), {"label": "Recorded"}))
+        self.assertIsNone(sized._props)
+        self.assertRaises(AssertionError, sized.sizer)
+
+        # Handlers are stateless and shared; the attributes holding per-object state are not.
+        other = ctl.StaticText(label="Other").sizer()
+        self.assertIsNot(other.sizer, sized.sizer)
+        self.assertIs(other.sizer.handler, sized.sizer.handler)
+        self.assertIsInstance(ctl.StaticText.sizer, attr.AttributeField)
+
+        panel = ctl.Panel(wx.BoxSizer(wx.VERTICAL)).body[[text, [sized, other]]]
+        self.assertEqual(panel.body.value, [text, sized, other])
+        self.assertEqual(ctl.Panel(wx.BoxSizer(wx.VERTICAL)).body.value, [])
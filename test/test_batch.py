@@ -0,0 +1,59 @@
+# Library Imports
+import unittest
+import wx
+
+# Internal Imports
+import pyappframework as pyaf
+
+class BatchTest(unittest.TestCase):
+    def setUp(self):
+        self.app = wx.App()
+        self.mutable = pyaf.Mutable[int](0)
+        self.events = []
+
+    def tearDown(self):
+        self.app.Destroy()
+
+    def runTest(self):
+        self.mutable.addListener(self.mutationListener)
+        self.events.clear()
+        with pyaf.batch():
+            self.mutable.value = 1
+            with pyaf.batch():
+                self.mutable.value = 2
+            self.mutable.value = 3
+            self.assertEqual(self.mutable.value, 3)
+            self.assertEqual(self.events, [])
+        self.assertEqual(self.events, [(0, 3)])
+        self.assertEqual(self.update(), 1)
+        self.assertEqual(self.events, [(0, 3), (3, 4)])
+
+        # A listener that raises doesn't drop the other changes of its batch, nor leave any for the next one.
+        failing, other, third = (pyaf.Mutable[int](0) for _ in range(3))
+        delivered = []
+        def fail(evt: pyaf.MutationEvent):
+            if evt.newValue == 1:
+                third.value = 5
+                raise ValueError("listener failed")
+        failing.addListener(fail)
+        other.addListener(lambda evt: delivered.append(("other", evt.oldValue, evt.newValue)))
+        third.addListener(lambda evt: delivered.append(("third", evt.oldValue, evt.newValue)))
+        delivered.clear()
+        with self.assertRaises(ValueError):
+            with pyaf.batch():
+                failing.value = 1
+                other.value = 1
+        self.assertEqual(sorted(delivered), [("other", 0, 1), ("third", 0, 5)])
+        with pyaf.batch():
+            self.mutable.value = 6
+        self.assertEqual(self.events[-1], (4, 6))
+        self.assertEqual(len(delivered), 2)
+
+    @pyaf.batch()
+    def update(self) -> int:
+        self.mutable.value = 5
+        self.mutable.value = 4
+        return len(self.events)
+
+    def mutationListener(self, evt: pyaf.MutationEvent):
+        self.events.append((evt.oldValue, evt.newValue))
@@ -0,0 +1,73 @@
+# Library Imports
+import unittest
+import wx
+
+# Internal Imports
+import pyappframework as pyaf
+from pyappframework import ui
+from pyappframework.ui import controls as ctl
+from pyappframework.ui.build import _build
+
+class TestWindow(ui.Window):
+    def __init__(self, *args, **kw):
+        self.frozenStates = []
+        self.changes = []
+        self.field = pyaf.Mutable[int](0)
+        self.field.addListener(lambda evt: self.changes.append(evt.newValue))
+        super().__init__(*args, **kw)
+
+    def inspect(self, target: wx.Window):
+        self.frozenStates.append(wx.GetTopLevelParent(target).IsFrozen())
+        self.field.value += 1
+
+    def row(self, n: int) -> ctl.Panel:
+        return (
+            ctl.Panel(wx.BoxSizer(wx.HORIZONTAL))
+                .sizer(flag=wx.EXPAND)
+                .body [[
+                    ctl.StaticText(label=f"Label {n}")
+                        .sizer(),
+                    ctl.Button(label="Edit")
+                        .sizer(proportion=1)
+                        .rawModifier(self.inspect),
+                ]]
+        )
+
+    def body(self) -> ctl.Panel:
+        self.lazy = ctl.Lazy(lambda: ctl.StaticText(label="Deferred"))
+        return (
+            ctl.Panel(wx.BoxSizer(wx.VERTICAL))
+            .body [[
+                [self.row(n) for n in range(3)],
+                self.lazy
+                    .sizer(proportion=1, flag=wx.EXPAND),
+            ]]
+        )
+
+class BuildTest(unittest.TestCase):
+    def setUp(self):
+        self.app = wx.App()
+
+    def tearDown(self):
+        self.app.Destroy()
+
+    def runTest(self):
+        layouts = _build.layouts
+        self.frame = TestWindow()
+        self.assertEqual(_build.layouts, layouts + 1)
+        self.assertEqual(self.frame.frozenStates, [True] * 3)
+        self.assertFalse(self.frame.IsFrozen())
+        # Notifications raised during the build are delivered once it is over.
+        self.assertEqual(self.frame.changes[1:], [3])
+
+        children = [item.GetWindow() for item in self.frame.getWxInstance().GetSizer().GetChildren()]
+        self.assertEqual(len(children), 4)
+        labels = [row.GetSizer().GetChildren()[0].GetWindow().GetLabel() for row in children[:3]]
+        self.assertEqual(labels, ["Label 0", "Label 1", "Label 2"])
+        self.assertEqual(children[1].GetSizer().GetChildren()[1].GetProportion(), 1)
+
+        layouts = _build.layouts
+        self.frame.lazy.materialize()
+        self.assertEqual(_build.layouts, layouts + 1)
+        self.assertEqual(len(self.frame.lazy.getWxInstance().GetSizer().GetChildren()), 1)
+        self.frame.Destroy()
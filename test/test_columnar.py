@@ -0,0 +1,56 @@
+# Library Imports
+import unittest
+import numpy as np
+import wx
+
+# Internal Imports
+from pyappframework import ui
+
+class ColumnarModelTest(unittest.TestCase):
+    def setUp(self):
+        self.app = wx.App()
+
+    def tearDown(self):
+        self.app.Destroy()
+
+    def rows(self, model: ui.ColumnarModel) -> list[list[str]]:
+        return [[model.GetValueByRow(row, col) for col in range(model.GetColumnCount())] for row in range(model.GetCount())]
+
+    def runTest(self):
+        names = np.array(["delta", "alpha", "charlie", "bravo", "echo"])
+        prices = np.array([4.5, 1.25, 3.0, 2.0, 5.75])
+        model = ui.ColumnarModel({"name": names, "price": prices}, formats={"price": "%.2f"}, blockSize=2)
+        self.assertEqual(model.columnNames(), ["name", "price"])
+        self.assertEqual(model.GetCount(), 5)
+        self.assertEqual(model.GetColumnType(1), "string")
+        self.assertEqual(self.rows(model)[:2], [["delta", "4.50"], ["alpha", "1.25"]])
+        # The data is shown without being copied.
+        self.assertIs(model.column("price"), prices)
+
+        model.sort("price", ascending=False)
+        self.assertEqual([row[0] for row in self.rows(model)], ["echo", "delta", "charlie", "bravo", "alpha"])
+        self.assertEqual(model.dataRow(0), 4)
+
+        model.filter(prices > 2.5)
+        self.assertEqual(model.GetCount(), 3)
+        self.assertEqual(self.rows(model), [["echo", "5.75"], ["delta", "4.50"], ["charlie", "3.00"]])
+        model.sort(None)
+        self.assertEqual([row[0] for row in self.rows(model)], ["delta", "charlie", "echo"])
+        model.filter(None)
+        self.assertEqual(model.GetCount(), 5)
+
+        # Structured arrays and callable formats, applied to a whole block at once.
+        table = np.array([(3, b"c"), (1, b"a"), (2, b"b")], dtype=[("id", "i4"), ("code", "S1")])
+        blocks = []
+        def code(values: np.ndarray) -> np.ndarray:
+            blocks.append(len(values))
+            return np.char.upper(values.astype(str))
+        model = ui.ColumnarModel(table, formats={"code": code}, blockSize=2)
+        model.sort("id")
+        self.assertEqual(self.rows(model), [["1", "A"], ["2", "B"], ["3", "C"]])
+        self.assertEqual(blocks, [2, 1])
+        model.GetValueByRow(0, 1)
+        self.assertEqual(blocks, [2, 1])
+
+        self.assertRaises(ValueError, ui.ColumnarModel, {"a": np.zeros(3), "b": np.zeros(4)})
+        self.assertRaises(ValueError, model.filter, np.ones(5, dtype=bool))
@@ -0,0 +1,46 @@
+# Library Imports
+import unittest
+import wx
+
+# Internal Imports
+import pyappframework as pyaf
+
+class ComparatorTest(unittest.TestCase):
+    def setUp(self):
+        self.app = wx.App()
+        self.values = []
+
+    def tearDown(self):
+        self.app.Destroy()
+
+    def runTest(self):
+        default = pyaf.Mutable[list]([1])
+        default.syncTo(self.values.append)
+        default.value = [1]
+        self.assertEqual(len(self.values), 2)
+        self.assertEqual(default.version, 1)
+
+        equality = pyaf.Mutable[list]([1], compare=pyaf.equal)
+        equality.syncTo(self.values.append)
+        equality.value = [1]
+        self.assertEqual(len(self.values), 3)
+        self.assertEqual(equality.version, 0)
+        equality.value = [2]
+        self.assertEqual(self.values[-1], [2])
+        self.assertEqual(equality.version, 1)
+
+        identity = pyaf.Mutable[list](self.values, compare=pyaf.identical)
+        identity.value = self.values
+        identity.value = list(self.values)
+        self.assertEqual(identity.version, 1)
+
+        tolerance = pyaf.Mutable[float](1.0, compare=lambda old, new: abs(old - new) < 0.1)
+        tolerance.value = 1.05
+        tolerance.value = 1.5
+        self.assertEqual(tolerance.version, 1)
+
+        with pyaf.batch():
+            equality.value = [3]
+            equality.value = [2]
+        self.assertEqual(self.values[-1], [2])
+        self.assertEqual(len(self.values), 4)
@@ -0,0 +1,149 @@
+# Library Imports
+import unittest
+import importlib
+import tempfile
+import shutil
+import sys
+import os
+import wx
+from unittest import mock
+
+# Internal Imports
+from pyappframework.ui import compiler
+from pyappframework.ui.aot import _loader
+
+SOURCE = '''
+import os
+import wx
+from pyappframework import ui
+from pyappframework.ui import controls as ctl
+
+bodies = []
+
+class Form(ui.Window):
+    def __init__(self, *args, **kw):
+        self.clicks = []
+        super().__init__(*args, **kw)
+
+    def onClick(self, evt):
+        self.clicks.append(evt.GetId())
+
+    def row(self, n):
+        return (
+            ctl.Panel(wx.BoxSizer(wx.HORIZONTAL))
+                .sizer(flag=wx.EXPAND)
+                .body [[
+                    ctl.StaticText(label=f"Field {n}")
+                        .sizer(flag=wx.ALL, border=2),
+                    ctl.Gauge(range=100, value=n * 10)
+                        .sizer(proportion=1, flag=wx.EXPAND),
+                ]]
+        )
+
+    def body(self):
+        bodies.append(self)
+        return (
+            ctl.Panel(wx.BoxSizer(wx.VERTICAL))
+            .body [[
+                [self.row(n) for n in range(3)],
+                ctl.Button(label="Save")
+                    .sizer(flag=wx.ALL, border=4)
+                    .export("save")
+                    .eventHandler(wx.EVT_BUTTON, self.onClick),
+            ]]
+        )
+
+class Stateful(ui.Window):
+    def __init__(self, *args, **kw):
+        self.title = "Title"
+        super().__init__(*args, **kw)
+
+    def body(self):
+        return ctl.Panel(wx.BoxSizer(wx.VERTICAL)).body[[ctl.StaticText(label=self.title)]]
+
+class Configured(ui.Window):
+    def body(self):
+        return ctl.Panel(wx.BoxSizer(wx.VERTICAL)).body[[ctl.StaticText(label=os.environ.get("USER", "user"))]]
+'''
+
+def describe(window: wx.Window) -> tuple:
+    sizer = window.GetSizer()
+    items = [] if sizer is None else [
+        (item.GetProportion(), item.GetFlag(), item.GetBorder(), describe(item.GetWindow()))
+        for item in sizer.GetChildren()
+    ]
+    return (type(window).__name__, window.GetLabel(), items)
+
+class CompilerTest(unittest.TestCase):
+    def setUp(self):
+        self.app = wx.App()
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "compiledviews.py")
+        with open(self.path, "w") as file:
+            file.write(SOURCE)
+        sys.path.insert(0, self.directory)
+        self.module = importlib.import_module("compiledviews")
+        _loader.clear()
+
+    def tearDown(self):
+        _loader.enabled = True
+        _loader.clear()
+        sys.path.remove(self.directory)
+        del sys.modules["compiledviews"]
+        shutil.rmtree(self.directory)
+        self.app.Destroy()
+
+    def runTest(self):
+        profiler = lambda frame, event, arg: None
+        sys.setprofile(profiler)
+        try:
+            path, skipped = compiler.compileModule(self.module)
+            # A profiler that was installed is restored.
+            self.assertIs(sys.getprofile(), profiler)
+        finally:
+            sys.setprofile(None)
+        self.assertEqual(path, os.path.join(self.directory, "__aot__", "compiledviews.py"))
+        self.assertEqual(list(skipped), ["Stateful", "Configured"])
+        self.assertIn("self.title", skipped["Stateful"])
+        # What body() reads from the environment would be frozen into the generated code.
+        self.assertIn("frozen", skipped["Configured"])
+
+        _loader.enabled = False
+        declarative = self.module.Form()
+        _loader.enabled = True
+        del self.module.bodies[:]
+        compiled = self.module.Form()
+        self.assertEqual(self.module.bodies, [])
+        self.assertIsNotNone(compiled._View__compiled)
+
+        # The generated code builds the same tree, exports and bindings.
+        self.assertEqual(describe(compiled.getWxInstance()), describe(declarative.getWxInstance()))
+        evt = wx.CommandEvent(wx.wxEVT_BUTTON, compiled.save.GetId())
+        evt.SetEventObject(compiled.save)
+        compiled.save.ProcessWindowEvent(evt)
+        self.assertEqual(compiled.clicks, [compiled.save.GetId()])
+        declarative.Destroy()
+        compiled.Destroy()
+
+        # Generated modules are stale once the framework's own sources change.
+        _loader.clear()
+        with mock.patch("pyappframework.ui.aot.frameworkDigest", return_value="changed"):
+            self.assertIsNone(_loader.lookup(self.module.Form))
+        _loader.clear()
+        self.assertIsNotNone(_loader.lookup(self.module.Form))
+
+        # Installed under site-packages, the framework is not taken for a library body() must not call.
+        framework = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(compiler.__file__))))
+        prefixes = compiler._libraryPrefixes() + [compiler._real(framework) + os.sep]
+        with mock.patch.object(compiler, "_libraryPrefixes", return_value=prefixes):
+            path, skipped = compiler.compileModule(self.module)
+        self.assertEqual(list(skipped), ["Stateful", "Configured"])
+        self.assertIn("frozen", skipped["Configured"])
+
+        # Once its source changes, a view is built from body() again.
+        with open(self.path, "a") as file:
+            file.write("\n# changed\n")
+        _loader.clear()
+        self.assertIsNone(_loader.lookup(self.module.Form))
+        self.assertIsNone(_loader.lookup(self.module.Stateful))
+        self.assertIsNone(_loader.lookup(self.module.Configured))
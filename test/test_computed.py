@@ -0,0 +1,77 @@
+# Library Imports
+import unittest
+import weakref
+import gc
+import wx
+
+# Internal Imports
+import pyappframework as pyaf
+
+class ComputedTest(unittest.TestCase):
+    def setUp(self):
+        self.app = wx.App()
+        self.evaluations = {"left": 0, "right": 0, "total": 0}
+        self.source = pyaf.Mutable[int](1)
+        self.left = pyaf.Computed[int](lambda: self.evaluate("left", self.source.value + 1))
+        self.right = pyaf.Computed[int](lambda: self.evaluate("right", self.source.value * 2))
+        self.total = pyaf.Computed[int](lambda: self.evaluate("total", self.left.value + self.right.value))
+        self.values = []
+
+    def tearDown(self):
+        self.app.Destroy()
+
+    def runTest(self):
+        self.assertEqual(self.evaluations["total"], 0)
+        self.total.syncTo(self.values.append)
+        self.assertEqual(self.values, [4])
+        self.source.value = 2
+        self.assertEqual(self.values, [4, 7])
+        self.assertEqual(self.evaluations, {"left": 2, "right": 2, "total": 2})
+        with pyaf.batch():
+            self.source.value = 3
+            self.source.value = 4
+            self.assertEqual(self.total.value, 13)
+        self.assertEqual(self.values, [4, 7, 13])
+        self.assertEqual(self.evaluations, {"left": 3, "right": 3, "total": 3})
+        self.assertEqual(pyaf.valueof(self.total), 13)
+        with self.assertRaises(AttributeError):
+            self.total.value = 0
+
+        # Changes made while nothing listened are not compared against once a listener is added.
+        source = pyaf.Mutable[int](1)
+        computed = pyaf.Computed[int](lambda: source.value)
+        self.assertEqual(computed.value, 1)
+        source.value = 2
+        self.assertEqual(computed.value, 2)
+        changes = []
+        computed.addListener(lambda evt: changes.append((evt.oldValue, evt.newValue)))
+        source.value = 1
+        self.assertEqual(changes, [(2, 2), (2, 1)])
+
+        # A Computed nothing observes isn't registered with its sources: it is collected once dropped,
+        # and is brought up to date when read.
+        doubled = pyaf.Computed[int](lambda: source.value * 2)
+        quadrupled = pyaf.Computed[int](lambda: doubled.value * 2)
+        self.assertEqual(quadrupled.value, 4)
+        self.assertEqual(source._dependents, (computed,))
+        source.value = 3
+        self.assertEqual(quadrupled.value, 12)
+        references = (weakref.ref(doubled), weakref.ref(quadrupled))
+        del doubled, quadrupled
+        gc.collect()
+        self.assertEqual([reference() for reference in references], [None, None])
+
+        # Observing it registers it, and disposing of the last listener unregisters it again.
+        doubled = pyaf.Computed[int](lambda: source.value * 2)
+        self.assertEqual(doubled.value, 6)
+        source.value = 4
+        values = []
+        subscription = doubled.syncTo(values.append)
+        source.value = 5
+        self.assertEqual(values, [8, 10])
+        subscription.dispose()
+        self.assertEqual(source._dependents, (computed,))
+
+    def evaluate(self, name: str, value: int) -> int:
+        self.evaluations[name] += 1
+        return value
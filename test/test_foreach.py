@@ -0,0 +1,94 @@
+# Library Imports
+import unittest
+import wx
+
+# Internal Imports
+import pyappframework as pyaf
+from pyappframework import ui
+from pyappframework.ui import controls as ctl
+
+class TestWindow(ui.Window):
+    def __init__(self, *args, **kw):
+        self.items = pyaf.MutableList[tuple[int, str]]([(n, f"Item{n}") for n in range(5)])
+        self.pages = pyaf.Mutable[list[str]](["Page1", "Page2"])
+        self.built = 0
+        super().__init__(*args, **kw)
+
+    def row(self, item: pyaf.Mutable[tuple[int, str]]) -> ctl.StaticText:
+        self.built += 1
+        return (
+            ctl.StaticText(label=pyaf.Computed(lambda: item.value[1]))
+                .sizer(flag=wx.EXPAND | wx.ALL, border=2)
+        )
+
+    def page(self, label: pyaf.Mutable[str]) -> ctl.Panel:
+        return ctl.Panel(wx.BoxSizer(wx.VERTICAL), label=label.value)
+
+    def body(self) -> ctl.Panel:
+        return (
+            ctl.Panel(wx.BoxSizer(wx.VERTICAL))
+            .body [[
+                ctl.StaticText(label="Header")
+                    .sizer()
+                    .export("header"),
+                ctl.ForEach(self.items, key=lambda item: item[0], row=self.row),
+                ctl.StaticText(label="Footer")
+                    .sizer()
+                    .export("footer"),
+                ctl.Notebook()
+                    .sizer(proportion=1, flag=wx.EXPAND)
+                    .export("notebook")
+                    .body [[
+                        ctl.ForEach(self.pages, row=self.page),
+                    ]],
+            ]]
+        )
+
+class ForEachTest(unittest.TestCase):
+    def setUp(self):
+        self.app = wx.App()
+        self.frame = None
+
+    def tearDown(self):
+        assert self.frame is not None
+        self.frame.Destroy()
+        self.app.Destroy()
+
+    def labels(self):
+        sizer = self.frame.header.GetParent().GetSizer()
+        return [item.GetWindow().GetLabel() for item in sizer.GetChildren() if item.GetWindow().IsShown() and item.GetWindow() is not self.frame.notebook]
+
+    def runTest(self):
+        self.frame = TestWindow()
+        self.assertEqual(self.frame.built, 5)
+        self.assertEqual(self.labels(), ["Header", "Item0", "Item1", "Item2", "Item3", "Item4", "Footer"])
+        sizer = self.frame.header.GetParent().GetSizer()
+        item = sizer.GetItem(2)
+        self.assertEqual(item.GetFlag(), wx.EXPAND | wx.ALL)
+        self.assertEqual(item.GetBorder(), 2)
+        windows = {child.GetWindow().GetLabel(): child.GetWindow() for child in sizer.GetChildren()}
+
+        self.frame.items.move(0, 4)
+        self.frame.items[1] = (2, "Changed")
+        del self.frame.items[2]
+        self.frame.items.append((9, "Item9"))
+        self.assertEqual(self.labels(), ["Header", "Item1", "Changed", "Item4", "Item0", "Item9", "Footer"])
+        self.assertEqual(self.frame.built, 6)
+        current = {child.GetWindow().GetLabel(): child.GetWindow() for child in sizer.GetChildren()}
+        for label in ("Item1", "Item4", "Item0"):
+            self.assertIs(current[label], windows[label])
+        self.assertIs(current["Changed"], windows["Item2"])
+        self.assertEqual(sizer.GetItem(windows["Item0"]).GetFlag(), wx.EXPAND | wx.ALL)
+        self.assertFalse(windows["Item3"])
+
+        notebook = self.frame.notebook
+        self.assertEqual(notebook.GetPageCount(), 2)
+        first = notebook.GetPage(0)
+        self.frame.pages.value = ["Page3", "Page1"]
+        self.assertEqual(notebook.GetPageCount(), 2)
+        self.assertIs(notebook.GetPage(1), first)
+        self.assertEqual(notebook.GetPage(0).GetLabel(), "Page3")
+
+        # Duplicate keys are rejected even when assertions are stripped.
+        with self.assertRaises(ValueError):
+            self.frame.pages.value = ["Page1", "Page1"]
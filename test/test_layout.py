@@ -0,0 +1,68 @@
+# Library Imports
+import unittest
+import wx
+
+# Internal Imports
+import pyappframework as pyaf
+from pyappframework import ui
+from pyappframework.ui import controls as ctl
+
+class TestWindow(ui.Window):
+    def __init__(self, *args, **kw):
+        self.visible = [pyaf.Mutable[bool](True) for _ in range(100)]
+        super().__init__(*args, **kw)
+
+    def body(self) -> ctl.Panel:
+        return (
+            ctl.Panel(wx.BoxSizer(wx.VERTICAL))
+            .body [[
+                ctl.Panel(wx.BoxSizer(wx.VERTICAL))
+                    .sizer(proportion=1, flag=wx.EXPAND)
+                    .export("rows")
+                    .body [[
+                        [ctl.StaticText(label=f"Row {n}").sizer().visible(visible) for n, visible in enumerate(self.visible)],
+                    ]],
+            ]]
+        )
+
+class LayoutTest(unittest.TestCase):
+    def setUp(self):
+        self.app = wx.App()
+        self.frame = None
+
+    def tearDown(self):
+        assert self.frame is not None
+        self.frame.Destroy()
+        self.app.Destroy()
+
+    def runTest(self):
+        self.frame = TestWindow()
+        scheduler = ui.layoutScheduler
+        scheduler.flush()
+        scheduler.reset()
+        rows = self.frame.rows
+
+        # Toggling every row only marks their parent dirty; nothing is laid out until the pass runs.
+        for visible in self.frame.visible:
+            visible.value = False
+        self.assertEqual((scheduler.requests, scheduler.coalesced, scheduler.layouts), (100, 99, 0))
+        self.assertTrue(scheduler.scheduled)
+        scheduler.flush()
+        self.assertEqual((scheduler.passes, scheduler.layouts), (1, 1))
+        self.assertFalse(scheduler.scheduled)
+
+        # Batched changes go through the same pass; a dirty ancestor is laid out before its descendants.
+        scheduler.reset()
+        with pyaf.batch():
+            for visible in self.frame.visible[:10]:
+                visible.value = True
+            ui.requestLayout(rows.GetParent())
+        scheduler.flush()
+        self.assertEqual((scheduler.requests, scheduler.coalesced, scheduler.passes, scheduler.layouts), (11, 9, 1, 2))
+
+        # Destroyed windows are dropped.
+        scheduler.reset()
+        self.frame.visible[0].value = False
+        rows.Destroy()
+        scheduler.flush()
+        self.assertEqual(scheduler.layouts, 0)
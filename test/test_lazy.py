@@ -0,0 +1,58 @@
+# Library Imports
+import unittest
+import wx
+
+# Internal Imports
+import pyappframework as pyaf
+from pyappframework import ui
+from pyappframework.ui import controls as ctl
+
+class TestWindow(ui.Window):
+    def __init__(self, *args, **kw):
+        self.built = 0
+        self.visible = pyaf.Mutable[bool](False)
+        super().__init__(*args, **kw)
+
+    def content(self) -> ctl.Panel:
+        self.built += 1
+        return (
+            ctl.Panel(wx.BoxSizer(wx.VERTICAL))
+                .sizer(proportion=1, flag=wx.EXPAND)
+                .body [[
+                    ctl.StaticText(label="Deferred")
+                        .export("deferredText"),
+                ]]
+        )
+
+    def body(self) -> ctl.Panel:
+        return (
+            ctl.Panel(wx.BoxSizer(wx.VERTICAL))
+            .body [[
+                ctl.Lazy(self.content)
+                    .sizer(proportion=1, flag=wx.EXPAND)
+                    .visible(self.visible)
+                    .export("lazyPanel"),
+            ]]
+        )
+
+class LazyTest(unittest.TestCase):
+    def setUp(self):
+        self.app = wx.App()
+        self.frame = None
+
+    def tearDown(self):
+        assert self.frame is not None
+        self.frame.Destroy()
+        self.app.Destroy()
+
+    def runTest(self):
+        self.frame = TestWindow()
+        self.assertEqual(self.frame.built, 0)
+        self.assertFalse(hasattr(self.frame, "deferredText"))
+        self.frame.visible.value = True
+        self.assertEqual(self.frame.built, 1)
+        self.assertIs(self.frame.deferredText.GetParent().GetParent(), self.frame.lazyPanel)
+        self.assertEqual(self.frame.lazyPanel.GetSizer().GetItemCount(), 1)
+        self.frame.visible.value = False
+        self.frame.visible.value = True
+        self.assertEqual(self.frame.built, 1)
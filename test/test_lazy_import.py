@@ -0,0 +1,29 @@
+# Library Imports
+import unittest
+import subprocess
+import sys
+
+class LazyImportTest(unittest.TestCase):
+    def modulesAfter(self, statement: str) -> set[str]:
+        process = subprocess.run(
+            [sys.executable, "-c", f"import sys; {statement}; print(' '.join(sys.modules))"],
+            capture_output=True, text=True, check=True)
+        return set(process.stdout.split())
+
+    def runTest(self):
+        modules = self.modulesAfter("import pyappframework")
+        self.assertNotIn("pyappframework.ui", modules)
+        self.assertNotIn("pyappframework.tasks", modules)
+
+        modules = self.modulesAfter("from pyappframework import ui; from pyappframework.ui import controls as ctl; ctl.Panel, ctl.StaticText, ui.Window")
+        self.assertIn("pyappframework.ui._controls.statictext", modules)
+        self.assertNotIn("pyappframework.ui._controls.webview", modules)
+        self.assertNotIn("pyappframework.ui._controls.dataviewctrl", modules)
+        self.assertNotIn("pyappframework.ui.artprovider", modules)
+
+        from pyappframework import ui
+        from pyappframework.ui import controls as ctl
+        self.assertIn("WebView", dir(ctl))
+        self.assertIs(ctl.ForEach, ui.controls.ForEach)
+        self.assertTrue(callable(ui.template))
+        self.assertRaises(AttributeError, getattr, ctl, "Missing")
@@ -0,0 +1,99 @@
+# Library Imports
+import unittest
+import contextlib
+from unittest import mock
+import wx
+
+# Internal Imports
+import pyappframework as pyaf
+from pyappframework import ui
+from pyappframework.ui import controls as ctl
+
+class TestWindow(ui.Window):
+    def __init__(self, *args, **kw):
+        self.items = pyaf.MutableList[int](range(5))
+        self.names = pyaf.Mutable[list[str]](["a", "b"])
+        self.virtualListBox = ctl.VirtualListBox(self.items, format=lambda item: f"Item {item}")
+        super().__init__(*args, **kw)
+
+    def body(self) -> ctl.Panel:
+        return (
+            ctl.Panel(wx.BoxSizer(wx.VERTICAL))
+            .body [[
+                ctl.ListBox(items=self.items, format=lambda item: f"Item {item}")
+                    .export("listBox"),
+                ctl.Choice(items=self.names)
+                    .export("choice"),
+                self.virtualListBox,
+            ]]
+        )
+
+@contextlib.contextmanager
+def spy(window: wx.Window, *names: str):
+    # Records the calls made to some methods of a window, which still run.
+    with contextlib.ExitStack() as stack:
+        yield {name: stack.enter_context(mock.patch.object(window, name, wraps=getattr(window, name))) for name in names}
+
+class ListControlsTest(unittest.TestCase):
+    def setUp(self):
+        self.app = wx.App()
+        self.frame = None
+
+    def tearDown(self):
+        assert self.frame is not None
+        self.frame.Destroy()
+        self.app.Destroy()
+
+    def runTest(self):
+        self.frame = TestWindow()
+        items = self.frame.items
+        listBox = self.frame.listBox
+        expected = lambda: [f"Item {item}" for item in items.value]
+        self.assertEqual(listBox.GetStrings(), expected())
+
+        # Changes of a MutableList are applied in place.
+        with spy(listBox, "Set", "Insert", "Delete", "SetString") as calls:
+            items.insert(2, 10)
+            items[0] = 20
+            items.splice(3, 2, [30, 31, 32])
+            items.move(0, 4)
+            del items[-1]
+            with pyaf.batch():
+                items.append(40)
+                items.remove(10)
+        self.assertEqual(listBox.GetStrings(), expected())
+        self.assertFalse(calls["Set"].called)
+        self.assertTrue(calls["Insert"].called and calls["Delete"].called and calls["SetString"].called)
+
+        # Resetting the whole list rebuilds the control at once.
+        with spy(listBox, "Set", "Insert", "Delete", "SetString") as calls:
+            items.sort()
+        self.assertEqual(listBox.GetStrings(), expected())
+        self.assertEqual(calls["Set"].call_count, 1)
+        self.assertFalse(calls["Insert"].called or calls["Delete"].called or calls["SetString"].called)
+
+        # Other Mutables set all the items on assignment.
+        self.frame.names.value = ["c"]
+        self.assertEqual(self.frame.choice.GetStrings(), ["c"])
+
+        # The virtual list box formats rows on demand and keeps the selection on its rows.
+        virtualListBox = self.frame.virtualListBox
+        lc = virtualListBox.getWxInstance()
+        self.assertEqual(lc.GetItemCount(), len(items))
+        self.assertEqual([lc.OnGetItemText(row, 0) for row in range(len(items))], expected())
+        selected = items[3]
+        lc.Select(3)
+        with spy(lc, "RefreshItems") as calls:
+            items.insert(1, 50)
+        self.assertEqual(lc.GetItemCount(), len(items))
+        calls["RefreshItems"].assert_called_once_with(1, len(items) - 1)
+        self.assertEqual([items[row] for row in virtualListBox.selectedRows()], [selected])
+        with spy(lc, "RefreshItems") as calls:
+            items[0] = 60
+        calls["RefreshItems"].assert_called_once_with(0, 0)
+        items.move(4, 0)
+        self.assertEqual(virtualListBox.selectedRows(), [0])
+        self.assertEqual(items[0], selected)
+        items.remove(selected)
+        self.assertEqual(virtualListBox.selectedRows(), [])
+        self.assertEqual([lc.OnGetItemText(row, 0) for row in range(len(items))], expected())
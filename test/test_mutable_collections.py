@@ -0,0 +1,91 @@
+# Library Imports
+import unittest
+import threading
+import wx
+
+# Internal Imports
+import pyappframework as pyaf
+
+class MutableCollectionsTest(unittest.TestCase):
+    def setUp(self):
+        self.app = wx.App()
+        self.events = []
+
+    def tearDown(self):
+        self.app.Destroy()
+
+    def runTest(self):
+        items = pyaf.MutableList[int]([0, 1, 2, 3])
+        items.addListener(self.mutationListener)
+        self.events.clear()
+        items.append(4)
+        items.insert(0, -1)
+        del items[1]
+        items[0] = 10
+        items.move(0, 3)
+        items.splice(1, 2, [7, 8, 9])
+        self.assertEqual(items.value, [1, 7, 8, 9, 10, 4])
+        self.assertEqual([evt.changes[0].kind for evt in self.events], ["insert", "insert", "remove", "replace", "move", "replace"])
+        self.assertEqual(self.events[0].changes, [pyaf.ListChange("insert", 4, [], [4])])
+        for evt in self.events:
+            self.assertIsInstance(evt, pyaf.MutationEvent)
+        self.assertEqual(self.events[-1].oldValue, [1, 2, 3, 10, 4])
+
+        self.events.clear()
+        with pyaf.batch():
+            items.pop()
+            items.extend([5, 6])
+            items.clear()
+        self.assertEqual(len(self.events), 1)
+        self.assertEqual(len(self.events[0].changes), 3)
+        self.assertEqual(self.events[0].oldValue, [1, 7, 8, 9, 10, 4])
+        self.assertEqual(self.events[0].newValue, [])
+
+        total = pyaf.Computed[int](lambda: sum(items))
+        items.extend([1, 2])
+        self.assertEqual(total.value, 3)
+        self.assertTrue(pyaf.mutable.ismutable(items))
+        self.assertIs(pyaf.valueof(items), items.value)
+
+        # Indices are normalized like list.insert before the change is recorded.
+        items = pyaf.MutableList[int]([1, 2, 3])
+        items.addListener(self.mutationListener)
+        self.events.clear()
+        self.assertEqual(items.splice(-1, 1), [3])
+        items.splice(10, 0, [9])
+        self.assertEqual(items.value, [1, 2, 9])
+        self.assertEqual(self.events[0].changes, [pyaf.ListChange("remove", 2, [3], [])])
+        self.assertEqual(self.events[1].changes, [pyaf.ListChange("insert", 2, [], [9])])
+        self.assertEqual(self.events[1].oldValue, [1, 2])
+        items.move(-1, 0)
+        self.assertEqual(items.value, [9, 1, 2])
+        for index, target in ((3, 0), (0, 3), (-4, 0)):
+            with self.assertRaises(IndexError):
+                items.move(index, target)
+        self.assertEqual(items.value, [9, 1, 2])
+
+        table = pyaf.MutableDict[str, int](a=1)
+        table.addListener(self.mutationListener)
+        self.events.clear()
+        table["b"] = 2
+        table["a"] = 3
+        del table["b"]
+        self.assertEqual([evt.changes[0].kind for evt in self.events], ["insert", "replace", "remove"])
+        self.assertEqual(self.events[-1].oldValue, {"a": 3, "b": 2})
+        self.assertEqual(dict(table), {"a": 3})
+
+        # Changes made off the main thread raise instead of notifying from the worker.
+        errors = []
+        def change():
+            for mutate in (lambda: items.append(4), lambda: setattr(items, "value", [])):
+                try:
+                    mutate()
+                except RuntimeError as e:
+                    errors.append(e)
+        worker = threading.Thread(target=change)
+        worker.start()
+        worker.join()
+        self.assertEqual(len(errors), 2)
+
+    def mutationListener(self, evt: pyaf.MutationEvent):
+        self.events.append(evt)
@@ -0,0 +1,79 @@
+# Library Imports
+import unittest
+import wx
+
+# Internal Imports
+import pyappframework as pyaf
+from pyappframework import ui
+from pyappframework.ui import controls as ctl
+
+class TestWindow(ui.Window):
+    reactive = True
+
+    def __init__(self, *args, **kw):
+        self.name = pyaf.Mutable[str]("World")
+        self.showDetails = pyaf.Mutable[bool](False)
+        self.enabled = pyaf.Mutable[bool](True)
+        self.clicks = []
+        super().__init__(*args, **kw)
+
+    def onClick(self, evt: wx.CommandEvent, name: str):
+        self.clicks.append(name)
+
+    def body(self) -> ctl.Panel:
+        return (
+            ctl.Panel(wx.BoxSizer(wx.VERTICAL))
+            .body [[
+                ctl.StaticText(label=f"Hello, {self.name.value}")
+                    .sizer(flag=wx.ALL, border=4)
+                    .export("greeting"),
+                [
+                    ctl.StaticText(label="Details")
+                        .sizer(flag=wx.EXPAND)
+                        .export("details"),
+                ] if self.showDetails.value else [],
+                ctl.Button(label="Click")
+                    .sizer()
+                    .visible(self.enabled.value)
+                    .eventHandler(wx.EVT_BUTTON, lambda evt, name=self.name.value: self.onClick(evt, name))
+                    .export("button"),
+            ]]
+        )
+
+class ReactiveViewTest(unittest.TestCase):
+    def setUp(self):
+        self.app = wx.App()
+        self.frame = None
+
+    def tearDown(self):
+        assert self.frame is not None
+        self.frame.Destroy()
+        self.app.Destroy()
+
+    def windows(self):
+        return [item.GetWindow() for item in self.frame.greeting.GetParent().GetSizer().GetChildren()]
+
+    def runTest(self):
+        self.frame = TestWindow()
+        greeting = self.frame.greeting
+        button = self.frame.button
+        self.assertEqual(greeting.GetLabel(), "Hello, World")
+
+        self.frame.name.value = "wx"
+        self.assertIs(self.frame.greeting, greeting)
+        self.assertEqual(greeting.GetLabel(), "Hello, wx")
+        evt = wx.CommandEvent(wx.wxEVT_BUTTON, button.GetId())
+        evt.SetEventObject(button)
+        button.ProcessWindowEvent(evt)
+        self.assertEqual(self.frame.clicks, ["wx"])
+
+        self.frame.showDetails.value = True
+        self.assertEqual(self.windows(), [greeting, self.frame.details, button])
+        self.assertEqual(self.frame.greeting.GetParent().GetSizer().GetItem(self.frame.details).GetFlag(), wx.EXPAND)
+
+        self.frame.showDetails.value = False
+        self.assertEqual(self.windows(), [greeting, button])
+
+        self.frame.enabled.value = False
+        self.assertIs(self.frame.button, button)
+        self.assertFalse(button.IsShown())
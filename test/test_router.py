@@ -0,0 +1,75 @@
+# Library Imports
+import unittest
+import wx
+
+# Internal Imports
+from pyappframework import ui
+from pyappframework.ui import controls as ctl
+
+class TestWindow(ui.Window):
+    eventRouting = True
+
+    def __init__(self, *args, **kw):
+        self.clicks = []
+        super().__init__(*args, **kw)
+
+    def onClick(self, n: int):
+        def handler(evt: wx.CommandEvent):
+            self.clicks.append(n)
+        return handler
+
+    def body(self) -> ctl.Panel:
+        return (
+            ctl.Panel(wx.BoxSizer(wx.VERTICAL))
+            .body [[
+                [
+                    ctl.Button(label=f"Button {n}")
+                        .sizer()
+                        .export(f"button{n}")
+                        .eventHandler(wx.EVT_BUTTON, self.onClick(n))
+                    for n in range(3)
+                ],
+            ]]
+        )
+
+class RouterTest(unittest.TestCase):
+    def setUp(self):
+        self.app = wx.App()
+        self.frame = None
+
+    def tearDown(self):
+        assert self.frame is not None
+        self.frame.Destroy()
+        self.app.Destroy()
+
+    def click(self, button: wx.Button):
+        evt = wx.CommandEvent(wx.wxEVT_BUTTON, button.GetId())
+        evt.SetEventObject(button)
+        button.ProcessWindowEvent(evt)
+
+    def runTest(self):
+        self.frame = TestWindow()
+        router = ui.EventRouter.of(self.frame)
+        self.assertEqual(list(router.routes), [wx.EVT_BUTTON])
+        self.assertEqual(len(router.routes[wx.EVT_BUTTON]), 3)
+
+        self.click(self.frame.button1)
+        self.click(self.frame.button2)
+        self.assertEqual(self.frame.clicks, [1, 2])
+        self.assertEqual(router.dispatched, 2)
+
+        # The handler bound last runs first and only passes the event on when it skips it.
+        def skipping(evt: wx.CommandEvent):
+            self.frame.clicks.append("skipped")
+            evt.Skip()
+        ui.router.bind(self.frame, wx.EVT_BUTTON, skipping, self.frame.button0)
+        self.click(self.frame.button0)
+        self.assertEqual(self.frame.clicks, [1, 2, "skipped", 0])
+        self.assertTrue(ui.router.unbind(self.frame, wx.EVT_BUTTON, skipping, self.frame.button0))
+        self.assertFalse(ui.router.unbind(self.frame, wx.EVT_BUTTON, skipping, self.frame.button0))
+
+        # Destroyed controls are removed from the table.
+        buttonId = self.frame.button1.GetId()
+        self.frame.button1.Destroy()
+        self.assertNotIn(buttonId, router.routes[wx.EVT_BUTTON])
+        self.assertEqual(len(router.routes[wx.EVT_BUTTON]), 2)
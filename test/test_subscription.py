@@ -0,0 +1,60 @@
+# Library Imports
+import unittest
+import gc
+import tracemalloc
+import wx
+
+# Internal Imports
+import pyappframework as pyaf
+
+class Listener:
+    def __init__(self):
+        self.values = []
+
+    def onValue(self, value: int):
+        self.values.append(value)
+
+class SubscriptionTest(unittest.TestCase):
+    def setUp(self):
+        self.app = wx.App()
+        self.frame = wx.Frame(None)
+        self.mutable = pyaf.Mutable[int](0)
+
+    def tearDown(self):
+        self.frame.Destroy()
+        self.app.Destroy()
+
+    def runTest(self):
+        values = []
+        subscription = self.mutable.syncTo(values.append)
+        self.mutable.value = 1
+        subscription.dispose()
+        self.mutable.value = 2
+        self.assertEqual(values, [0, 1])
+        self.assertFalse(subscription.active)
+
+        listener = Listener()
+        self.mutable.syncTo(listener.onValue, weak=True)
+        self.assertEqual(self.mutable.listenerCount, 1)
+        del listener
+        gc.collect()
+        self.assertEqual(self.mutable.listenerCount, 0)
+
+        self.cycle(1000)
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        self.cycle(10000)
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        self.assertEqual(self.mutable.listenerCount, 0)
+        self.assertLess(after - before, 64 * 1024)
+
+    def cycle(self, count: int):
+        for _ in range(count):
+            st = wx.StaticText(self.frame)
+            self.mutable.syncTo(st.SetLabel)
+            self.mutable.addListener(lambda evt: evt.Skip(), owner=st)
+            self.mutable.value += 1
+            st.Destroy()
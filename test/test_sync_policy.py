@@ -0,0 +1,41 @@
+# Library Imports
+import unittest
+import wx
+
+# Internal Imports
+import pyappframework as pyaf
+
+class SyncPolicyTest(unittest.TestCase):
+    def setUp(self):
+        self.app = wx.App()
+        self.text = ""
+        self.values = []
+
+    def tearDown(self):
+        self.app.Destroy()
+
+    def runTest(self):
+        debounced = pyaf.Mutable[str]("")
+        debounced.syncTo(self.values.append)
+        listener = debounced.syncFrom(self.getText, pyaf.Debounce(10000))
+        for self.text in ("a", "ab", "abc"):
+            listener()
+        self.assertEqual(debounced.value, "")
+        listener.flush()
+        self.assertEqual(debounced.value, "abc")
+        self.assertEqual(self.values, ["", "abc"])
+
+        self.values.clear()
+        self.text = ""
+        throttled = pyaf.Mutable[str]("")
+        throttled.syncTo(self.values.append)
+        listener = throttled.syncFrom(self.getText, pyaf.Throttle(10000))
+        for self.text in ("x", "xy", "xyz"):
+            listener()
+        self.assertEqual(throttled.value, "x")
+        listener.flush()
+        self.assertEqual(self.values, ["", "x", "xyz"])
+        listener.cancel()
+
+    def getText(self) -> str:
+        return self.text
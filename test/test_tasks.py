@@ -0,0 +1,124 @@
+# Library Imports
+import unittest
+import threading
+import time
+import wx
+
+# Internal Imports
+import pyappframework as pyaf
+from pyappframework.tasks import TaskExecutor, TaskCancelled
+
+def work(n, progress=None):
+    for i in range(n):
+        if progress is not None:
+            progress(i + 1)
+    return n * 2
+
+def fail():
+    raise ValueError("failed")
+
+def spin(progress):
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        progress(0)
+        time.sleep(0.01)
+    return 1
+
+class TaskExecutorTest(unittest.TestCase):
+    def setUp(self):
+        self.app = wx.App()
+        self.executor = TaskExecutor(maxWorkers=2)
+
+    def tearDown(self):
+        self.executor.shutdown()
+        self.app.Destroy()
+
+    def wait(self, *tasks):
+        for task in tasks:
+            task.future.exception()
+        wx.CallAfter(self.app.ExitMainLoop)
+        self.app.MainLoop()
+
+    def testResultAndProgress(self):
+        result = pyaf.Mutable[int](0)
+        progress = pyaf.Mutable[int](0)
+        self.wait(self.executor.submit(work, 10, result=result, progress=progress))
+        self.assertEqual(result.value, 20)
+        self.assertEqual(progress.value, 10)
+
+    def testSuperseded(self):
+        result = pyaf.Mutable[int](0)
+        gate = threading.Event()
+        first = self.executor.submit(lambda: gate.wait() and 1, result=result)
+        second = self.executor.submit(lambda: 2, result=result)
+        gate.set()
+        self.wait(first, second)
+        self.assertTrue(first.cancelled)
+        self.assertEqual(result.value, 2)
+
+    def testCooperativeCancel(self):
+        result = pyaf.Mutable[int](0)
+        progress = pyaf.Mutable[int](0)
+        started = threading.Event()
+        gate = threading.Event()
+        def job(progress):
+            started.set()
+            gate.wait()
+            progress(1)
+            return 1
+        task = self.executor.submit(job, result=result, progress=progress)
+        started.wait()
+        task.cancel()
+        gate.set()
+        self.assertIsInstance(task.future.exception(), TaskCancelled)
+        self.wait(task)
+        self.assertEqual(result.value, 0)
+        self.assertEqual(progress.value, 0)
+
+    def testOwnerDestroyed(self):
+        frame = wx.Frame(None)
+        result = pyaf.Mutable[int](0)
+        gate = threading.Event()
+        task = self.executor.submit(lambda: gate.wait() and 1, result=result, owner=frame)
+        frame.Destroy()
+        gate.set()
+        self.wait(task)
+        self.assertTrue(task.cancelled)
+        self.assertEqual(result.value, 0)
+
+    def testError(self):
+        error = pyaf.Mutable[object](None)
+        self.wait(self.executor.submit(fail, error=error))
+        self.assertIsInstance(error.value, ValueError)
+
+    def testUnhandledError(self):
+        with self.assertLogs("pyappframework.tasks", "ERROR") as logs:
+            task = self.executor.submit(fail)
+            self.wait(task)
+        self.assertIn(f"Task {task.id}", logs.output[0])
+        self.assertIn("ValueError: failed", logs.output[0])
+
+class ProcessTaskExecutorTest(unittest.TestCase):
+    def setUp(self):
+        self.app = wx.App()
+        self.executor = TaskExecutor("process", maxWorkers=2)
+
+    def tearDown(self):
+        self.executor.shutdown()
+        self.app.Destroy()
+
+    def runTest(self):
+        result = pyaf.Mutable[int](0)
+        task = self.executor.submit(work, 100, result=result)
+        task.future.result()
+        wx.CallAfter(self.app.ExitMainLoop)
+        self.app.MainLoop()
+        self.assertEqual(result.value, 200)
+
+        # A cancelled task stops at its next progress call.
+        progress = pyaf.Mutable[int](0)
+        task = self.executor.submit(spin, result=result, progress=progress)
+        while not task.future.running():
+            time.sleep(0.01)
+        task.cancel()
+        self.assertIsInstance(task.future.exception(timeout=5), TaskCancelled)
@@ -0,0 +1,93 @@
+# Library Imports
+import unittest
+import wx
+
+# Internal Imports
+import pyappframework as pyaf
+from pyappframework import ui
+from pyappframework.ui import controls as ctl
+
+@ui.template
+def card(title: pyaf.Mutable[str], progress: pyaf.Mutable[int], onClick, border: int = 4) -> ctl.Panel:
+    return (
+        ctl.Panel(wx.BoxSizer(wx.VERTICAL))
+            .sizer(flag=wx.EXPAND)
+            .body [[
+                ctl.StaticText(label=title)
+                    .sizer(flag=wx.ALL, border=border),
+                ctl.Gauge(range=100, value=progress)
+                    .sizer(flag=wx.EXPAND),
+                ctl.Button(label="Open")
+                    .sizer()
+                    .eventHandler(wx.EVT_BUTTON, lambda evt: onClick(title.value)),
+            ]]
+    )
+
+class TestWindow(ui.Window):
+    def __init__(self, *args, **kw):
+        self.titles = [pyaf.Mutable[str](f"Card {n}") for n in range(4)]
+        self.progress = [pyaf.Mutable[int](n * 10) for n in range(4)]
+        self.clicks = []
+        super().__init__(*args, **kw)
+
+    @ui.template
+    def row(self, title: pyaf.Mutable[str]) -> ctl.StaticText:
+        return ctl.StaticText(label=title).sizer().eventHandler(wx.EVT_LEFT_DOWN, self.onRowClick)
+
+    def onRowClick(self, evt: wx.MouseEvent):
+        pass
+
+    def body(self) -> ctl.Panel:
+        return (
+            ctl.Panel(wx.BoxSizer(wx.VERTICAL))
+            .body [[
+                [card(title, progress, self.clicks.append) for title, progress in zip(self.titles, self.progress)],
+                card(self.titles[0], self.progress[0], self.clicks.append, border=8),
+                [self.row(title) for title in self.titles],
+            ]]
+        )
+
+class TemplateTest(unittest.TestCase):
+    def setUp(self):
+        self.app = wx.App()
+
+    def tearDown(self):
+        self.app.Destroy()
+
+    def runTest(self):
+        card.recorded = card.replayed = card.built = 0
+        self.frame = TestWindow()
+        self.assertEqual((card.recorded, card.replayed, card.built), (2, 3, 0))
+        self.assertEqual((TestWindow.row.recorded, TestWindow.row.replayed), (1, 3))
+
+        cards = [item.GetWindow() for item in self.frame.getWxInstance().GetSizer().GetChildren()][:5]
+        self.assertEqual(len({id(window.GetSizer()) for window in cards}), 5)
+        labels = [window.GetSizer().GetChildren()[0].GetWindow() for window in cards]
+        self.assertEqual([label.GetLabel() for label in labels], ["Card 0", "Card 1", "Card 2", "Card 3", "Card 0"])
+        self.assertEqual(cards[0].GetSizer().GetChildren()[0].GetBorder(), 4)
+        self.assertEqual(cards[4].GetSizer().GetChildren()[0].GetBorder(), 8)
+
+        # Each replayed card is bound to the Mutables it was called with.
+        self.frame.titles[2].value = "Renamed"
+        self.assertEqual([label.GetLabel() for label in labels], ["Card 0", "Card 1", "Renamed", "Card 3", "Card 0"])
+        button = cards[2].GetSizer().GetChildren()[2].GetWindow()
+        evt = wx.CommandEvent(wx.wxEVT_BUTTON, button.GetId())
+        evt.SetEventObject(button)
+        button.ProcessWindowEvent(evt)
+        self.assertEqual(self.frame.clicks, ["Renamed"])
+
+        # Constants that compare equal but differ in type get plans of their own.
+        card.recorded = card.replayed = 0
+        for border in (1, True, 1.0, 1):
+            card(self.frame.titles[0], self.frame.progress[0], self.frame.clicks.append, border=border)
+        self.assertEqual((card.recorded, card.replayed), (3, 1))
+
+        # Templates that read a Mutable's value are not replayed.
+        @ui.template
+        def reading(title: pyaf.Mutable[str]) -> ctl.StaticText:
+            return ctl.StaticText(label=title.value)
+        first = reading(self.frame.titles[0])
+        second = reading(self.frame.titles[1])
+        self.assertEqual((reading.recorded, reading.replayed, reading.built), (1, 0, 1))
+        self.assertEqual((first.label, second.label), ("Card 0", "Card 1"))
+        self.frame.Destroy()
@@ -0,0 +1,33 @@
+# Library Imports
+import unittest
+import threading
+import wx
+
+# Internal Imports
+import pyappframework as pyaf
+
+class ThreadedMutableTest(unittest.TestCase):
+    def setUp(self):
+        self.app = wx.App()
+        self.mutable = pyaf.Mutable[int](0)
+        self.values = []
+
+    def tearDown(self):
+        self.app.Destroy()
+
+    def runTest(self):
+        self.mutable.syncTo(self.values.append)
+        worker = threading.Thread(target=self.produce)
+        worker.start()
+        worker.join()
+        self.assertEqual(self.mutable.value, 0)
+        self.assertTrue(self.mutable.hasPendingValue)
+        wx.CallAfter(self.app.ExitMainLoop)
+        self.app.MainLoop()
+        self.assertEqual(self.values, [0, 1000])
+        self.assertEqual(self.mutable.droppedCount, 999)
+        self.assertFalse(self.mutable.hasPendingValue)
+
+    def produce(self):
+        for n in range(1, 1001):
+            self.mutable.value = n
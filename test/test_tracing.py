@@ -0,0 +1,65 @@
+# Library Imports
+import unittest
+import io
+import json
+import wx
+
+# Internal Imports
+import pyappframework as pyaf
+from pyappframework import mutable
+
+class TracingTest(unittest.TestCase):
+    def setUp(self):
+        self.app = wx.App()
+
+    def tearDown(self):
+        mutable.stopTracing()
+        self.app.Destroy()
+
+    def testDisabled(self):
+        source = pyaf.Mutable[int](0)
+        source.value = 1
+        self.assertIsNone(mutable.getTracer())
+
+    def testStats(self):
+        source = pyaf.Mutable[int](0, compare=pyaf.equal)
+        source.syncTo(lambda value: None)
+        source.syncTo(lambda value: None)
+        with mutable.tracing() as tracer:
+            tracer.setLabel(source, "source")
+            source.value = 1
+            source.value = 1
+            source.value = 2
+        source.value = 3
+        stats = tracer.stats(source)
+        self.assertEqual(stats.label, "source")
+        self.assertEqual(stats.assignments, 3)
+        self.assertEqual(stats.suppressed, 1)
+        self.assertEqual(stats.notifications, 2)
+        self.assertEqual(stats.listenerCount, 2)
+        self.assertGreaterEqual(stats.listenerTime, stats.maxListenerTime)
+
+    def testCascade(self):
+        source = pyaf.Mutable[int](0)
+        middle = pyaf.Mutable[int](0)
+        sink = pyaf.Mutable[int](0)
+        items = pyaf.MutableList[int]()
+        source.syncTo((middle, "value"))
+        middle.syncTo((sink, "value"))
+        middle.syncTo(lambda value: items.append(value))
+        sink.syncTo(lambda value: None)
+        items.addListener(lambda evt: None)
+        tracer = mutable.startTracing()
+        source.value = 1
+        middle.value = 5
+        self.assertEqual(len(tracer.cascades), 2)
+        cascade = tracer.cascades[0]
+        self.assertEqual(cascade.label, tracer.stats(source).label)
+        self.assertEqual(cascade.size, 4)
+        self.assertEqual(cascade.depth, 3)
+        self.assertEqual(tracer.stats(items).assignments, 2)
+        exported = io.StringIO()
+        tracer.export(exported)
+        data = json.loads(exported.getvalue())
+        self.assertEqual(len(data["mutables"]), 4)
+        self.assertEqual(len(data["cascades"]), 2)
@@ -0,0 +1,69 @@
+# Library Imports
+import unittest
+import wx
+
+# Internal Imports
+import pyappframework as pyaf
+from pyappframework import ui
+from pyappframework.ui import controls as ctl
+
+class TestWindow(ui.Window):
+    def __init__(self, *args, **kw):
+        self.count = pyaf.Mutable[int](20000)
+        self.built = 0
+        self.heights: dict[int, int] = {}
+        self.virtualList = ctl.VirtualList(self.count, self.row, rowHeight=lambda index: self.heights.get(index, 20 + index % 3 * 10))
+        super().__init__(*args, **kw)
+
+    def row(self, index: pyaf.Mutable[int]) -> ctl.StaticText:
+        self.built += 1
+        return ctl.StaticText(label=pyaf.Computed(lambda: f"Row {index.value}"))
+
+    def body(self) -> ctl.Panel:
+        return (
+            ctl.Panel(wx.BoxSizer(wx.VERTICAL))
+            .body [[
+                self.virtualList
+                    .sizer(proportion=1, flag=wx.EXPAND),
+            ]]
+        )
+
+class VirtualListTest(unittest.TestCase):
+    def setUp(self):
+        self.app = wx.App()
+        self.frame = None
+
+    def tearDown(self):
+        assert self.frame is not None
+        self.frame.Destroy()
+        self.app.Destroy()
+
+    def shownLabels(self):
+        return [child.GetLabel() for child in self.frame.virtualList.getWxInstance().GetChildren() if child.IsShown()]
+
+    def runTest(self):
+        self.frame = TestWindow(size=(300, 300))
+        self.frame.Layout()
+        virtualList = self.frame.virtualList
+        self.assertEqual(virtualList.rowOffset(3), 20 + 30 + 40)
+        self.assertEqual(virtualList.rowAt(virtualList.rowOffset(10000)), 10000)
+        self.assertEqual(virtualList.rowAt(virtualList.rowOffset(10000) + 5), 10000)
+        virtualList.scrollTo(10000)
+        built = self.frame.built
+        self.assertLess(built, 100)
+        self.assertIn("Row 10000", self.shownLabels())
+        virtualList.scrollTo(16000)
+        virtualList.scrollTo(4000)
+        self.assertEqual(self.frame.built, built)
+        self.assertEqual(virtualList.rowCount, built)
+        self.assertIn("Row 4000", self.shownLabels())
+        self.assertNotIn("Row 10000", self.shownLabels())
+        self.frame.count.value = 3
+        self.assertEqual(len(self.shownLabels()), 3)
+
+        # Row heights must be positive, or rowAt and the scroll range would be wrong.
+        with self.assertRaisesRegex(ValueError, "rowHeight"):
+            ctl.VirtualList(3, self.frame.row, rowHeight=0)
+        self.frame.heights[1] = 0
+        with self.assertRaisesRegex(ValueError, "row 1"):
+            virtualList.invalidateHeights()